@@ -12,9 +12,90 @@ class Config:
         "user": os.getenv("DB_USER", "kanboard"),
         "password": os.getenv("DB_PASSWORD", "kanboard123")
     }
+    # Tests borrow connections from a per-worker pool instead of connecting each time
+    DB_POOL = os.getenv("DB_POOL", "True").strip().lower() == "true"
+    DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", "1"))
+    DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "4"))
+    # Database the snapshot facility connects to while it drops and recreates the Kanboard database
+    DB_MAINTENANCE_DB = os.getenv("DB_MAINTENANCE_DB", "postgres")
+    # Per-query latency is recorded; slower read-only queries get an EXPLAIN (ANALYZE, BUFFERS) attached
+    SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "100"))
+    EXPLAIN_SLOW_QUERIES = os.getenv("EXPLAIN_SLOW_QUERIES", "True").strip().lower() == "true"
+    # Kanboard's SQL per UI action from pg_stat_statements (see utilities/sql_profiler.py)
+    SQL_PROFILER = os.getenv("SQL_PROFILER", "False").strip().lower() == "true"
 
     HEADLESS = os.getenv("HEADFUL", "False").strip().lower() != "true"
+    # Delay in ms before every Playwright operation; page objects wait on real responses, so it is
+    # only useful to follow a HEADFUL run by eye
+    SLOW_MO = int(os.getenv("SLOW_MO", "0" if HEADLESS else "1000"))
+    # Launch a dedicated browser per test instead of using the session browser pool
+    STRICT_ISOLATION = os.getenv("STRICT_ISOLATION", "False").strip().lower() == "true"
+    BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "1"))
+    BROWSER_MAX_TESTS = int(os.getenv("BROWSER_MAX_TESTS", "25"))
+    # never | on-failure | ring-buffer | always (see utilities/screenshots.py)
+    SCREENSHOT_MODE = os.getenv("SCREENSHOT_MODE", "on-failure").strip().lower()
+    SCREENSHOT_BUFFER_SIZE = int(os.getenv("SCREENSHOT_BUFFER_SIZE", "10"))
     ADMIN_USER = os.getenv("ADMIN_USER", "admin")
     ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "admin")
+    # JSON-RPC API used for test data setup. Kanboard accepts the user's own credentials
+    API_URL = os.getenv("API_URL", f"{APP_URL.rstrip('/')}/jsonrpc.php")
+    API_USER = os.getenv("API_USER", ADMIN_USER)
+    API_PASSWORD = os.getenv("API_PASSWORD", ADMIN_PASSWORD)
+    # Statistical benchmarks (see utilities/benchmark.py)
+    BENCHMARK_WARMUP = int(os.getenv("BENCHMARK_WARMUP", "3"))
+    BENCHMARK_REPETITIONS = int(os.getenv("BENCHMARK_REPETITIONS", "20"))
+    BENCHMARK_TOLERANCE = float(os.getenv("BENCHMARK_TOLERANCE", "0.25"))
+    BENCHMARK_BASELINE_FILE = os.getenv("BENCHMARK_BASELINE_FILE", "benchmarks/baselines.json")
+    BENCHMARK_ENVIRONMENT = os.getenv("BENCHMARK_ENVIRONMENT", "")
+    BENCHMARK_UPDATE_BASELINE = os.getenv("BENCHMARK_UPDATE_BASELINE", "False").strip().lower() == "true"
+    REPORTS_DIR = os.getenv("REPORTS_DIR", "reports")
+    # Multi-user load generation (see utilities/load.py); the load test only runs with LOAD_TEST=true
+    LOAD_TEST = os.getenv("LOAD_TEST", "False").strip().lower() == "true"
+    LOAD_USERS = int(os.getenv("LOAD_USERS", "20"))
+    LOAD_RAMP_UP = float(os.getenv("LOAD_RAMP_UP", "10"))
+    LOAD_DURATION = float(os.getenv("LOAD_DURATION", "60"))
+    LOAD_THINK_TIME = float(os.getenv("LOAD_THINK_TIME", "0.5"))
+    LOAD_VIRTUAL_USER = os.getenv("LOAD_VIRTUAL_USER", "api").strip().lower()  # "api" or "browser"
+    # Scale-curve suite (see utilities/scale.py); only runs with SCALE_TEST=true
+    SCALE_TEST = os.getenv("SCALE_TEST", "False").strip().lower() == "true"
+    # Multi-session collaboration test in tests/test_collaboration.py; only runs with COLLABORATION_TEST=true
+    COLLABORATION_TEST = os.getenv("COLLABORATION_TEST", "False").strip().lower() == "true"
+    # Snapshot integration tests in tests/test_db_snapshots.py; they replace the Kanboard database
+    DB_SNAPSHOT_TEST = os.getenv("DB_SNAPSHOT_TEST", "False").strip().lower() == "true"
+    # Log in once and reuse the saved storage state across tests and workers
+    LOGIN_CACHE = os.getenv("LOGIN_CACHE", "True").strip().lower() == "true"
+    LOGIN_STATE_DIR = os.getenv("LOGIN_STATE_DIR", ".auth")
+    LOGIN_STATE_MAX_AGE = int(os.getenv("LOGIN_STATE_MAX_AGE", "3600"))
+    # Navigation/paint/CDP metrics after every BasePage navigation (see utilities/browser_metrics.py)
+    BROWSER_METRICS = os.getenv("BROWSER_METRICS", "True").strip().lower() == "true"
+    # page.route network layer (see utilities/network.py); blocking and the asset cache change what the
+    # browser loads, so they are off by default and always off while BROWSER_METRICS is on
+    NETWORK_ROUTING = os.getenv("NETWORK_ROUTING", "True").strip().lower() == "true"
+    BLOCK_RESOURCE_TYPES = tuple(filter(None, os.getenv("BLOCK_RESOURCE_TYPES", "").split(",")))
+    BLOCK_URL_PATTERNS = tuple(filter(None, os.getenv("BLOCK_URL_PATTERNS", "").split(",")))
+    STATIC_ASSET_PATTERN = os.getenv("STATIC_ASSET_PATTERN", r"/assets/.+\.(css|js|woff2?|ttf|svg|png|gif|ico)(\?|$)")
+    STATIC_CACHE_DIR = os.getenv("STATIC_CACHE_DIR", ".cache/static")
+    # Test data names (see utilities/data_factory.py); both default to values derived from the xdist run
+    RUN_ID = os.getenv("RUN_ID", "")
+    DATA_SEED = int(os.environ["DATA_SEED"]) if os.getenv("DATA_SEED") else None
+    # Batched deletion of the test data registered with the `cleanup` fixture (see utilities/cleanup.py)
+    CLEANUP_METHOD = os.getenv("CLEANUP_METHOD", "api").strip().lower()
+    CLEANUP_SCOPE = os.getenv("CLEANUP_SCOPE", "test").strip().lower()
+    CLEANUP_BACKGROUND = os.getenv("CLEANUP_BACKGROUND", "True").strip().lower() == "true"
+    CLEANUP_SWEEP_ORPHANS = os.getenv("CLEANUP_SWEEP_ORPHANS", "True").strip().lower() == "true"
+    CLEANUP_ORPHAN_MIN_AGE = int(os.getenv("CLEANUP_ORPHAN_MIN_AGE", "3600"))
+    # Content-addressed screenshot store linked from Allure (see utilities/artifacts.py)
+    ARTIFACT_STORE = os.getenv("ARTIFACT_STORE", "True").strip().lower() == "true"
+    ARTIFACT_DIR = os.getenv("ARTIFACT_DIR", f"{REPORTS_DIR}/artifacts")
+    ARTIFACT_FORMAT = os.getenv("ARTIFACT_FORMAT", "png").strip().lower()
+    ARTIFACT_QUALITY = int(os.getenv("ARTIFACT_QUALITY", "75"))
+    ARTIFACT_MAX_WIDTH = int(os.getenv("ARTIFACT_MAX_WIDTH", "1280"))
+    ARTIFACT_TEST_BUDGET_MB = int(os.getenv("ARTIFACT_TEST_BUDGET_MB", "20"))
+    ARTIFACT_RUN_BUDGET_MB = int(os.getenv("ARTIFACT_RUN_BUDGET_MB", "500"))
+    ARTIFACT_BASE_URL = os.getenv("ARTIFACT_BASE_URL", "")
+    # Level of the JSONL log in logs/test_execution.jsonl (see utilities/structured_logging.py)
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").strip().upper()
+    # Per-test durations used for longest-first xdist scheduling and sharding (see utilities/scheduling.py)
+    DURATION_HISTORY_FILE = os.getenv("DURATION_HISTORY_FILE", ".cache/test_durations.json")
 
 DB_CONFIG = Config.DB_CONFIG
\ No newline at end of file
@@ -1,12 +1,78 @@
 import os
-
 import pytest
 import logging
 from pathlib import Path
 from playwright.sync_api import sync_playwright
 
 from config.config import Config
-from utilities.database import Database
+from pages.board_model import invalidate_board_model
+from utilities.api_client import KanboardApiClient
+from utilities.browser_pool import BrowserPool
+from utilities.cleanup import CleanupRegistry
+from utilities.database import BASE_SNAPSHOT, Database, DatabasePool, DatabaseSeeder, DatabaseSnapshots, DbAssertions
+from utilities.data_factory import get_factory
+from utilities.login_cache import LoginCache
+from utilities import artifacts, browser_metrics, database, network, screenshots, sql_profiler, structured_logging, waits
+
+LOG_DIR = Path(__file__).parent.resolve() / "logs"
+
+pytest_plugins = ["pytester", "utilities.fixture_profiler", "utilities.scale", "utilities.scheduling"]
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "strict_isolation: run the test in its own freshly launched browser instead of the pool"
+    )
+    config.addinivalue_line(
+        "markers", "screenshots(mode, buffer_size=N): screenshot mode for this test "
+                   "(never, on-failure, ring-buffer, always)"
+    )
+    config.addinivalue_line(
+        "markers", "db_snapshot(name): start the test from the named database snapshot (default 'base')"
+    )
+    # Logging is configured once per process: the controller and every xdist worker
+    worker_id = config.workerinput["workerid"] if hasattr(config, "workerinput") else "main"
+    if worker_id == "main":
+        structured_logging.remove_worker_logs(LOG_DIR)
+    # Imported here, after pytest_plugins has loaded (and assertion-rewritten) the profiler
+    from utilities.fixture_profiler import timed
+    with timed("logging configuration"):
+        structured_logging.configure(LOG_DIR, worker_id, Config.LOG_LEVEL)
+
+def pytest_runtest_logstart(nodeid):
+    structured_logging.set_test(nodeid)
+
+def pytest_runtest_logfinish(nodeid):
+    structured_logging.set_test(None)
+
+# tryfirst: a worker must flush its log before xdist reports it finished to the controller
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session):
+    # Let the background writer store the last screenshots before Allure reads the links
+    artifacts.close_store()
+    structured_logging.shutdown()
+    if hasattr(session.config, "workerinput"):
+        session.config.workeroutput["notify_triggers"] = database.notify_triggers_installed()
+        return
+    structured_logging.merge_worker_logs(LOG_DIR)
+    # Every worker is done waiting on the database by now
+    if database.notify_triggers_installed():
+        try:
+            database.remove_notify_triggers()
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Could not remove the change notification triggers: {e}")
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    if getattr(node, "workeroutput", {}).get("notify_triggers"):
+        database.mark_notify_triggers_installed()
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # Expose each phase's report as item.rep_setup / rep_call / rep_teardown for fixtures
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
 
 @pytest.fixture(scope="session")
 def playwright():
@@ -14,52 +80,151 @@ def playwright():
         yield p
 
 @pytest.fixture(autouse=True)
-def setup_logging():
-    # Get the absolute path to the directory containing this conftest.py file.
-    project_root = Path(__file__).parent.resolve()
-
-    # Define the logs directory as a subdirectory of the project root
-    log_dir = project_root / "logs"
-
-    # Define the full path to the log file
-    log_file_path = log_dir / "test_execution.log"
-
-    # Create the logs directory if it doesn't exist
-    os.makedirs(log_dir, exist_ok=True)
-
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file_path), # Use the absolute path here
-            logging.StreamHandler()
-        ],
-        force=True
+def screenshot_recorder(request):
+    marker = request.node.get_closest_marker("screenshots")
+    recorder = screenshots.start_test(*marker.args, **marker.kwargs) if marker else screenshots.start_test()
+    if recorder.store:
+        recorder.store.start_test(request.node.nodeid)
+    yield recorder
+    reports = (getattr(request.node, "rep_setup", None), getattr(request.node, "rep_call", None))
+    recorder.finish(any(report is not None and report.failed for report in reports))
+
+@pytest.fixture(scope="session")
+def browser_pool(playwright):
+    # Session scope means one pool per xdist worker
+    pool = BrowserPool(
+        playwright,
+        launch_options=dict(
+            headless=Config.HEADLESS,
+            channel="chrome",  # Uses Chrome instead of Chromium
+            args=["--start-maximized"],
+            slow_mo=Config.SLOW_MO
+        ),
+        context_options=dict(no_viewport=True),
+        pool_size=Config.BROWSER_POOL_SIZE,
+        max_tests_per_browser=Config.BROWSER_MAX_TESTS
     )
+    yield pool
+    pool.close()
 
 @pytest.fixture
-def page(playwright):
-    browser = playwright.chromium.launch(
-        headless=False if os.getenv("HEADFUL") == "True" else True,
-        channel="chrome",  # Uses Chrome instead of Chromium
-        args=["--start-maximized"],
-        slow_mo=1000
-    )
-    context = browser.new_context(no_viewport=True)
-    page = context.new_page()
+def page(request, browser_pool):
+    strict_isolation = Config.STRICT_ISOLATION or request.node.get_closest_marker("strict_isolation")
+    if strict_isolation:
+        # Old behaviour: a brand-new Chrome process for this test only
+        browser = browser_pool.launch_browser()
+        context = browser.new_context(**browser_pool.context_options)
+        page = context.new_page()
+    else:
+        context = browser_pool.acquire()
+        page = context.pages[0]
+
+    router = None
+    if Config.NETWORK_ROUTING:
+        router = network.start_test()
+        router.install(context)
+    metrics = browser_metrics.start_test(request.node.nodeid)
+    metrics.install(page)
+    wait_recorder = waits.start_test()
     yield page
-    context.close()
-    browser.close()
+    wait_recorder.finish()
+    metrics.finish()
+    if router is not None:
+        router.finish()
+
+    if strict_isolation:
+        context.close()
+        browser.close()
+    else:
+        browser_pool.release(context)
+
+@pytest.fixture(scope="session")
+def api_client():
+    client = KanboardApiClient()
+    yield client
+    client.close()
+
+@pytest.fixture(scope="session")
+def db_pool():
+    pool = DatabasePool()
+    yield pool
+    pool.close()
 
 @pytest.fixture
-def db_connection():
-    db = Database()
+def db_connection(request):
+    # The pool is requested lazily so DB_POOL=false never opens pooled connections
+    query_recorder = database.start_test()
+    db = request.getfixturevalue("db_pool").acquire() if Config.DB_POOL else Database()
+    if Config.SQL_PROFILER:
+        sql_profiler.start_test(db, request.node.nodeid)
     yield db
+    sql_profiler.stop_test()
     db.close()
+    query_recorder.finish()
+
+@pytest.fixture(scope="session")
+def db_snapshots():
+    snapshots = DatabaseSnapshots()
+    yield snapshots
+    snapshots.close()
+
+# Autouse, so the database is swapped before any other fixture of the test connects or logs in
+@pytest.fixture(autouse=True)
+def db_snapshot(request):
+    marker = request.node.get_closest_marker("db_snapshot")
+    if marker is None:
+        yield None
+        return
+    if int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1")) > 1:
+        pytest.skip("db_snapshot replaces the database shared by all xdist workers; run it without -n")
+    data = request.getfixturevalue("db_snapshots").restore(marker.args[0] if marker.args else BASE_SNAPSHOT)
+    # Column and swimlane ids of the restored boards differ from the cached ones
+    invalidate_board_model()
+    yield data
 
 @pytest.fixture
-def login(page):
+def db_seeder(db_connection):
+    return DatabaseSeeder(db_connection)
+
+@pytest.fixture
+def db_assertions(db_connection):
+    return DbAssertions(db_connection)
+
+@pytest.fixture(scope="session")
+def cleanup_registry():
+    registry = CleanupRegistry()
+    # One worker is enough to sweep up what crashed runs left behind
+    if Config.CLEANUP_SWEEP_ORPHANS and get_factory().worker_id in ("main", "gw0"):
+        try:
+            registry.sweep_orphans()
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Orphaned test data sweep failed: {e}")
+    yield registry
+    registry.close()
+
+@pytest.fixture
+def cleanup(cleanup_registry):
+    yield cleanup_registry
+    if Config.CLEANUP_SCOPE == "test":
+        cleanup_registry.flush()
+
+@pytest.fixture(scope="session")
+def login_cache():
+    return LoginCache(
+        state_dir=Path(__file__).parent.resolve() / Config.LOGIN_STATE_DIR,
+        app_url=Config.APP_URL,
+        username=Config.ADMIN_USER,
+        password=Config.ADMIN_PASSWORD,
+        max_age=Config.LOGIN_STATE_MAX_AGE
+    )
+
+@pytest.fixture
+def login(page, login_cache):
+    if Config.LOGIN_CACHE:
+        login_cache.authenticate(page)
+        yield
+        return
+
     from pages.login_page import LoginPage
     login_page = LoginPage(page)
     login_page.navigate(Config.APP_URL)
@@ -0,0 +1,261 @@
+"""
+Page objects on `playwright.async_api`, for driving many browser contexts concurrently
+from one process (multi-user collaboration tests, parallel board checks, browser load).
+
+Every async page reuses the `_define_locators` of its sync page, and the endpoints and URL
+patterns come from utilities/constants.py, so only the action flows are written twice.
+tests/test_async_pages.py checks that each sync page method has an async counterpart.
+
+Unlike the sync pages, actions open no Allure steps (concurrent coroutines would nest them into
+each other) and only failures are captured as screenshots. Run them with
+`utilities.helpers.run_async`, since the sync Playwright session of the worker owns the main thread's loop.
+"""
+import logging
+import re
+from typing import Awaitable, Callable
+
+from playwright.async_api import Locator, Page, Response, expect
+
+from pages.base_page import BasePage
+from pages.board_model import (BoardModel, BoardSnapshot, find_task_id_async, get_board_model_async,
+                               task_card_selector)
+from pages.login_page import LoginPage
+from pages.project_dashboard_page import ProjectDashboardPage
+from pages.project_page import ProjectPage
+from pages.task_page import TaskPage
+from utilities import screenshots, waits
+from utilities.constants import (BASE_URL, BOARD, BOARD_COLUMNS, BOARD_MOVE_ENDPOINT, DEFAULT_TIMEOUT,
+                                 PROJECT_URL_PATTERN, SMALL_TIMEOUT, TASK_SAVE_ENDPOINT)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBasePage:
+    """
+    Async counterpart of BasePage. `label` (e.g. the virtual user) prefixes log lines and
+    failure screenshots, to tell concurrent sessions apart.
+    """
+
+    _define_locators = BasePage._define_locators
+
+    def __init__(self, page: Page, label: str = ""):
+        self.page = page
+        self.label = label
+        self._define_locators(page)
+
+    @property
+    def screenshots(self) -> screenshots.ScreenshotRecorder:
+        return screenshots.get_recorder()
+
+    @property
+    def waits(self) -> waits.WaitRecorder:
+        return waits.get_recorder()
+
+    async def click(self, locator: Locator, locator_description: str = "element"):
+        self._log(f"Clicking element: '{locator_description}'")
+        try:
+            await locator.click()
+        except Exception as e:
+            await self._record_failure(f"Error_Clicking_{locator_description}")
+            raise e
+
+    async def fill(self, locator: Locator, value: str, locator_description: str = "input field"):
+        self._log(f"Filling '{locator_description}' with value: '{value}'")
+        try:
+            await locator.fill(value)
+        except Exception as e:
+            await self._record_failure(f"Error_Filling_{locator_description}")
+            raise e
+
+    async def wait_for_locator(self, locator: Locator, timeout: int = DEFAULT_TIMEOUT,
+                               locator_description: str = "element"):
+        try:
+            with self.waits.measure(f"locator: {locator_description}"):
+                await locator.wait_for(state="visible", timeout=timeout)
+        except Exception as e:
+            await self._record_failure(f"Error_Waiting_for_{locator_description}_visible")
+            raise e
+
+    async def navigate(self, url: str):
+        self._log(f"Navigating to URL: '{url}'")
+        try:
+            await self.page.goto(url)
+        except Exception as e:
+            await self._record_failure(f"Error_Navigating_to_{url}")
+            raise e
+
+    async def wait_for_url(self, url_pattern: str):
+        try:
+            with self.waits.measure(f"url: {url_pattern}"):
+                await self.page.wait_for_url(url_pattern, timeout=DEFAULT_TIMEOUT)
+        except Exception as e:
+            current_url = self.page.url
+            await self._record_failure(f"Error_Waiting_for_URL_{url_pattern}")
+            raise ValueError(
+                f"URL did not match '{url_pattern}' within {DEFAULT_TIMEOUT / 1000} seconds."
+                f" Current URL: {current_url}. Error: {e}")
+
+    async def wait_for_response(self, action: Callable[[], Awaitable[None]], url_pattern: str,
+                                action_description: str = "action", method: str = "POST",
+                                timeout: int = DEFAULT_TIMEOUT) -> Response:
+        pattern = re.compile(url_pattern)
+        self._log(f"Waiting for response '{url_pattern}' to: '{action_description}'")
+        try:
+            with self.waits.measure(f"response: {action_description}"):
+                async with self.page.expect_response(
+                        lambda response: response.request.method == method and pattern.search(response.url),
+                        timeout=timeout) as response_info:
+                    await action()
+                response = await response_info.value
+        except Exception as e:
+            await self._record_failure(f"Error_Waiting_for_response_{action_description}")
+            raise e
+        assert response.ok, f"'{action_description}' failed: {method} {response.url} returned {response.status}"
+        return response
+
+    async def click_and_wait_for_response(self, locator: Locator, url_pattern: str,
+                                          locator_description: str = "element", method: str = "POST") -> Response:
+        return await self.wait_for_response(locator.click, url_pattern, f"Click {locator_description}", method)
+
+    async def click_and_wait_for_navigation(self, locator: Locator, url_pattern: str,
+                                            locator_description: str = "element"):
+        self._log(f"Clicking '{locator_description}' and waiting for navigation to '{url_pattern}'")
+        try:
+            with self.waits.measure(f"navigation: {locator_description}"):
+                async with self.page.expect_navigation(url=re.compile(url_pattern), timeout=DEFAULT_TIMEOUT):
+                    await locator.click()
+        except Exception as e:
+            await self._record_failure(f"Error_Navigating_after_{locator_description}")
+            raise e
+
+    async def snapshot_board(self) -> BoardSnapshot:
+        await self.page.locator("#board").wait_for(state="visible")
+        return await BoardSnapshot.from_async_page(self.page)
+
+    async def _record_failure(self, name: str):
+        if self.screenshots.mode != screenshots.NEVER:
+            prefix = f"{self.label}_" if self.label else ""
+            self.screenshots.attach_failure(f"{prefix}{name}", await self.page.screenshot(full_page=True))
+
+    def _log(self, message: str):
+        logger.info(f"[{self.label}] {message}" if self.label else message)
+
+
+class AsyncLoginPage(AsyncBasePage):
+    _define_locators = LoginPage._define_locators
+
+    async def login(self, username: str, password: str, remember_me: bool = False):
+        await self.fill(self.username_input, username)
+        await self.fill(self.password_input, password)
+        if remember_me:
+            await self.remember_me_checkbox.check()
+        await self.click(self.sign_in_button)
+        await self.wait_for_url(BASE_URL)
+
+
+class AsyncProjectPage(AsyncBasePage):
+    _define_locators = ProjectPage._define_locators
+
+    async def create_project(self, name: str):
+        self._log(f"Creating project: '{name}'")
+        await self.click(self.new_project_button, locator_description="New project button")
+        await self.fill(self.project_name_input, name, locator_description="Project name input")
+        await self.click_and_wait_for_navigation(self.save_button, PROJECT_URL_PATTERN,
+                                                 locator_description="Save button")
+        project_name_on_list = self.page.get_by_text(name)
+        await self.wait_for_locator(project_name_on_list, locator_description=f"Project '{name}' in list")
+        await expect(project_name_on_list).to_be_visible()
+
+    async def delete_project(self, project_id: int):
+        await self.navigate_to_projects_management()
+        project_row = self.page.get_by_role("link", name=f"#{project_id} ")
+        await self.click(project_row, locator_description=f"Project row for project ID '{project_id}'")
+        await self.click(self.configure_project_link,
+                         locator_description=f"Configure project link for project ID '{project_id}'")
+        await self.click(self.remove_link, locator_description=f"Delete button for project '{project_id}'")
+        await self.wait_for_locator(self.confirm_remove_link, locator_description="Confirmation link")
+        await self.click(self.confirm_remove_link, locator_description="Confirm deletion button")
+        await expect(project_row).not_to_be_visible(timeout=SMALL_TIMEOUT)
+
+    async def navigate_to_projects_management(self):
+        await self.click(self.configure_project_label, locator_description="User dropdown menu")
+        await self.click(self.manage_projects_link, locator_description="Projects management link")
+        await self.wait_for_url("**/project**")
+
+    async def get_project_id_from_url(self) -> str | None:
+        match = re.search(r'/(?:project|board)/(\d+)', self.page.url)
+        if match:
+            return match.group(1)
+        await self._record_failure("URL_NoProjectID_Extract")
+        return None
+
+
+class AsyncProjectDashboardPage(AsyncBasePage):
+    _define_locators = ProjectDashboardPage._define_locators
+
+    async def navigate_to_board_view(self, project_id: str):
+        await self.click(self.board_view_link, locator_description="Board view link")
+        await self.wait_for_url(f"{BASE_URL}{BOARD}{project_id}/**")
+
+    async def open_board(self, project_id: int | str):
+        await self.navigate(f"{BASE_URL}{BOARD}{project_id}")
+        await self.wait_for_locator(self.page.locator("#board"), locator_description="Board")
+
+
+class AsyncTaskPage(AsyncBasePage):
+    _define_locators = TaskPage._define_locators
+
+    async def create_task(self, title: str, description: str = ""):
+        self._log(f"Creating task with title: '{title}'")
+        await self.click(self.add_new_task_link, locator_description="Add new task link")
+        await self.fill(self.task_title_input, title, locator_description="Task title input")
+        if description:
+            await self.fill(self.task_description_textarea, description,
+                            locator_description="Task description textarea")
+        await self.click_and_wait_for_response(self.save_button, TASK_SAVE_ENDPOINT,
+                                               locator_description="Save task button")
+        await self.wait_for_locator(self.page.get_by_text(title), locator_description=f"Task '{title}' on board")
+
+    async def board_model(self, refresh: bool = False) -> BoardModel:
+        return await get_board_model_async(self.page, refresh)
+
+    async def get_column_locator_by_name(self, column_name: str, swimlane_name: str | None = None):
+        try:
+            selector = (await self.board_model()).drop_area_selector(column_name, swimlane_name)
+        except KeyError:
+            try:
+                selector = (await self.board_model(refresh=True)).drop_area_selector(column_name, swimlane_name)
+            except KeyError:
+                raise ValueError(f"Could not find data-column-id for column: {column_name}")
+        return self.page.locator(selector)
+
+    async def get_task_card_locator(self, title: str):
+        task_id = await find_task_id_async(self.page, title)
+        if task_id is None:
+            raise ValueError(f"Could not find task '{title}' on the board")
+        return self.page.locator(task_card_selector(task_id))
+
+    async def move_task_to_done(self, title: str):
+        workflow_columns = list(BOARD_COLUMNS)
+        starting_column_locator = await self.get_column_locator_by_name(workflow_columns[0])
+        await expect(starting_column_locator.get_by_text(title)).to_be_visible(timeout=SMALL_TIMEOUT)
+        for column_name in workflow_columns[1:]:
+            await self.move_task(title, column_name)
+
+    async def move_task(self, title: str, column_name: str):
+        target_column_locator = await self.get_column_locator_by_name(column_name)
+        await self._move_task_single_step(title, column_name, target_column_locator)
+        await expect(target_column_locator.get_by_text(title)).to_be_visible(timeout=SMALL_TIMEOUT)
+
+    async def _move_task_single_step(self, task_title: str, target_column_name: str, target_drop_area=None):
+        task_card = await self.get_task_card_locator(task_title)
+        if target_drop_area is None:
+            target_drop_area = await self.get_column_locator_by_name(target_column_name)
+        await expect(task_card).to_be_visible(timeout=SMALL_TIMEOUT)
+        await expect(target_drop_area).to_be_visible(timeout=SMALL_TIMEOUT)
+        await self.drag_task_card(task_card, target_drop_area, f"Move '{task_title}' to '{target_column_name}'")
+
+    async def drag_task_card(self, task_card: Locator, target_drop_area: Locator,
+                             action_description: str = "Move task"):
+        await self.wait_for_response(lambda: task_card.drag_to(target_drop_area), BOARD_MOVE_ENDPOINT,
+                                     action_description=action_description)
@@ -1,11 +1,60 @@
-from playwright.sync_api import Page, Locator
+import re
+from contextlib import nullcontext
+from typing import Callable
+
+from playwright.sync_api import Page, Locator, Response
+from pages.board_model import BoardSnapshot
 from utilities.constants import DEFAULT_TIMEOUT
+from utilities import browser_metrics, network, screenshots, sql_profiler, waits
 import allure
 
 class BasePage:
     def __init__(self, page: Page):
         self.page = page
 
+    def _define_locators(self, page):
+        """
+        Builds the page's locators. Creating a locator is synchronous in both Playwright APIs,
+        so the async page objects in pages/async_pages.py reuse this method of their sync page.
+        """
+
+    @property
+    def screenshots(self) -> screenshots.ScreenshotRecorder:
+        """
+        The screenshot recorder of the running test. It decides, according to the
+        active screenshot mode, whether an action is captured.
+        """
+        return screenshots.get_recorder()
+
+    @property
+    def metrics(self) -> browser_metrics.BrowserMetricsCollector:
+        """
+        The browser performance metrics collector of the running test.
+        """
+        return browser_metrics.get_collector()
+
+    @property
+    def network(self) -> network.NetworkRouter | None:
+        """
+        The network router of the running test (None when NETWORK_ROUTING is off).
+        Page objects can use it to block extra requests, e.g. `self.network.block(r"/avatar/")`.
+        """
+        return network.get_router()
+
+    @property
+    def waits(self) -> waits.WaitRecorder:
+        """
+        Records how long each action of the running test spent waiting.
+        """
+        return waits.get_recorder()
+
+    def profile_sql(self, action: str):
+        """
+        Attributes the SQL Kanboard runs during the block to `action` (a no-op unless SQL_PROFILER is on).
+        """
+        profiler = sql_profiler.get_profiler()
+        return profiler.measure(action) if profiler else nullcontext()
+
     @allure.step("Clicking element: '{locator_description}'")
     def click(self, locator: Locator, locator_description: str = "element"):
         """
@@ -13,18 +62,11 @@ class BasePage:
         Logs the action to Allure.
         """
         try:
-            locator.click()
-            allure.attach(
-                self.page.screenshot(full_page=False, path=None), # Path=None returns bytes
-                name=f"Clicked_{locator_description}",
-                attachment_type=allure.attachment_type.PNG
-            )
+            with self.profile_sql(f"Click {locator_description}"):
+                locator.click()
+            self.screenshots.record(self.page, f"Clicked_{locator_description}")
         except Exception as e:
-            allure.attach(
-                self.page.screenshot(full_page=True, path=None),
-                name=f"Error_Clicking_{locator_description}",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self.screenshots.record_failure(self.page, f"Error_Clicking_{locator_description}")
             raise e
 
     @allure.step("Filling '{locator_description}' with value: '{value}'")
@@ -35,17 +77,9 @@ class BasePage:
         """
         try:
             locator.fill(value)
-            allure.attach(
-                self.page.screenshot(full_page=False, path=None),
-                name=f"Filled_{locator_description}_with_{value}",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self.screenshots.record(self.page, f"Filled_{locator_description}_with_{value}")
         except Exception as e:
-            allure.attach(
-                self.page.screenshot(full_page=True, path=None),
-                name=f"Error_Filling_{locator_description}",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self.screenshots.record_failure(self.page, f"Error_Filling_{locator_description}")
             raise e
 
     @allure.step("Waiting for '{locator_description}' to be visible")
@@ -55,18 +89,11 @@ class BasePage:
         Logs the action to Allure.
         """
         try:
-            locator.wait_for(state="visible", timeout=timeout)
-            allure.attach(
-                self.page.screenshot(full_page=False, path=None),
-                name=f"Waited_for_{locator_description}_visible",
-                attachment_type=allure.attachment_type.PNG
-            )
+            with self.waits.measure(f"locator: {locator_description}"):
+                locator.wait_for(state="visible", timeout=timeout)
+            self.screenshots.record(self.page, f"Waited_for_{locator_description}_visible")
         except Exception as e:
-            allure.attach(
-                self.page.screenshot(full_page=True, path=None),
-                name=f"Error_Waiting_for_{locator_description}_visible",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self.screenshots.record_failure(self.page, f"Error_Waiting_for_{locator_description}_visible")
             raise e
 
     @allure.step("Navigating to URL: '{url}'")
@@ -76,18 +103,12 @@ class BasePage:
         Logs the navigation to Allure.
         """
         try:
-            self.page.goto(url)
-            allure.attach(
-                self.page.screenshot(full_page=True, path=None),
-                name=f"Navigated_to_{url}",
-                attachment_type=allure.attachment_type.PNG
-            )
+            with self.profile_sql(f"Navigate {url}"):
+                self.page.goto(url)
+            self.metrics.collect(self.page, type(self).__name__, url)
+            self.screenshots.record(self.page, f"Navigated_to_{url}", full_page=True)
         except Exception as e:
-            allure.attach(
-                self.page.screenshot(full_page=True, path=None),
-                name=f"Error_Navigating_to_{url}",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self.screenshots.record_failure(self.page, f"Error_Navigating_to_{url}")
             raise e
 
     @allure.step("Waiting for URL to match pattern: '{url_pattern}'")
@@ -98,19 +119,66 @@ class BasePage:
         Logs the URL waiting action to Allure.
         """
         try:
-            self.page.wait_for_url(url_pattern, timeout=DEFAULT_TIMEOUT)
-            allure.attach(
-                self.page.screenshot(full_page=True, path=None),
-                name=f"URL_matched_{url_pattern}",
-                attachment_type=allure.attachment_type.PNG
-            )
+            with self.waits.measure(f"url: {url_pattern}"):
+                self.page.wait_for_url(url_pattern, timeout=DEFAULT_TIMEOUT)
+            self.metrics.collect(self.page, type(self).__name__, url_pattern)
+            self.screenshots.record(self.page, f"URL_matched_{url_pattern}", full_page=True)
         except Exception as e:
             current_url = self.page.url  # Get current URL for error context
-            allure.attach(
-                self.page.screenshot(full_page=True, path=None),
-                name=f"Error_Waiting_for_URL_{url_pattern}",
-                attachment_type=allure.attachment_type.PNG
-            )
+            self.screenshots.record_failure(self.page, f"Error_Waiting_for_URL_{url_pattern}")
             raise ValueError(
                 f"URL did not match '{url_pattern}' within {DEFAULT_TIMEOUT / 1000} seconds."
-                f" Current URL: {current_url}. Error: {e}")
\ No newline at end of file
+                f" Current URL: {current_url}. Error: {e}")
+
+    @allure.step("Waiting for response '{url_pattern}' to: '{action_description}'")
+    def wait_for_response(self, action: Callable[[], None], url_pattern: str, action_description: str = "action",
+                          method: str = "POST", timeout: int = DEFAULT_TIMEOUT) -> Response:
+        """
+        Performs an action (a click, a drag, ...) and waits for the request it triggers,
+        matched by method and a regular expression on the URL. Fails if the response is an error.
+        """
+        pattern = re.compile(url_pattern)
+        try:
+            with self.waits.measure(f"response: {action_description}"), self.profile_sql(action_description):
+                with self.page.expect_response(
+                        lambda response: response.request.method == method and pattern.search(response.url),
+                        timeout=timeout) as response_info:
+                    action()
+                response = response_info.value
+            self.screenshots.record(self.page, f"Response_for_{action_description}")
+        except Exception as e:
+            self.screenshots.record_failure(self.page, f"Error_Waiting_for_response_{action_description}")
+            raise e
+        assert response.ok, f"'{action_description}' failed: {method} {response.url} returned {response.status}"
+        return response
+
+    def click_and_wait_for_response(self, locator: Locator, url_pattern: str, locator_description: str = "element",
+                                    method: str = "POST") -> Response:
+        """
+        Clicks a locator and waits for the XHR/fetch response the click triggers.
+        """
+        return self.wait_for_response(locator.click, url_pattern, f"Click {locator_description}", method)
+
+    @allure.step("Clicking '{locator_description}' and waiting for navigation to '{url_pattern}'")
+    def click_and_wait_for_navigation(self, locator: Locator, url_pattern: str, locator_description: str = "element"):
+        """
+        Clicks a locator and waits for the navigation it causes, with the URL matching a regular expression.
+        """
+        try:
+            with self.waits.measure(f"navigation: {locator_description}"), self.profile_sql(f"Click {locator_description}"):
+                with self.page.expect_navigation(url=re.compile(url_pattern), timeout=DEFAULT_TIMEOUT):
+                    locator.click()
+            self.metrics.collect(self.page, type(self).__name__, url_pattern)
+            self.screenshots.record(self.page, f"Navigated_after_{locator_description}", full_page=True)
+        except Exception as e:
+            self.screenshots.record_failure(self.page, f"Error_Navigating_after_{locator_description}")
+            raise e
+
+    @allure.step("Taking a snapshot of the board")
+    def snapshot_board(self) -> BoardSnapshot:
+        """
+        Reads every column, swimlane and task card of the board shown in one JS evaluation,
+        for bulk assertions such as `snapshot.assert_contains(titles, column="Backlog")`.
+        """
+        self.page.locator("#board").wait_for(state="visible")
+        return BoardSnapshot.from_page(self.page)
@@ -0,0 +1,309 @@
+import re
+from dataclasses import dataclass
+
+from playwright.sync_api import Page
+
+# One round trip: every column and swimlane of the board with the selector of each drop area,
+# plus (for snapshots) every task card in board order
+_BOARD_SCRIPT = """
+(includeTasks) => {
+    const columns = [...document.querySelectorAll('th.board-column-header[data-column-id]')].map((th, index) => {
+        const link = th.querySelector('.board-column-expanded .board-column-title a')
+            || th.querySelector('.board-column-title a') || th.querySelector('a');
+        return {id: Number(th.dataset.columnId), title: (link || th).textContent.trim(), position: index + 1};
+    });
+    const swimlaneNames = [...document.querySelectorAll('.board-swimlane-title')].map(el => el.textContent.trim());
+    const swimlanes = [];
+    const dropAreas = [];
+    for (const column of columns) {
+        const lists = document.querySelectorAll(
+            `td.board-column-${column.id} div.board-task-list.board-column-expanded`);
+        for (const list of lists) {
+            const swimlaneId = list.dataset.swimlaneId ? Number(list.dataset.swimlaneId) : null;
+            if (!swimlanes.includes(swimlaneId)) swimlanes.push(swimlaneId);
+            const selector = swimlaneId === null
+                ? `td.board-column-${column.id} div.board-task-list.board-column-expanded`
+                : `div.board-task-list.board-column-expanded[data-column-id="${column.id}"][data-swimlane-id="${swimlaneId}"]`;
+            dropAreas.push({columnId: column.id, swimlaneId, selector});
+        }
+    }
+    const tasks = [];
+    if (includeTasks) {
+        for (const area of dropAreas) {
+            const list = document.querySelector(area.selector);
+            if (!list) continue;
+            list.querySelectorAll('.task-board[data-task-id]').forEach((card, index) => {
+                const title = card.querySelector('.task-board-title a') || card.querySelector('.task-board-title');
+                tasks.push({
+                    id: Number(card.dataset.taskId),
+                    title: title ? title.textContent.trim() : '',
+                    columnId: area.columnId,
+                    swimlaneId: area.swimlaneId,
+                    position: index + 1,
+                });
+            });
+        }
+    }
+    return {
+        columns,
+        swimlanes: swimlanes.map((id, index) => ({id, name: swimlaneNames[index] || null, position: index + 1})),
+        dropAreas,
+        tasks,
+    };
+}
+"""
+
+
+@dataclass(frozen=True)
+class BoardColumn:
+    id: int
+    title: str
+    position: int
+
+
+@dataclass(frozen=True)
+class BoardSwimlane:
+    id: int | None
+    name: str | None
+    position: int
+
+
+class BoardModel:
+    """
+    Structure of one project board (columns, swimlanes and their drop areas), read from the DOM
+    with a single `page.evaluate` and cached per project, so that column lookups cost no round trips.
+    """
+
+    def __init__(self, columns: list[BoardColumn], swimlanes: list[BoardSwimlane],
+                 drop_areas: dict[tuple[int, int | None], str]):
+        self.columns = columns
+        self.swimlanes = swimlanes
+        self.drop_areas = drop_areas
+
+    @classmethod
+    def from_page(cls, page: Page) -> "BoardModel":
+        return cls.from_data(page.evaluate(_BOARD_SCRIPT, False))
+
+    @classmethod
+    def from_data(cls, data: dict) -> "BoardModel":
+        return cls(
+            columns=[BoardColumn(**column) for column in data["columns"]],
+            swimlanes=[BoardSwimlane(**swimlane) for swimlane in data["swimlanes"]],
+            drop_areas={(area["columnId"], area["swimlaneId"]): area["selector"] for area in data["dropAreas"]},
+        )
+
+    def column(self, name: str) -> BoardColumn:
+        """
+        Finds a column by exact title, falling back to a case-insensitive substring match
+        (the semantics of Playwright's `:text()`).
+        """
+        for column in self.columns:
+            if column.title == name:
+                return column
+        for column in self.columns:
+            if name.lower() in column.title.lower():
+                return column
+        raise KeyError(name)
+
+    def swimlane(self, name: str | None = None) -> BoardSwimlane:
+        """
+        Finds a swimlane by name; without a name the first swimlane is returned.
+        """
+        if name is None and self.swimlanes:
+            return self.swimlanes[0]
+        for swimlane in self.swimlanes:
+            if swimlane.name == name:
+                return swimlane
+        raise KeyError(name)
+
+    def drop_area_selector(self, column_name: str, swimlane_name: str | None = None) -> str:
+        return self.drop_areas[(self.column(column_name).id, self.swimlane(swimlane_name).id)]
+
+    def column_title(self, column_id: int) -> str:
+        return next(column.title for column in self.columns if column.id == column_id)
+
+    def swimlane_name(self, swimlane_id: int | None) -> str | None:
+        return next((swimlane.name for swimlane in self.swimlanes if swimlane.id == swimlane_id), None)
+
+
+# A single card by its exact title, returning only the task id: actions on one task must not
+# read and serialize the whole board the way a snapshot does
+_TASK_ID_SCRIPT = """
+(title) => {
+    for (const card of document.querySelectorAll('.task-board[data-task-id]')) {
+        const link = card.querySelector('.task-board-title a') || card.querySelector('.task-board-title');
+        if (link && link.textContent.trim() === title) return Number(card.dataset.taskId);
+    }
+    return null;
+}
+"""
+
+
+def task_card_selector(task_id: int) -> str:
+    return f'.task-board[data-task-id="{task_id}"]'
+
+
+def find_task_id(page: Page, title: str) -> int | None:
+    """
+    The id of the task card titled `title` on the board shown, or None.
+    """
+    return page.evaluate(_TASK_ID_SCRIPT, title)
+
+
+async def find_task_id_async(page, title: str) -> int | None:
+    return await page.evaluate(_TASK_ID_SCRIPT, title)
+
+
+@dataclass(frozen=True)
+class TaskCard:
+    id: int
+    title: str
+    column: str
+    swimlane: str | None
+    position: int
+
+    @property
+    def selector(self) -> str:
+        return task_card_selector(self.id)
+
+
+class BoardDiff:
+    """
+    Differences between two snapshots of the same board, matched by task id.
+    """
+
+    def __init__(self, before: "BoardSnapshot", after: "BoardSnapshot"):
+        before_tasks = {task.id: task for task in before.tasks}
+        after_tasks = {task.id: task for task in after.tasks}
+        self.added = [after_tasks[task_id] for task_id in after_tasks.keys() - before_tasks.keys()]
+        self.removed = [before_tasks[task_id] for task_id in before_tasks.keys() - after_tasks.keys()]
+        # (before, after) pairs of tasks that changed column or swimlane
+        self.moved = [(before_tasks[task_id], after_tasks[task_id])
+                      for task_id in before_tasks.keys() & after_tasks.keys()
+                      if (before_tasks[task_id].column, before_tasks[task_id].swimlane)
+                      != (after_tasks[task_id].column, after_tasks[task_id].swimlane)]
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.moved)
+
+    def __str__(self):
+        lines = [f"+ '{task.title}' in '{task.column}'" for task in self.added]
+        lines += [f"- '{task.title}' from '{task.column}'" for task in self.removed]
+        lines += [f"~ '{before.title}': '{before.column}' -> '{after.column}'" for before, after in self.moved]
+        return "\n".join(lines) or "No changes"
+
+    def assert_moved(self, title: str, to_column: str):
+        """
+        Asserts that the task `title` moved to `to_column` and that nothing else changed on the board.
+        """
+        assert [(after.title, after.column) for _, after in self.moved] == [(title, to_column)] \
+               and not self.added and not self.removed, \
+            f"Expected only '{title}' to move to '{to_column}', but the board changed as follows:\n{self}"
+
+
+class BoardSnapshot:
+    """
+    Every column, swimlane and task card of a board, read in a single JS evaluation.
+    Meant for bulk assertions and cheap before/after comparisons instead of one
+    polling `expect(...)` per task.
+    """
+
+    def __init__(self, model: BoardModel, tasks: list[TaskCard]):
+        self.model = model
+        self.tasks = tasks
+
+    @classmethod
+    def from_page(cls, page: Page) -> "BoardSnapshot":
+        return cls.from_data(page.evaluate(_BOARD_SCRIPT, True), page)
+
+    @classmethod
+    async def from_async_page(cls, page) -> "BoardSnapshot":
+        return cls.from_data(await page.evaluate(_BOARD_SCRIPT, True), page)
+
+    @classmethod
+    def from_data(cls, data: dict, page=None) -> "BoardSnapshot":
+        model = BoardModel.from_data(data)
+        if page is not None and model.columns:
+            # A snapshot is also a fresh board model
+            _board_models[_board_key(page)] = model
+        tasks = [TaskCard(id=task["id"], title=task["title"], column=model.column_title(task["columnId"]),
+                          swimlane=model.swimlane_name(task["swimlaneId"]), position=task["position"])
+                 for task in data["tasks"]]
+        return cls(model, tasks)
+
+    def task(self, title: str) -> TaskCard:
+        for task in self.tasks:
+            if task.title == title:
+                return task
+        raise KeyError(title)
+
+    def titles(self, column: str | None = None) -> list[str]:
+        return [task.title for task in self.tasks if column is None or task.column == column]
+
+    def assert_contains(self, titles: list[str], column: str | None = None):
+        """
+        Asserts in one go that every title is on the board (in `column`, if given).
+        """
+        present = set(self.titles(column))
+        missing = [title for title in titles if title not in present]
+        where = f"column '{column}'" if column else "the board"
+        assert not missing, f"{len(missing)} of {len(titles)} tasks are missing from {where}: {missing}"
+
+    def diff(self, after: "BoardSnapshot") -> BoardDiff:
+        return BoardDiff(self, after)
+
+    def to_dict(self) -> dict:
+        return {
+            "columns": [column.title for column in self.model.columns],
+            "swimlanes": [swimlane.name for swimlane in self.model.swimlanes],
+            "tasks": [task.__dict__ for task in self.tasks],
+        }
+
+
+# Cached models keyed by (origin, project id)
+_board_models: dict[tuple[str, str], BoardModel] = {}
+
+
+def _board_key(page: Page) -> tuple[str, str]:
+    url = page.url
+    match = re.search(r"/(?:board|project)/(\d+)", url) or re.search(r"[?&]project_id=(\d+)", url)
+    origin = re.match(r"^\w+://[^/]+", url)
+    return (origin.group(0) if origin else "", match.group(1) if match else url)
+
+
+def get_board_model(page: Page, refresh: bool = False) -> BoardModel:
+    """
+    Returns the cached model of the board shown on `page`, building it on first use.
+    """
+    key = _board_key(page)
+    if refresh or key not in _board_models:
+        model = BoardModel.from_page(page)
+        if not model.columns:
+            # The board is not rendered (yet); do not cache an empty model
+            return model
+        _board_models[key] = model
+    return _board_models[key]
+
+
+async def get_board_model_async(page, refresh: bool = False) -> BoardModel:
+    """
+    `get_board_model` for a `playwright.async_api` page; both share one cache.
+    """
+    key = _board_key(page)
+    if refresh or key not in _board_models:
+        model = BoardModel.from_data(await page.evaluate(_BOARD_SCRIPT, False))
+        if not model.columns:
+            return model
+        _board_models[key] = model
+    return _board_models[key]
+
+
+def invalidate_board_model(page: Page | None = None):
+    """
+    Drops the cached model of the board shown on `page`, or every cached model.
+    Call it after changing a board's columns or swimlanes.
+    """
+    if page is None:
+        _board_models.clear()
+    else:
+        _board_models.pop(_board_key(page), None)
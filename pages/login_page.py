@@ -12,6 +12,9 @@ class LoginPage(BasePage):
         Initializes the LoginPage with a Playwright Page object and defines its locators.
         """
         super().__init__(page)
+        self._define_locators(page)
+
+    def _define_locators(self, page):
         # Define locators as instance variables for clarity and reusability
         self.username_input = page.locator("#form-username")
         self.password_input = page.locator("#form-password")  # Corrected from your previous HTML: id was 'form-password'
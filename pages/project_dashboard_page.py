@@ -6,6 +6,9 @@ import allure
 class ProjectDashboardPage(BasePage): # Could be a new page object or part of ProjectPage
     def __init__(self, page: Page):
         super().__init__(page)
+        self._define_locators(page)
+
+    def _define_locators(self, page):
         # Using get_by_role is often the most robust:
         self.board_view_link = page.get_by_role("link", name="Board")
         # Alternative:
@@ -22,3 +25,11 @@ class ProjectDashboardPage(BasePage): # Could be a new page object or part of Pr
         self.click(self.board_view_link, locator_description="Board view link")
         # Assuming the URL changes after clicking, you might want to wait for it
         self.wait_for_url(f"{BASE_URL}{BOARD}{project_id}/**")
+
+    @allure.step("Opening the board of project {project_id}")
+    def open_board(self, project_id: int | str):
+        """
+        Loads the board page of a project directly and waits until the board is rendered.
+        """
+        self.navigate(f"{BASE_URL}{BOARD}{project_id}")
+        self.wait_for_locator(self.page.locator("#board"), locator_description="Board")
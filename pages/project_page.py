@@ -1,6 +1,6 @@
 from pages.base_page import BasePage
 from playwright.sync_api import Page, expect
-from utilities.constants import SMALL_TIMEOUT
+from utilities.constants import PROJECT_URL_PATTERN, SMALL_TIMEOUT
 import allure
 
 
@@ -12,6 +12,9 @@ class ProjectPage(BasePage):
 
     def __init__(self, page: Page):
         super().__init__(page)
+        self._define_locators(page)
+
+    def _define_locators(self, page):
         # Define locators specific to the Project Page
         self.new_project_button = page.get_by_role("link", name="New project")
         self.project_name_input = page.locator("#form-name")
@@ -32,7 +35,8 @@ class ProjectPage(BasePage):
         with allure.step(f"Creating project: '{name}'"):  # Add an Allure step for the entire action
             self.click(self.new_project_button, locator_description="New project button")
             self.fill(self.project_name_input, name, locator_description="Project name input")
-            self.click(self.save_button, locator_description="Save button")
+            # Saving redirects to the new project's page
+            self.click_and_wait_for_navigation(self.save_button, PROJECT_URL_PATTERN, locator_description="Save button")
             # For dynamic elements like a project name appearing, we can create the locator here
             project_name_on_list = self.page.get_by_text(name)
             self.wait_for_locator(project_name_on_list, locator_description=f"Project '{name}' in list")
@@ -86,7 +90,5 @@ class ProjectPage(BasePage):
             return project_id
         else:
             # self.log_warning(f"Could not extract project ID from URL: {current_url}")
-            allure.attach(self.page.screenshot(full_page=True, path=None),
-                          name="URL_NoProjectID_Extract",
-                          attachment_type=allure.attachment_type.PNG)
+            self.screenshots.record_failure(self.page, "URL_NoProjectID_Extract")
             return None
@@ -1,6 +1,7 @@
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Locator, Page, expect
 from pages.base_page import BasePage
-from utilities.constants import SMALL_TIMEOUT
+from pages.board_model import BoardModel, find_task_id, get_board_model, task_card_selector
+from utilities.constants import BOARD_COLUMNS, BOARD_MOVE_ENDPOINT, SMALL_TIMEOUT, TASK_SAVE_ENDPOINT
 import allure
 
 class TaskPage(BasePage):
@@ -12,6 +13,9 @@ class TaskPage(BasePage):
         Initializes the TaskPage with a Playwright Page object and defines its locators.
         """
         super().__init__(page)
+        self._define_locators(page)
+
+    def _define_locators(self, page):
         # Define common static locators
         self.add_new_task_link = (page.locator("#board div").filter(has_text="Backlog Hide this column").
                                  locator("div").get_by_role("link"))
@@ -30,77 +34,95 @@ class TaskPage(BasePage):
         if description:
             self.fill(self.task_description_textarea, description, locator_description="Task description textarea")
 
-        self.click(self.save_button, locator_description="Save task button")
+        self.click_and_wait_for_response(self.save_button, TASK_SAVE_ENDPOINT, locator_description="Save task button")
 
         # Dynamic locator for the created task title on the board
         task_title_on_board = self.page.get_by_text(title)
         self.wait_for_locator(task_title_on_board, locator_description=f"Task '{title}' on board")
 
-    def get_column_locator_by_name(self, column_name: str):
-        # Step 1: Find the column header (<th>) that contains the column name
-        column_header = self.page.locator(f"th.board-column-header:has(a:text('{column_name}'))")
-
-        # Get the data-column-id from the header
-        column_id = column_header.get_attribute("data-column-id")
-        if not column_id:
-            raise ValueError(f"Could not find data-column-id for column: {column_name}")
+    @property
+    def board_model(self) -> BoardModel:
+        """
+        The cached column/swimlane model of the board currently shown.
+        """
+        return get_board_model(self.page)
 
-        # Step 2: Locate the <td> that corresponds to this column_id
-        # Then, crucially, target only the 'expanded' task list div.
-        # This will select the *visible* droppable area.
-        return self.page.locator(f"td.board-column-{column_id} div.board-task-list.board-column-expanded")
+    def get_column_locator_by_name(self, column_name: str, swimlane_name: str | None = None):
+        """
+        Returns the visible droppable task list of a column (in the first swimlane unless
+        `swimlane_name` is given). Resolved from the board model without touching the DOM.
+        """
+        try:
+            selector = self.board_model.drop_area_selector(column_name, swimlane_name)
+        except KeyError:
+            # The board's columns changed since the model was cached: rebuild it once
+            try:
+                selector = get_board_model(self.page, refresh=True).drop_area_selector(column_name, swimlane_name)
+            except KeyError:
+                raise ValueError(f"Could not find data-column-id for column: {column_name}")
+        return self.page.locator(selector)
+
+    def get_task_card_locator(self, title: str):
+        """
+        Returns the card of a task, located by its task id rather than by matching its title text
+        in the DOM. Only the id of that one card is read from the page, not a whole board snapshot.
+        """
+        task_id = find_task_id(self.page, title)
+        if task_id is None:
+            raise ValueError(f"Could not find task '{title}' on the board")
+        return self.page.locator(task_card_selector(task_id))
 
     @allure.step("Moving task '{title}' through workflow columns to 'Done'")
     def move_task_to_done(self, title: str):
-        workflow_columns = [
-            "Backlog",  # Assuming the initial column, verify this name
-            "Ready",
-            "Work in progress",
-            "Done"
-        ]
-
-        for i, column_name in enumerate(workflow_columns):
-            # or if the task is already in this column
-            if i == 0 and column_name == "Backlog":  # Adjust "Backlog" to your actual starting column
-                # Verify task is in the starting column before any moves
-                starting_column_locator = self.get_column_locator_by_name(column_name)
-                expect(starting_column_locator.get_by_text(title)).to_be_visible(timeout=SMALL_TIMEOUT)
-                print(f"Task '{title}' confirmed in starting column '{column_name}'.")
-                continue
+        workflow_columns = list(BOARD_COLUMNS)  # Backlog, Ready, Work in progress, Done
 
-            with allure.step(f"Step: Moving to '{column_name}'"):
-                # Get the source column (the one the task is currently in)
-                source_column_name = workflow_columns[
-                    i - 1] if i > 0 else "Backlog"  # Adjust if "Backlog" is not always the first
-                source_column_locator = self.get_column_locator_by_name(source_column_name)
-                source_column_locator.get_by_text(title)
+        # Verify task is in the starting column before any moves
+        starting_column_locator = self.get_column_locator_by_name(workflow_columns[0])
+        expect(starting_column_locator.get_by_text(title)).to_be_visible(timeout=SMALL_TIMEOUT)
+        print(f"Task '{title}' confirmed in starting column '{workflow_columns[0]}'.")
 
-                # Get the target column (the one we want to move the task to)
+        for column_name in workflow_columns[1:]:
+            with allure.step(f"Step: Moving to '{column_name}'"):
                 target_column_locator = self.get_column_locator_by_name(column_name)
 
                 # Perform the move
-                self._move_task_single_step(title, column_name)
+                self._move_task_single_step(title, column_name, target_column_locator)
 
                 # Assertion to confirm placement in the new column
                 task_in_target_column = target_column_locator.get_by_text(title)
                 expect(task_in_target_column).to_be_visible(timeout=SMALL_TIMEOUT)
 
+    @allure.step("Moving task '{title}' to '{column_name}'")
+    def move_task(self, title: str, column_name: str):
+        """
+        Drags a task to another column of the first swimlane and waits until it is shown there.
+        """
+        target_column_locator = self.get_column_locator_by_name(column_name)
+        self._move_task_single_step(title, column_name, target_column_locator)
+        expect(target_column_locator.get_by_text(title)).to_be_visible(timeout=SMALL_TIMEOUT)
+
     # Assuming this is your drag and drop method
-    def _move_task_single_step(self, task_title: str, target_column_name: str):
+    def _move_task_single_step(self, task_title: str, target_column_name: str, target_drop_area=None):
         """
         Performs a single drag-and-drop operation for a task.
         This method needs to be robust.
         """
-        # Locate the task to drag
-        # Find the task title specifically within an active task card
-        task_card = self.page.locator(f".task-board-title a:text('{task_title}')").locator("..").locator("..")
+        # Locate the task to drag by its id on the board
+        task_card = self.get_task_card_locator(task_title)
 
         # Locate the target column's droppable area
-        target_drop_area = self.get_column_locator_by_name(target_column_name)
+        if target_drop_area is None:
+            target_drop_area = self.get_column_locator_by_name(target_column_name)
 
         expect(task_card).to_be_visible(timeout=SMALL_TIMEOUT)  # Ensure the task is visible before dragging
         expect(target_drop_area).to_be_visible(timeout=SMALL_TIMEOUT)  # Ensure the target is visible
 
-        # Perform the drag-and-drop operation
-        task_card.drag_to(target_drop_area)
+        self.drag_task_card(task_card, target_drop_area, f"Move '{task_title}' to '{target_column_name}'")
 
+    def drag_task_card(self, task_card: Locator, target_drop_area: Locator, action_description: str = "Move task"):
+        """
+        Drags an already located task card onto a drop area and waits until Kanboard has saved
+        the new position. Nothing is looked up, so timing this call measures only the move.
+        """
+        self.wait_for_response(lambda: task_card.drag_to(target_drop_area), BOARD_MOVE_ENDPOINT,
+                               action_description=action_description)
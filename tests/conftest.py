@@ -0,0 +1,11 @@
+import pytest
+from utilities.kanboard_stub import KanboardStubServer
+
+
+@pytest.fixture
+def stub_server():
+    """
+    An in-memory Kanboard JSON-RPC endpoint, for testing the API-based utilities without the container.
+    """
+    with KanboardStubServer() as server:
+        yield server
@@ -0,0 +1,73 @@
+import time
+import pytest
+import allure
+from utilities.api_client import KanboardApiClient, KanboardApiError
+
+
+@pytest.fixture
+def stub_client(stub_server):
+    client = KanboardApiClient(stub_server.url, "admin", "admin", batch_size=20)
+    yield client
+    client.close()
+
+
+@allure.feature("API Client")
+class TestApiClient:
+    def test_create_tasks_in_batches(self, stub_server, stub_client):
+        project_id = stub_client.create_project("Batch project")
+        titles = [f"Task {i}" for i in range(50)]
+
+        task_ids = stub_client.create_tasks(project_id, titles, "Created through the API")
+
+        assert len(task_ids) == 50
+        assert [stub_server.tasks[task_id]["title"] for task_id in task_ids] == titles
+        # 1 createProject + ceil(50 / 20) batches
+        assert stub_server.http_requests == 4
+
+    def test_connection_is_kept_alive(self, stub_server, stub_client):
+        project_ids = [stub_client.create_project(f"Project {i}") for i in range(5)]
+        stub_client.remove_projects(project_ids)
+
+        assert stub_server.connections == 1
+        assert stub_server.projects == {}
+
+    def test_move_task_to_column_by_title(self, stub_server, stub_client):
+        project_id = stub_client.create_project("Move project")
+        task_id = stub_client.create_task(project_id, "Movable task")
+        columns = stub_client.get_columns(project_id)
+
+        assert list(columns) == ["Backlog", "Ready", "Work in progress", "Done"]
+        assert stub_client.move_task(project_id, task_id, columns["Done"])
+        assert stub_server.tasks[task_id]["column_id"] == str(columns["Done"])
+
+    def test_failures_raise(self, stub_client):
+        with pytest.raises(KanboardApiError, match="createTask"):
+            stub_client.create_task(999, "Task in a missing project")
+        with pytest.raises(KanboardApiError, match="Method not found"):
+            stub_client.call("notAnApiMethod")
+
+    def test_batch_removal_reports_failures(self, stub_server, stub_client, caplog):
+        project_id = stub_client.create_project("Removed project")
+
+        assert stub_client.remove_projects([project_id, 999]) == [True, False]
+        assert "'removeProject' returned false for 1 of 2: [999]" in caplog.text
+
+    def test_calls_dropped_in_flight_are_retried_only_when_idempotent(self, stub_server, stub_client):
+        stub_server.drop_responses = 1
+        with pytest.raises(ConnectionError):
+            stub_client.create_project("Created once")
+        # Kanboard executed the request; sending it again would have created a duplicate
+        assert [project["name"] for project in stub_server.projects.values()] == ["Created once"]
+
+        stub_server.drop_responses = 1
+        assert [project["name"] for project in stub_client.get_all_projects()] == ["Created once"]
+
+    def test_connection_closed_while_idle_is_replaced(self, stub_server, stub_client):
+        stub_server.close_idle = True
+        stub_client.create_project("First project")
+        stub_server.close_idle = False
+        time.sleep(0.1)
+
+        stub_client.create_project("Second project")
+
+        assert len(stub_server.projects) == 2 and stub_server.connections == 2
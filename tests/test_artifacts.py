@@ -0,0 +1,83 @@
+import struct
+import zlib
+
+import allure
+import pytest
+from utilities.artifacts import ArtifactStore
+
+
+def _store(tmp_path, **kwargs) -> ArtifactStore:
+    # PNG frames that need no resizing are stored as they are, so the stored size equals the input size
+    return ArtifactStore(root=tmp_path, image_format="png", **{"max_width": 0, **kwargs})
+
+
+def _chunk(kind: bytes, body: bytes) -> bytes:
+    return struct.pack(">I", len(body)) + kind + body + struct.pack(">I", zlib.crc32(kind + body))
+
+
+def _frame(index: int, size: int = 1000, width: int = 4) -> bytes:
+    """
+    A valid one-row RGB PNG of `size` bytes, padded with a text chunk; `index` sets the pixel colour.
+    """
+    header = b"\x89PNG\r\n\x1a\n" + _chunk(b"IHDR", struct.pack(">IIBBBBB", width, 1, 8, 2, 0, 0, 0))
+    pixels = _chunk(b"IDAT", zlib.compress(b"\x00" + index.to_bytes(3, "big") * width))
+    end = _chunk(b"IEND", b"")
+    padding = size - len(header) - len(pixels) - len(end) - len(_chunk(b"tEXt", b"frame\x00"))
+    return header + _chunk(b"tEXt", b"frame\x00" + b"x" * padding) + pixels + end
+
+
+@allure.feature("Artifact Store")
+class TestArtifactStore:
+    def test_identical_frames_are_stored_once(self, tmp_path):
+        store = _store(tmp_path)
+
+        first = store.put(_frame(1))
+        second = store.put(_frame(1))
+        store.close()
+
+        assert first is second
+        assert store.counters["stored"] == 1 and store.counters["deduplicated"] == 1
+        assert first.path.exists() and first.path.parent.parent == tmp_path
+
+    def test_budgets_evict_the_oldest_unpinned_frames(self, tmp_path):
+        store = _store(tmp_path, test_budget=3000, run_budget=5000)
+        store.start_test("test_a")
+        failure = store.put(_frame(0), pinned=True)
+        test_a = [store.put(_frame(i)) for i in range(1, 5)]
+        store.start_test("test_b")
+        test_b = [store.put(_frame(i)) for i in range(5, 8)]
+        store.close()
+
+        # test_a kept its failure frame and its 2 newest frames; the run budget then evicted one more
+        assert failure.path.exists()
+        assert [artifact.path.exists() for artifact in test_a] == [False, False, False, True]
+        assert all(artifact.path.exists() for artifact in test_b)
+        assert store.stored_bytes() == 5000
+
+    def test_discard_keeps_linked_frames(self, tmp_path):
+        store = _store(tmp_path)
+        linked, unlinked = store.put(_frame(1)), store.put(_frame(2))
+        store.link(linked, "Clicked_Save")
+
+        store.discard([linked, unlinked])
+        store.close()
+
+        assert linked.path.exists() and not unlinked.path.exists()
+        assert store.uri(linked).startswith("file://")
+
+    def test_png_frames_within_max_width_are_stored_unchanged(self, tmp_path):
+        store = _store(tmp_path, max_width=1280)
+
+        artifact = store.put(_frame(1, width=1280))
+        store.close()
+
+        assert artifact.path.read_bytes() == _frame(1, width=1280)
+
+    def test_wider_frames_are_downsized(self, tmp_path):
+        image = pytest.importorskip("PIL.Image")
+        store = _store(tmp_path, max_width=100)
+
+        artifact = store.put(_frame(1, size=8000, width=400))
+        store.close()
+
+        assert image.open(artifact.path).size == (100, 1)
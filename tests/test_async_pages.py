@@ -0,0 +1,62 @@
+"""
+Keeps the async page objects in step with the sync ones, as far as that can be checked offline:
+the same public methods with the same parameters, and the same locators. The flows behind the
+methods (which steps run, in which order, which responses are awaited) are not compared, so a
+change to a sync flow must be mirrored in pages/async_pages.py by hand.
+"""
+import inspect
+import allure
+import pytest
+from pages.async_pages import (AsyncBasePage, AsyncLoginPage, AsyncProjectDashboardPage, AsyncProjectPage,
+                               AsyncTaskPage)
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+from pages.project_dashboard_page import ProjectDashboardPage
+from pages.project_page import ProjectPage
+from pages.task_page import TaskPage
+
+PAGE_PAIRS = [(BasePage, AsyncBasePage), (LoginPage, AsyncLoginPage), (ProjectPage, AsyncProjectPage),
+              (ProjectDashboardPage, AsyncProjectDashboardPage), (TaskPage, AsyncTaskPage)]
+# SQL profiling attributes database work to one action at a time, which concurrent sessions would blur
+SYNC_ONLY = {"profile_sql"}
+
+
+class _RecordingPage:
+    """
+    Stands in for a Playwright page: records the chain of calls that built each locator.
+    """
+
+    def __init__(self, calls=()):
+        self.calls = calls
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: _RecordingPage(self.calls + ((name, args, tuple(kwargs.items())),))
+
+    def __eq__(self, other):
+        return isinstance(other, _RecordingPage) and self.calls == other.calls
+
+
+def _public_methods(cls) -> dict:
+    return {name: method for name, method in inspect.getmembers(cls, inspect.isfunction)
+            if not name.startswith("_") and name not in SYNC_ONLY}
+
+
+@allure.feature("Async Page Objects")
+class TestAsyncPages:
+    @pytest.mark.parametrize("sync_page, async_page", PAGE_PAIRS, ids=lambda cls: cls.__name__)
+    def test_every_sync_action_has_an_async_counterpart(self, sync_page, async_page):
+        async_methods = _public_methods(async_page)
+
+        for name, method in _public_methods(sync_page).items():
+            assert name in async_methods, f"{async_page.__name__} is missing '{name}'"
+            assert inspect.iscoroutinefunction(async_methods[name]), f"{async_page.__name__}.{name} is not async"
+            assert (list(inspect.signature(async_methods[name]).parameters)
+                    == list(inspect.signature(method).parameters)), f"'{name}' parameters differ"
+
+    @pytest.mark.parametrize("sync_page, async_page", PAGE_PAIRS, ids=lambda cls: cls.__name__)
+    def test_sync_and_async_pages_build_the_same_locators(self, sync_page, async_page):
+        sync_locators = {name: value for name, value in vars(sync_page(_RecordingPage())).items() if name != "page"}
+        async_locators = {name: value for name, value in vars(async_page(_RecordingPage())).items()
+                          if name not in ("page", "label")}
+
+        assert async_locators == sync_locators
@@ -0,0 +1,52 @@
+import pytest
+import allure
+from utilities.benchmark import BaselineStore, BenchmarkStats, MissingBaselineWarning, benchmark, check_regression
+from utilities.database import get_query_recorder
+
+
+@allure.feature("Benchmark Harness")
+class TestBenchmark:
+    def test_statistics_reject_outliers(self):
+        samples_ns = [10_000_000] * 19 + [900_000_000]
+
+        stats = BenchmarkStats.from_samples("stable", samples_ns)
+
+        assert stats.rejected == 1
+        assert stats.samples == 19
+        assert stats.median == stats.p99 == pytest.approx(0.01)
+        assert stats.stddev == 0
+
+    def test_decorator_runs_warmup_and_repetitions(self, tmp_path):
+        calls = []
+
+        @benchmark("counted", warmup=2, repetitions=5, baselines=BaselineStore(tmp_path / "baselines.json"))
+        def work():
+            calls.append(1)
+            return len(calls)
+
+        with pytest.warns(MissingBaselineWarning, match="No baseline"):
+            assert work() == 7
+        assert len(calls) == 7
+
+    def test_regression_against_baseline(self, tmp_path):
+        baselines = BaselineStore(tmp_path / "baselines.json")
+        fast = BenchmarkStats.from_samples("query", [10_000_000] * 10)
+        slow = BenchmarkStats.from_samples("query", [20_000_000] * 10)
+
+        with pytest.warns(MissingBaselineWarning, match="No baseline"):
+            check_regression("query", fast, tolerance=0.5, baselines=baselines)  # records the baseline
+        check_regression("query", fast, tolerance=0.5, baselines=baselines)
+        with pytest.raises(AssertionError, match="regression"):
+            check_regression("query", slow, tolerance=0.5, baselines=baselines)
+
+    def test_slow_queries_are_not_explained_while_timed(self, tmp_path, monkeypatch):
+        recorder = get_query_recorder()
+        monkeypatch.setattr(recorder, "explain", True)
+
+        @benchmark("explain", warmup=0, repetitions=1, baselines=BaselineStore(tmp_path / "baselines.json"))
+        def work():
+            return recorder.explain
+
+        with pytest.warns(MissingBaselineWarning):
+            assert work() is False
+        assert recorder.explain is True
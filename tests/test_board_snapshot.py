@@ -0,0 +1,73 @@
+import allure
+import pytest
+from pages.board_model import _BOARD_SCRIPT, BoardModel, BoardSnapshot, TaskCard
+from pages.task_page import TaskPage
+
+_BOARD = {
+    "columns": [{"id": 1, "title": "Backlog", "position": 1}, {"id": 4, "title": "Done", "position": 2}],
+    "swimlanes": [{"id": 1, "name": "Default swimlane", "position": 1}],
+    "dropAreas": [],
+}
+
+
+def _snapshot(*tasks: tuple[int, str, str]) -> BoardSnapshot:
+    return BoardSnapshot(BoardModel.from_data(_BOARD),
+                         [TaskCard(id=task_id, title=title, column=column, swimlane="Default swimlane", position=1)
+                          for task_id, title, column in tasks])
+
+
+class _Selector(str):
+    # Locators are chained while a page object is built; only the selector is of interest
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self
+
+
+class _CardPage:
+    """
+    Stands in for a Playwright page showing one task card with id 42.
+    """
+
+    def __init__(self):
+        self.scripts = []
+
+    def evaluate(self, script, arg=None):
+        self.scripts.append(script)
+        return 42 if arg == "Fix login" else None
+
+    def locator(self, selector):
+        return _Selector(selector)
+
+    def get_by_role(self, *args, **kwargs):
+        return _Selector("")
+
+
+@allure.feature("Board Snapshot")
+class TestBoardSnapshot:
+    def test_assert_contains_reports_every_missing_title(self):
+        board = _snapshot((1, "A", "Backlog"), (2, "B", "Done"))
+
+        board.assert_contains(["A", "B"])
+        with pytest.raises(AssertionError, match=r"2 of 3 tasks are missing from column 'Backlog': \['B', 'C'\]"):
+            board.assert_contains(["A", "B", "C"], column="Backlog")
+
+    def test_diff_finds_added_removed_and_moved_tasks(self):
+        before = _snapshot((1, "A", "Backlog"), (2, "B", "Backlog"))
+        after = _snapshot((1, "A", "Done"), (3, "C", "Backlog"))
+
+        diff = before.diff(after)
+
+        assert [task.title for task in diff.added] == ["C"]
+        assert [task.title for task in diff.removed] == ["B"]
+        assert [(old.column, new.column) for old, new in diff.moved] == [("Backlog", "Done")]
+        _snapshot((1, "A", "Backlog")).diff(_snapshot((1, "A", "Done"))).assert_moved("A", "Done")
+        with pytest.raises(AssertionError):
+            diff.assert_moved("A", "Done")
+
+    def test_task_card_is_located_by_id_without_a_board_snapshot(self):
+        page = _CardPage()
+        task_page = TaskPage(page)
+
+        assert task_page.get_task_card_locator("Fix login") == '.task-board[data-task-id="42"]'
+        with pytest.raises(ValueError, match="Could not find task 'Missing'"):
+            task_page.get_task_card_locator("Missing")
+        assert _BOARD_SCRIPT not in page.scripts
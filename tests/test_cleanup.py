@@ -0,0 +1,62 @@
+import time
+
+import allure
+import pytest
+from utilities.api_client import KanboardApiClient
+from utilities.cleanup import ApiCleanupBackend, CleanupRegistry
+from utilities.kanboard_stub import KanboardStubServer
+
+
+def _registry(server: KanboardStubServer, background: bool = False) -> CleanupRegistry:
+    return CleanupRegistry(method="api", background=background, backend_factory=lambda: ApiCleanupBackend(
+        KanboardApiClient(server.url, "admin", "admin")))
+
+
+@allure.feature("Test Data Cleanup")
+class TestCleanup:
+    @pytest.mark.parametrize("background", [False, True])
+    def test_registered_projects_are_deleted_in_one_batch(self, stub_server, background):
+        client = KanboardApiClient(stub_server.url, "admin", "admin")
+        project_ids = client.create_projects([f"QA-run1-gw0-{i:05d} Project" for i in range(10)])
+        keep = client.create_project("Not registered")
+        client.close()
+        requests_before = stub_server.http_requests
+
+        registry = _registry(stub_server, background)
+        for project_id in project_ids:
+            registry.register_project(project_id)
+        registry.flush()
+        registry.close()
+
+        assert list(stub_server.projects) == [keep]
+        assert stub_server.http_requests - requests_before == 1
+        assert registry.deleted["projects"] == 10 and registry.errors == 0
+
+    def test_only_confirmed_deletions_are_counted(self, stub_server):
+        client = KanboardApiClient(stub_server.url, "admin", "admin")
+        project_ids = client.create_projects([f"QA-run1-gw0-{i:05d} Project" for i in range(3)])
+        # Deleted by the test itself, so Kanboard has nothing left to remove
+        client.remove_project(project_ids[0])
+        client.close()
+
+        registry = _registry(stub_server)
+        for project_id in project_ids:
+            registry.register_project(project_id)
+        registry.close()
+
+        assert stub_server.projects == {}
+        assert registry.deleted["projects"] == 2 and registry.errors == 0
+
+    def test_orphan_sweep_spares_the_current_run_and_recent_projects(self, stub_server):
+        client = KanboardApiClient(stub_server.url, "admin", "admin")
+        own, orphan, recent, foreign = client.create_projects(
+            ["QA-run1-gw0-00001 Own", "QA-old-gw1-00001 Orphan", "QA-other-gw0-00001 Recent", "Production project"])
+        client.close()
+        for project in stub_server.projects.values():
+            if int(project["id"]) != recent:
+                project["last_modified"] = str(int(time.time()) - 7200)
+
+        swept = _registry(stub_server).sweep_orphans(min_age=3600, run_id="run1")
+
+        assert swept == 1
+        assert sorted(stub_server.projects) == sorted([own, recent, foreign])
@@ -0,0 +1,79 @@
+import asyncio
+import secrets
+from pathlib import Path
+
+import allure
+import pytest
+from config.config import Config
+from pages.async_pages import AsyncProjectDashboardPage, AsyncTaskPage
+from utilities.data_factory import get_factory
+from utilities.helpers import run_async
+from utilities.load import BrowserSession
+from utilities.login_cache import LoginCache
+
+NUM_USERS = 3
+
+
+async def _open_board(session: BrowserSession, label: str, project_id: int, storage_state: Path):
+    # Every user starts from their own cached login instead of filling in the login form
+    context = await session.browser.new_context(storage_state=storage_state)
+    page = await context.new_page()
+    await AsyncProjectDashboardPage(page, label).open_board(project_id)
+    return page
+
+
+async def _collaborate(project_id: int, titles: list[str], storage_states: list[Path]):
+    session = BrowserSession()
+    await session.start()
+    try:
+        pages = await asyncio.gather(*(_open_board(session, f"user{i}", project_id, storage_state)
+                                       for i, storage_state in enumerate(storage_states)))
+        # Every user adds a task to the same board at the same time
+        await asyncio.gather(*(AsyncTaskPage(page, f"user{i}").create_task(title)
+                               for i, (page, title) in enumerate(zip(pages, titles))))
+        await asyncio.gather(*(page.reload() for page in pages))
+        return await asyncio.gather(*(AsyncTaskPage(page).snapshot_board() for page in pages))
+    finally:
+        await session.close()
+
+
+@allure.feature("Collaboration")
+class TestCollaboration:
+    @pytest.mark.skipif(not Config.COLLABORATION_TEST, reason="Set COLLABORATION_TEST=true to run the collaboration test")
+    def test_concurrent_users_see_each_others_tasks(self, page, login_cache, api_client, cleanup):
+        factory = get_factory()
+        project_id = api_client.create_project(factory.project_name())
+        cleanup.register_project(project_id)
+        titles = factory.task_titles(NUM_USERS)
+        # The admin plus NUM_USERS - 1 project members, each with a browser login of their own
+        logins = [login_cache]
+        user_ids = []
+        try:
+            with allure.step(f"Create {NUM_USERS - 1} project members"):
+                for i in range(1, NUM_USERS):
+                    username, password = f"{factory.unique_prefix()}-user{i}".lower(), secrets.token_urlsafe(12)
+                    user_ids.append(api_client.create_user(username, password))
+                    api_client.add_project_user(project_id, user_ids[-1])
+                    logins.append(LoginCache(login_cache.state_path.parent, login_cache.app_url, username, password,
+                                             max_age=login_cache.max_age))
+
+            with allure.step("Log in once for every user"):
+                for login in logins:
+                    page.context.clear_cookies()
+                    login.authenticate(page)
+
+            with allure.step(f"{NUM_USERS} users add a task to the same board concurrently"):
+                boards = run_async(_collaborate(project_id, titles, [login.state_path for login in logins]))
+
+            with allure.step("Every user sees every task"):
+                for board in boards:
+                    board.assert_contains(titles, column="Backlog")
+
+            with allure.step("Every task was created by a different user"):
+                tasks = api_client.call("getAllTasks", project_id=project_id, status_id=1)
+                assert len({task["creator_id"] for task in tasks if task["title"] in titles}) == NUM_USERS
+        finally:
+            for login in logins[1:]:
+                login.invalidate()
+            for user_id in user_ids:
+                api_client.remove_user(user_id)
@@ -0,0 +1,29 @@
+import allure
+from utilities.data_factory import DataFactory, RUN_PREFIX
+
+
+@allure.feature("Test Data Factory")
+class TestDataFactory:
+    def test_names_are_unique_across_workers(self):
+        workers = [DataFactory(run_id="run1", worker_id=f"gw{i}", seed=7) for i in range(4)]
+
+        names = [name for factory in workers for name in factory.project_names(500) + factory.task_titles(500)]
+
+        assert len(set(names)) == len(names)
+        assert all(name.startswith(f"{RUN_PREFIX}run1-gw") for name in names)
+
+    def test_seeded_factories_are_reproducible(self):
+        first = DataFactory(run_id="run1", worker_id="gw0", seed=42)
+        second = DataFactory(run_id="run1", worker_id="gw0", seed=42)
+
+        assert first.task_titles(20) == second.task_titles(20)
+        assert first.description() == second.description()
+
+    def test_faker_is_loaded_only_for_rich_text(self):
+        factory = DataFactory(run_id="run1", worker_id="gw0", seed=1)
+        factory.project_name()
+        factory.description()
+        assert factory._faker is None
+
+        assert factory.description(rich=True).startswith("Description: ")
+        assert factory._faker is not None
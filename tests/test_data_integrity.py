@@ -7,7 +7,7 @@ from utilities.helpers import generate_project_name, generate_task_title, genera
 @allure.feature("Data Integrity")
 class TestDataIntegrity:
     @pytest.mark.usefixtures("login")
-    def test_project_deletion(self, page, db_connection):
+    def test_project_deletion(self, page, db_assertions, cleanup):
         project_name = generate_project_name()
         task_title = generate_task_title()
         task_description = generate_description()
@@ -22,25 +22,19 @@ class TestDataIntegrity:
             project_page.create_project(project_name)
             project_id = project_page.get_project_id_from_url()
             assert project_id is not None, f"Failed to get project ID from URL for '{project_name}'"
+            # Deletion is what this test verifies, so it stays in the UI; the registration
+            # only removes the project if the test fails before getting there
+            cleanup.register_project(project_id)
 
             project_dashboard_page.navigate_to_board_view(project_id)
 
             allure.attach(f"Creating task '{task_title}' with description '{task_description}'", )
             task_page.create_task(task_title, task_description)
             expect(page.get_by_text(task_title)).to_be_visible()
-            query = "SELECT COUNT(*) FROM tasks WHERE project_id = %s"
-            initial_count = db_connection.fetch_one(query, (project_id,))[0]
-            assert initial_count == 1
+            db_assertions.task_count(project_id, 1).verify()
 
         with allure.step("Delete project and verify cleanup"):
             project_page.delete_project(int(project_id))
 
-            # Verify project is deleted
-            query = "SELECT COUNT(*) FROM projects WHERE name = %s"
-            project_count = db_connection.fetch_one(query, (project_name,))[0]
-            assert project_count == 0
-
-            # Verify tasks are deleted
-            query = "SELECT COUNT(*) FROM tasks WHERE project_id = %s"
-            task_count = db_connection.fetch_one(query, (project_id,))[0]
-            assert task_count == 0
\ No newline at end of file
+            # One query, so both checks see the same database state
+            db_assertions.project_count(project_name, 0).task_count(project_id, 0).verify()
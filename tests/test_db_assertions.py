@@ -0,0 +1,85 @@
+import allure
+import psycopg2
+import pytest
+from utilities.database import Database, DbAssertions, QueryRecorder, _is_plain_read
+
+
+class _FakeCursor:
+    def __init__(self, statements: list[str], fail_on: str | None):
+        self.statements = statements
+        self.fail_on = fail_on
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, query, params=()):
+        self.statements.append(query)
+        if self.fail_on and query.startswith(self.fail_on):
+            raise psycopg2.Error("canceling statement due to statement timeout")
+
+    def fetchall(self):
+        return [("Seq Scan on tasks",)]
+
+
+class _FakeConnection:
+    autocommit = False
+
+    def __init__(self, fail_on: str | None = None):
+        self.statements = []
+        self.fail_on = fail_on
+
+    def cursor(self):
+        return _FakeCursor(self.statements, self.fail_on)
+
+
+@allure.feature("Database Assertions")
+class TestDbAssertions:
+    def test_checks_are_bundled_into_one_cte_query(self):
+        checks = DbAssertions(db=None).project_count("QA-1 Project", 0).task_count("7", 0).task_active("Fix", 7)
+
+        query, params = checks.build_query()
+
+        assert query == ("WITH c0(value) AS (SELECT COUNT(*) FROM projects WHERE name = %s), "
+                         "c1(value) AS (SELECT COUNT(*) FROM tasks WHERE project_id = %s), "
+                         "c2(value) AS (SELECT is_active FROM tasks WHERE title = %s AND project_id = %s) "
+                         "SELECT (SELECT value FROM c0), (SELECT value FROM c1), (SELECT value FROM c2)")
+        assert params == ("QA-1 Project", 7, "Fix", 7)
+
+    def test_query_latencies_are_summarized_per_query(self):
+        recorder = QueryRecorder(explain=False)
+        for elapsed in (0.002, 0.004):
+            recorder.record(None, "SELECT COUNT(*)\n  FROM tasks WHERE project_id = %s", (1,), elapsed)
+        recorder.record(None, "SELECT 1", None, 0.001)
+
+        summary = recorder.summary()
+
+        assert [entry["query"] for entry in summary] == ["SELECT COUNT(*) FROM tasks WHERE project_id = %s",
+                                                         "SELECT 1"]
+        assert summary[0]["count"] == 2 and summary[0]["max_ms"] == 4.0
+
+    @pytest.mark.parametrize("query, plain", [
+        ("SELECT COUNT(*) FROM tasks WHERE project_id = %s", True),
+        ("WITH c0(value) AS (SELECT 1) SELECT value FROM c0", True),
+        ("WITH moved AS (UPDATE tasks SET column_id = 2 RETURNING id) SELECT COUNT(*) FROM moved", False),
+        ("SELECT nextval('tasks_id_seq')", False),
+        ("SELECT pg_advisory_xact_lock(42)", False),
+        ("SELECT id FROM tasks WHERE id = %s FOR UPDATE", False),
+        ("SELECT * INTO tasks_copy FROM tasks", False),
+        ("EXECUTE never_prepared(1)", False),
+        ("DELETE FROM tasks", False),
+    ])
+    def test_only_plain_reads_are_explained(self, query, plain):
+        assert _is_plain_read(query) is plain
+
+    def test_failed_explain_is_rolled_back_to_a_savepoint(self):
+        connection = _FakeConnection(fail_on="EXPLAIN")
+        recorder = QueryRecorder(slow_ms=1)
+
+        recorder.record(Database(connection=connection), "SELECT COUNT(*) FROM tasks", None, 0.5)
+
+        assert "plan" not in recorder.queries[0]
+        assert connection.statements[-3:] == ["EXPLAIN (ANALYZE, BUFFERS) SELECT COUNT(*) FROM tasks",
+                                              "ROLLBACK TO SAVEPOINT qa_explain", "RELEASE SAVEPOINT qa_explain"]
@@ -0,0 +1,117 @@
+import allure
+import psycopg2
+import pytest
+from utilities import database
+from utilities.database import DatabasePool
+
+
+class _FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, query, params=()):
+        if self.connection.dead:
+            # As psycopg2 does when the server has gone away
+            self.connection.closed = 2
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        if query.startswith("SELECT broken"):
+            raise psycopg2.errors.UndefinedTable('relation "broken" does not exist')
+        self.connection.statements.append(query)
+
+    def fetchone(self):
+        return (self.connection.name,)
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeConnection:
+    autocommit = False
+
+    def __init__(self, name: str, dead: bool = False):
+        self.name = name
+        self.dead = dead
+        self.closed = 0
+        self.statements = []
+        self.rollbacks = 0
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class _FakeThreadedPool:
+    """
+    Stands in for psycopg2's ThreadedConnectionPool, handing out the given connections in order.
+    """
+    connections: list[_FakeConnection] = []
+
+    def __init__(self, minconn, maxconn, **db_config):
+        self.idle = list(self.connections)
+        self.returned = []
+
+    def getconn(self):
+        return self.idle.pop(0)
+
+    def putconn(self, connection, close=False):
+        self.returned.append((connection.name, close))
+
+    def closeall(self):
+        pass
+
+
+@pytest.fixture
+def pool_of(monkeypatch):
+    def pool_of(*connections: _FakeConnection) -> DatabasePool:
+        monkeypatch.setattr(_FakeThreadedPool, "connections", list(connections))
+        monkeypatch.setattr(database, "ThreadedConnectionPool", _FakeThreadedPool)
+        return DatabasePool()
+
+    return pool_of
+
+
+@allure.feature("Database Pool")
+class TestDbPool:
+    def test_broken_connections_are_replaced_when_handed_out(self, pool_of):
+        pool = pool_of(_FakeConnection("dead", dead=True), _FakeConnection("fresh"))
+
+        db = pool.acquire()
+
+        assert db.connection.name == "fresh"
+        assert pool._pool.returned == [("dead", True)]
+
+    def test_query_on_a_dropped_connection_is_retried_on_a_new_one(self, pool_of):
+        dropped = _FakeConnection("dropped")
+        pool = pool_of(dropped, _FakeConnection("fresh"))
+        db = pool.acquire()
+        dropped.dead = True
+
+        assert db.fetch_one("SELECT 1") == ("fresh",)
+        assert pool._pool.returned == [("dropped", True)]
+
+    def test_sql_errors_on_a_live_connection_are_not_retried(self, pool_of):
+        pool = pool_of(_FakeConnection("live"), _FakeConnection("spare"))
+        db = pool.acquire()
+
+        with pytest.raises(psycopg2.errors.UndefinedTable):
+            db.fetch_one("SELECT broken")
+        assert db.connection.name == "live"
+
+    def test_released_connections_are_rolled_back_and_returned(self, pool_of):
+        connection = _FakeConnection("used")
+        pool = pool_of(connection)
+        db = pool.acquire()
+
+        db.close()
+
+        assert connection.rollbacks == 2  # the health check's and the release's
+        assert pool._pool.returned == [("used", False)]
@@ -0,0 +1,28 @@
+import allure
+from utilities.database import DatabaseSeeder, _CsvStream
+
+
+@allure.feature("Database Seeding")
+class TestDbSeeder:
+    def test_csv_stream_escapes_values_for_copy(self):
+        rows = [(1, "tab\there", "two\nlines", "back\\slash", 'say "hi"', "", None, True)]
+
+        assert _CsvStream(rows).read() == b'1,"tab\there","two\nlines","back\\slash","say ""hi""","",,True\n'
+
+    def test_csv_stream_reads_in_chunks_of_any_size(self):
+        rows = [(n, f"Task {n}", None) for n in range(100)]
+        stream = _CsvStream(rows)
+
+        chunks = iter(lambda: stream.read(7), b"")
+
+        assert b"".join(chunks) == _CsvStream(rows).read()
+        assert stream.read(7) == b""
+
+    def test_task_rows_spread_round_robin_over_every_cell(self):
+        rows = list(DatabaseSeeder._task_rows([11, 12, 13, 14, 15], project_id=3, column_ids=[1, 2],
+                                              swimlane_ids=[7, 8], title_prefix="QA", description="", now=0))
+
+        assert [row[1] for row in rows] == ["QA 1", "QA 2", "QA 3", "QA 4", "QA 5"]
+        # (column, swimlane, position in that cell)
+        assert [(row[8], row[9], row[10]) for row in rows] == [(1, 7, 1), (2, 7, 1), (1, 8, 1), (2, 8, 1), (1, 7, 2)]
+        assert {row[7] for row in rows} == {3}
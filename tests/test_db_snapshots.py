@@ -0,0 +1,192 @@
+import os
+import threading
+import uuid
+
+import allure
+import psycopg2
+import pytest
+from config.config import Config, DB_CONFIG
+from utilities.data_factory import get_factory
+from psycopg2 import sql
+from utilities.database import (BASE_SNAPSHOT, SNAPSHOT_PREFIX, Database, DatabaseSeeder, DatabaseSnapshots,
+                                _snapshot_database)
+
+
+def _count(query: str, params=None) -> int:
+    # A connection of its own: restoring a snapshot terminates every session on the Kanboard database
+    db = Database()
+    try:
+        return db.fetch_one(query, params)[0]
+    finally:
+        db.close()
+
+
+def _render(statement) -> str:
+    # sql.Composed.as_string needs a live connection
+    if isinstance(statement, sql.Composed):
+        return "".join(_render(part) for part in statement.seq)
+    if isinstance(statement, sql.Identifier):
+        return ".".join(statement.strings)
+    return statement.string if isinstance(statement, sql.SQL) else statement
+
+
+class _RecordingSnapshots(DatabaseSnapshots):
+    """
+    Records the admin statements instead of running them; `fail_on` raises for the matching statement.
+    """
+
+    def __init__(self, fail_on: str | None = None):
+        super().__init__(db_config={**DB_CONFIG, "database": "kanboard"})
+        self.statements = []
+        self.fail_on = fail_on
+
+    def _admin_execute(self, statement, params=None):
+        self.statements.append(_render(statement))
+        if self.fail_on and self.statements[-1].startswith(self.fail_on):
+            raise psycopg2.errors.DiskFull("could not write to file")
+
+    def _admin_query(self, query, params=None):
+        return [(1,)] if "FROM pg_database" in query else []
+
+
+@pytest.fixture
+def snapshots(db_snapshots):
+    if int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1")) > 1:
+        pytest.skip("The snapshot integration tests replace the database shared by all xdist workers; run them without -n")
+    yield db_snapshots
+    # Leaves Kanboard as every db_snapshot test starts it
+    db_snapshots.restore(BASE_SNAPSHOT)
+
+
+@allure.feature("Database Snapshots")
+class TestDbSnapshots:
+    def test_snapshot_names_map_to_valid_database_names(self):
+        long_name = "board with every column, swimlane and subtask we have ever needed " * 2
+
+        assert _snapshot_database("10k-task board") == "qa_snapshot_10k_task_board"
+        assert _snapshot_database("Base") == _snapshot_database("base")
+        assert len(_snapshot_database(long_name)) <= 63
+        assert _snapshot_database(long_name) != _snapshot_database(long_name + "!")
+        assert _snapshot_database(long_name).startswith(SNAPSHOT_PREFIX)
+
+    def test_restore_swaps_in_a_complete_copy(self):
+        snapshots = _RecordingSnapshots()
+
+        snapshots._replace_database("qa_snapshot_base")
+
+        assert snapshots.statements == [
+            "DROP DATABASE IF EXISTS qa_restore_kanboard WITH (FORCE)",
+            "DROP DATABASE IF EXISTS qa_retired_kanboard WITH (FORCE)",
+            "CREATE DATABASE qa_restore_kanboard TEMPLATE qa_snapshot_base",
+            "ALTER DATABASE kanboard RENAME TO qa_retired_kanboard",
+            "ALTER DATABASE qa_restore_kanboard RENAME TO kanboard",
+            "DROP DATABASE IF EXISTS qa_retired_kanboard WITH (FORCE)",
+        ]
+
+    def test_failed_copy_leaves_the_live_database_in_place(self):
+        snapshots = _RecordingSnapshots(fail_on="CREATE DATABASE")
+
+        with pytest.raises(psycopg2.errors.DiskFull):
+            snapshots._replace_database("qa_snapshot_base")
+
+        assert not any("kanboard RENAME" in statement or statement.endswith(" kanboard WITH (FORCE)")
+                       for statement in snapshots.statements)
+
+    def test_failed_swap_puts_the_live_database_back(self):
+        snapshots = _RecordingSnapshots(fail_on="ALTER DATABASE qa_restore_kanboard")
+
+        with pytest.raises(psycopg2.errors.DiskFull):
+            snapshots._replace_database("qa_snapshot_base")
+
+        assert snapshots.statements[-1] == "ALTER DATABASE qa_retired_kanboard RENAME TO kanboard"
+
+
+@allure.feature("Database Snapshots")
+@pytest.mark.skipif(not Config.DB_SNAPSHOT_TEST, reason="Set DB_SNAPSHOT_TEST=true to run the snapshot integration tests")
+class TestDbSnapshotsIntegration:
+    def test_base_snapshot_leaves_out_test_data(self, snapshots):
+        leftover = get_factory().project_name()
+        db = Database()
+        try:
+            DatabaseSeeder(db).seed_project(leftover, 3)
+        finally:
+            db.close()
+        snapshots.drop(BASE_SNAPSHOT)
+
+        snapshots.restore(BASE_SNAPSHOT)
+
+        assert _count("SELECT COUNT(*) FROM projects WHERE name = %s", (leftover,)) == 0
+
+    def test_restore_rolls_back_changes_made_after_capture(self, snapshots):
+        name = f"integration {uuid.uuid4().hex[:8]}"
+        snapshots.restore(BASE_SNAPSHOT)
+        marker = f"Snapshot marker {uuid.uuid4().hex[:8]}"
+        try:
+            snapshots.capture(name)
+            db = Database()
+            try:
+                DatabaseSeeder(db).seed_project(marker, 1)
+            finally:
+                db.close()
+            assert _count("SELECT COUNT(*) FROM projects WHERE name = %s", (marker,)) == 1
+
+            snapshots.restore(name)
+
+            assert _count("SELECT COUNT(*) FROM projects WHERE name = %s", (marker,)) == 0
+        finally:
+            snapshots.drop(name)
+
+    def test_builder_data_round_trips(self, snapshots):
+        name = f"integration board {uuid.uuid4().hex[:8]}"
+        snapshots.register(name, lambda db: {"project_id": DatabaseSeeder(db).seed_project(name, 12).project_id})
+        try:
+            built = snapshots.restore(name)
+            # Restoring again copies the stored template instead of running the builder
+            restored = snapshots.restore(name)
+
+            assert restored == built and set(built) == {"project_id"}
+            assert snapshots.snapshots()[name]["data"] == built
+            assert _count("SELECT COUNT(*) FROM tasks WHERE project_id = %s", (built["project_id"],)) == 12
+        finally:
+            snapshots.drop(name)
+
+    def test_copy_terminates_sessions_and_retries_while_they_reconnect(self, snapshots):
+        name = f"integration busy {uuid.uuid4().hex[:8]}"
+        snapshots.retries = 20
+        idle = psycopg2.connect(**DB_CONFIG)
+        stop = threading.Event()
+
+        def reconnect():
+            # Like Kanboard opening a new connection per request
+            while not stop.is_set():
+                try:
+                    connection = psycopg2.connect(**DB_CONFIG)
+                    try:
+                        with connection.cursor() as cursor:
+                            cursor.execute("SELECT 1")
+                    finally:
+                        connection.close()
+                except psycopg2.Error:
+                    pass  # Terminated by the copy, or refused while it runs
+
+        busy = threading.Thread(target=reconnect, daemon=True)
+        busy.start()
+        try:
+            snapshots.capture(name)
+
+            assert name in snapshots.snapshots()
+            with pytest.raises(psycopg2.OperationalError), idle.cursor() as cursor:
+                cursor.execute("SELECT 1")
+        finally:
+            stop.set()
+            busy.join()
+            idle.close()
+            snapshots.drop(name)
+
+    def test_failed_restore_keeps_the_kanboard_database(self, snapshots):
+        projects = _count("SELECT COUNT(*) FROM projects")
+
+        with pytest.raises(psycopg2.Error):
+            snapshots._replace_database(_snapshot_database(f"missing {uuid.uuid4().hex[:8]}"))
+
+        assert _count("SELECT COUNT(*) FROM projects") == projects
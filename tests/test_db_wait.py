@@ -0,0 +1,75 @@
+import allure
+import pytest
+from utilities import database
+from utilities.database import Database
+
+
+class _RowsCursor:
+    """
+    Returns the next of the given rows for every query.
+    """
+
+    def __init__(self, rows):
+        self.rows = iter(rows)
+        self.closed = False
+
+    def execute(self, query, params=()):
+        pass
+
+    def fetchone(self):
+        return next(self.rows)
+
+
+class _RowsConnection:
+    autocommit = False
+
+    def __init__(self, *rows):
+        self._cursor = _RowsCursor(rows)
+
+    def cursor(self):
+        return self._cursor
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(database.time, "sleep", sleeps.append)
+    return sleeps
+
+
+@allure.feature("Database Waits")
+class TestDbWait:
+    def test_polls_with_backoff_when_notifications_are_unavailable(self, monkeypatch, sleeps):
+        monkeypatch.setattr(database, "_get_listener", lambda: False)
+        db = Database(connection=_RowsConnection(None, None, None, (7,)))
+
+        assert db.wait_for_db_state("SELECT id FROM tasks WHERE title = %s", ("Fix",), timeout=10) == (7,)
+        assert sleeps == [0.05, 0.1, 0.2]
+
+    def test_use_notify_false_never_sets_up_a_listener(self, monkeypatch, sleeps):
+        monkeypatch.setattr(database, "_get_listener", lambda: pytest.fail("a listener was set up"))
+        db = Database(connection=_RowsConnection((False,), (True,)))
+
+        row = db.wait_for_db_state("SELECT is_active FROM tasks", predicate=lambda row: row[0] is True,
+                                   timeout=10, use_notify=False)
+
+        assert row == (True,) and sleeps == [0.05]
+
+    def test_times_out_with_the_last_row(self, monkeypatch, sleeps):
+        monkeypatch.setattr(database, "_get_listener", lambda: False)
+        db = Database(connection=_RowsConnection(None))
+
+        with pytest.raises(TimeoutError, match="Last row: None"):
+            db.wait_for_db_state("SELECT 1", timeout=0)
+
+    def test_notification_waits_are_capped_like_polling(self, monkeypatch):
+        waits = []
+        monkeypatch.setattr(database, "_get_listener", lambda: object())
+        monkeypatch.setattr(database, "_drain_notifications", lambda listener: None)
+        monkeypatch.setattr(database, "_wait_for_notification", lambda listener, timeout: waits.append(timeout))
+        db = Database(connection=_RowsConnection(None, None, (1,)))
+
+        db.wait_for_db_state("SELECT 1", timeout=10)
+
+        # Triggers dropped by another run mean no NOTIFY ever comes: the wait must not last the whole timeout
+        assert waits == [0.05, 0.1]
@@ -0,0 +1,73 @@
+import json
+import allure
+import pytest
+from utilities import fixture_profiler
+from utilities.fixture_profiler import merge_fixtures, merge_steps, parse_importtime
+
+
+@allure.feature("Fixture Profiler")
+class TestFixtureProfiler:
+    def test_import_time_is_summed_per_top_level_package(self):
+        output = "\n".join([
+            "import time: self [us] | cumulative | imported package",
+            "import time:      2000 |       2000 |     psycopg2._psycopg",
+            "import time:      1000 |       3000 |   psycopg2",
+            "import time:       500 |        500 |   allure_commons",
+            "import time:       250 |       3750 | conftest",
+        ])
+
+        assert parse_importtime(output) == {"psycopg2": 0.003, "allure_commons": 0.0005, "conftest": 0.00025}
+
+    def test_fixtures_are_ranked_over_all_workers(self):
+        def profile(browser_setup: float, login_setup: float) -> dict:
+            return {"fixtures": {
+                "browser_pool": {"scope": "session", "count": 1, "setup": browser_setup, "teardown": 0.5,
+                                 "max": browser_setup + 0.5},
+                "login": {"scope": "function", "count": 10, "setup": login_setup, "teardown": 0.0, "max": 0.3},
+            }}
+
+        ranked = merge_fixtures({"gw0": profile(2.0, 1.0), "gw1": profile(3.0, 1.5)})
+
+        assert [stats["fixture"] for stats in ranked] == ["browser_pool", "login"]
+        assert ranked[0]["setup"] == pytest.approx(5.0) and ranked[0]["teardown"] == pytest.approx(1.0)
+        assert ranked[0]["max"] == 3.5 and ranked[1]["count"] == 20
+        assert ranked[0]["workers"] == ["gw0", "gw1"]
+
+    def test_nested_fixtures_get_their_own_setup_and_teardown_time(self, pytester):
+        pytester.makepyfile("""
+            import time
+            import pytest
+
+            @pytest.fixture
+            def inner():
+                time.sleep(0.2)
+                yield
+                time.sleep(0.1)
+
+            @pytest.fixture
+            def outer(inner):
+                time.sleep(0.05)
+                yield
+                time.sleep(0.3)
+
+            def test_nested(outer):
+                pass
+        """)
+
+        result = pytester.runpytest("--profile-fixtures", "-p", "no:cacheprovider", plugins=[fixture_profiler])
+
+        result.assert_outcomes(passed=1)
+        fixtures = {stats["fixture"]: stats
+                    for stats in json.loads((pytester.path / "reports" / "fixture_profile.json").read_text())["fixtures"]}
+        # The outer setup excludes the inner one it requested
+        assert 0.2 <= fixtures["inner"]["setup"] < 0.3
+        assert 0.05 <= fixtures["outer"]["setup"] < 0.15
+        # Each teardown is timed on its own, in LIFO order: outer first, then inner
+        assert 0.3 <= fixtures["outer"]["teardown"] < 0.4
+        assert 0.1 <= fixtures["inner"]["teardown"] < 0.2
+        assert "fixture profile" in result.stdout.str()
+
+    def test_setup_steps_are_summed_over_workers(self):
+        assert merge_steps({"gw0": {"steps": {"logging configuration": 0.25}},
+                            "gw1": {"steps": {"logging configuration": 0.5}}, "main": {}}) == \
+               {"logging configuration": 0.75}
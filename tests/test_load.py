@@ -0,0 +1,26 @@
+import pytest
+import allure
+from config.config import Config
+from utilities.data_factory import get_factory
+from utilities.load import ApiVirtualUser, BrowserSession, BrowserVirtualUser, LoadProfile, LoadRunner
+
+
+@allure.feature("Load Testing")
+class TestLoad:
+    @pytest.mark.skipif(not Config.LOAD_TEST, reason="Set LOAD_TEST=true to run the load test")
+    def test_concurrent_users_create_and_move_tasks(self):
+        profile = LoadProfile()
+        name_prefix = f"{get_factory().unique_prefix()} Load"
+        if Config.LOAD_VIRTUAL_USER == "browser":
+            session = BrowserSession()
+            runner = LoadRunner(profile, lambda user_id: BrowserVirtualUser(user_id, name_prefix, session),
+                                shared=[session])
+        else:
+            runner = LoadRunner(profile, lambda user_id: ApiVirtualUser(user_id, name_prefix))
+        report = runner.run()
+        report.attach()
+        report_path = report.write()
+        allure.attach(str(report_path), name="Load Report File", attachment_type=allure.attachment_type.TEXT)
+
+        assert report.operations > 0, "No operations were executed"
+        assert report.error_rate < 0.01, f"Error rate {report.error_rate:.2%} is above 1%"
@@ -0,0 +1,26 @@
+import pytest
+import allure
+from utilities.load import ApiVirtualUser, LatencyHistogram, LoadProfile, LoadRunner
+
+
+@allure.feature("Load Generation")
+class TestLoadGenerator:
+    def test_histogram_percentiles_within_relative_error(self):
+        histogram = LatencyHistogram(relative_error=0.01)
+        for millis in range(1, 1001):
+            histogram.record(millis / 1000)
+
+        assert histogram.count == 1000
+        assert histogram.percentile(50) == pytest.approx(0.5, rel=0.02)
+        assert histogram.percentile(99) == pytest.approx(0.99, rel=0.02)
+        assert histogram.percentile(100) == 1.0
+
+    def test_concurrent_api_users_against_stub(self, stub_server):
+        profile = LoadProfile(users=5, ramp_up=0.2, duration=0.5, think_time=0)
+        report = LoadRunner(profile, lambda i: ApiVirtualUser(i, "Load", stub_server.url)).run()
+
+        assert report.operations > 0
+        assert report.error_rate == 0
+        assert report.throughput > 0
+        # Every virtual user removed the projects it created
+        assert stub_server.projects == {}
@@ -0,0 +1,114 @@
+import allure
+from utilities.network import NetworkRouter
+
+ASSET = "http://kanboard/assets/js/app.min.js?1700000000"
+
+
+class _FakeRequest:
+    def __init__(self, url: str, resource_type: str = "document", method: str = "GET"):
+        self.url = url
+        self.resource_type = resource_type
+        self.method = method
+
+
+class _FakeResponse:
+    def __init__(self, status: int = 200, body: bytes = b"console.log(1)"):
+        self.status = status
+        self.ok = status < 400
+        self.headers = {"content-type": "text/javascript", "content-encoding": "gzip"}
+        self._body = body
+
+    def body(self):
+        return self._body
+
+
+class _FakeRoute:
+    """
+    Records what the router decided to do with one request.
+    """
+
+    def __init__(self, request: _FakeRequest, response: _FakeResponse | None = None):
+        self.request = request
+        self.response = response or _FakeResponse()
+        self.outcome = None
+
+    def abort(self, error_code):
+        self.outcome = ("abort", error_code)
+
+    def continue_(self):
+        self.outcome = ("continue",)
+
+    def fetch(self):
+        return self.response
+
+    def fulfill(self, status, headers, body):
+        self.outcome = ("fulfill", status, headers, body)
+
+
+class _FakeContext:
+    def __init__(self):
+        self.routes = []
+
+    def route(self, pattern, handler):
+        self.routes.append(pattern)
+
+    def on(self, event, handler):
+        pass
+
+
+def _router(tmp_path, **options) -> NetworkRouter:
+    options = {"blocked_types": ("image",), "blocked_patterns": (r"gravatar\.com",),
+               "static_pattern": r"/assets/.+\.js(\?|$)", "measure_page_load": False, **options}
+    return NetworkRouter(cache_dir=tmp_path, **options)
+
+
+@allure.feature("Network Routing")
+class TestNetwork:
+    def test_blocked_types_and_patterns_are_aborted(self, tmp_path):
+        router = _router(tmp_path)
+        routes = [_FakeRoute(_FakeRequest("http://kanboard/logo.png", "image")),
+                  _FakeRoute(_FakeRequest("https://www.gravatar.com/avatar/1")),
+                  _FakeRoute(_FakeRequest("http://kanboard/?controller=BoardViewController"))]
+
+        for route in routes:
+            router._handle(route)
+
+        assert [route.outcome for route in routes] == [("abort", "blockedbyclient"), ("abort", "blockedbyclient"),
+                                                       ("continue",)]
+        assert router.counters["blocked"] == 2
+
+    def test_static_assets_are_fetched_once_and_then_served_from_disk(self, tmp_path):
+        router = _router(tmp_path)
+        first, second = _FakeRoute(_FakeRequest(ASSET, "script")), _FakeRoute(_FakeRequest(ASSET, "script"))
+
+        router._handle(first)
+        second.response = None  # a cache hit must not fetch
+        router._handle(second)
+
+        assert first.outcome == second.outcome == ("fulfill", 200, {"content-type": "text/javascript"},
+                                                   b"console.log(1)")
+        assert (router.counters["cache_misses"], router.counters["cache_hits"]) == (1, 1)
+
+    def test_failed_and_non_get_asset_requests_are_not_cached(self, tmp_path):
+        router = _router(tmp_path)
+        failed = _FakeRoute(_FakeRequest(ASSET, "script"), _FakeResponse(status=503))
+        post = _FakeRoute(_FakeRequest(ASSET, "script", method="POST"))
+
+        router._handle(failed)
+        router._handle(post)
+
+        assert failed.outcome[:2] == ("fulfill", 503) and post.outcome == ("continue",)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_page_load_measurement_leaves_requests_unrouted(self, tmp_path):
+        router = _router(tmp_path, measure_page_load=True)
+        context = _FakeContext()
+
+        router.install(context)
+        assert context.routes == []
+        router.block(r"/avatar/")
+
+        assert context.routes == ["**/*"]
+        route = _FakeRoute(_FakeRequest(ASSET, "script"))
+        router._handle(route)
+        assert route.outcome == ("continue",)
@@ -7,7 +7,7 @@ from utilities.helpers import generate_project_name
 @allure.feature("Project Creation")
 class TestProjectCreation:
     @pytest.mark.usefixtures("login")
-    def test_project_creation(self, page, db_connection):
+    def test_project_creation(self, page, db_connection, cleanup):
         project_name = generate_project_name()
 
         with allure.step("Create project via UI"):
@@ -15,6 +15,9 @@ class TestProjectCreation:
             project_page = ProjectPage(page)
             project_page.create_project(project_name)
             expect(page.get_by_text(project_name)).to_be_visible()
+            project_id = project_page.get_project_id_from_url()
+            assert project_id is not None, f"Failed to get project ID from URL for '{project_name}'"
+            cleanup.register_project(project_id)
 
         with allure.step("Verify project in database"):
             query = "SELECT name, is_active, is_public FROM projects WHERE name = %s"
@@ -0,0 +1,51 @@
+import pytest
+import allure
+from config.config import Config
+from pages.project_dashboard_page import ProjectDashboardPage
+from pages.task_page import TaskPage
+from utilities import scale
+from utilities.constants import BOARD_COLUMNS, SCALE_REPETITIONS, SCALE_SWIMLANES
+from utilities.data_factory import get_factory
+from utilities.database import TASK_COUNT_BY_PROJECT
+
+
+@pytest.fixture
+def scale_curve():
+    # Fitted and plotted once at the end of the run by scale.ScaleReporter
+    return scale.get_curve("board_operations")
+
+
+@allure.feature("Scale Testing")
+class TestScale:
+    @pytest.mark.skipif(not Config.SCALE_TEST, reason="Set SCALE_TEST=true to run the scale suite")
+    # Every size on one worker, one after the other, so sizes do not compete for Kanboard and Postgres
+    @pytest.mark.xdist_group("scale")
+    @pytest.mark.usefixtures("login")
+    def test_board_operations_by_number_of_tasks(self, page, scale_tasks, db_connection, db_seeder, cleanup,
+                                                 scale_curve):
+        factory = get_factory()
+        seeded = db_seeder.seed_project(factory.project_name(), scale_tasks, swimlanes=SCALE_SWIMLANES,
+                                        title_prefix=factory.unique_prefix())
+        cleanup.register_project(seeded.project_id)
+        dashboard_page = ProjectDashboardPage(page)
+        task_page = TaskPage(page)
+        task_title = factory.task_title()
+
+        with allure.step(f"Measure board operations with {scale_tasks} tasks"):
+            board_load = scale.measure(lambda: dashboard_page.open_board(seeded.project_id), SCALE_REPETITIONS)
+            # Creating and moving change the board, so each is timed once
+            task_creation = scale.measure(lambda: task_page.create_task(task_title))
+            # The card and the column are resolved first, so only the drag and Kanboard saving it are timed
+            task_card = task_page.get_task_card_locator(task_title)
+            target_column = task_page.get_column_locator_by_name(BOARD_COLUMNS[1])
+            task_move = scale.measure(lambda: task_page.drag_task_card(task_card, target_column,
+                                                                       f"Move '{task_title}'"))
+            db_count = scale.measure(
+                lambda: db_connection.fetch_one_prepared("task_count_by_project", TASK_COUNT_BY_PROJECT,
+                                                         (seeded.project_id,)), SCALE_REPETITIONS)
+
+        scale_curve.record(scale_tasks, {"board load": board_load, "task creation": task_creation,
+                                         "task move": task_move, "db task count": db_count})
+        task_count = db_connection.fetch_one_prepared("task_count_by_project", TASK_COUNT_BY_PROJECT,
+                                                      (seeded.project_id,))[0]
+        assert task_count == scale_tasks + 1, f"Expected {scale_tasks + 1} tasks, found {task_count}"
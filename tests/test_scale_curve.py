@@ -0,0 +1,28 @@
+import allure
+import pytest
+from utilities.scale import ScaleReporter, SuperLinearScalingWarning, fit_power_law
+
+
+@allure.feature("Scale Testing")
+class TestScaleCurve:
+    def test_power_law_fit_recovers_the_growth_exponent(self):
+        linear = fit_power_law("linear", {size: 0.002 * size for size in (10, 100, 1000, 10000)})
+        quadratic = fit_power_law("quadratic", {size: 1e-6 * size ** 2 for size in (10, 100, 1000)})
+
+        assert linear.exponent == pytest.approx(1.0) and linear.coefficient == pytest.approx(0.002)
+        assert linear.r_squared == pytest.approx(1.0) and not linear.super_linear
+        assert quadratic.exponent == pytest.approx(2.0) and quadratic.super_linear
+        assert fit_power_law("single", {100: 0.5}) is None
+
+    def test_workers_timings_are_merged_and_fitted_once(self, tmp_path):
+        reporter = ScaleReporter(directory=tmp_path)
+        reporter.merge({"board": {"board load": {"10": 0.01}}})
+        reporter.merge({"board": {"board load": {"1000": 10.0}}})
+
+        with pytest.warns(SuperLinearScalingWarning, match="board load"):
+            fits = reporter.report()
+
+        assert reporter.timings == {"board": {"board load": {10: 0.01, 1000: 10.0}}}
+        assert fits["board"][0].exponent == pytest.approx(1.5)
+        assert "<circle" in (tmp_path / "board.svg").read_text()
+        assert list(tmp_path.glob("*.tmp")) == []
@@ -0,0 +1,62 @@
+import json
+import allure
+import pytest
+from utilities import scheduling
+from utilities.scheduling import (DurationHistory, _nodeid_group, group_units, lpt_partition,
+                                 merge_shard_histories, missing_scheduler_state, predict_makespan)
+
+
+@allure.feature("Test Scheduling")
+class TestScheduling:
+    def test_lpt_balances_heavy_tests_across_workers(self):
+        durations = [30.0, 1.0, 1.0, 25.0, 1.0, 1.0, 1.0, 1.0]
+
+        partition = lpt_partition(durations, 2)
+
+        # The two heavy tests land on different workers
+        assert {0, 3} - set(partition[0]) and {0, 3} - set(partition[1])
+        assert sorted(i for part in partition for i in part) == list(range(len(durations)))
+        assert predict_makespan(durations, 2) == 31.0
+        assert predict_makespan(durations, 1) == sum(durations)
+
+    def test_history_averages_runs_and_predicts_unknown_tests(self, tmp_path):
+        history = DurationHistory(tmp_path / "durations.json")
+        history.update({"a": 10.0, "b": 2.0, "c": 4.0})
+        history.save()
+
+        history = DurationHistory(tmp_path / "durations.json")
+        history.update({"a": 20.0})
+
+        assert history.predict("a") == 15.0
+        assert history.predict("new") == 4.0
+
+    def test_xdist_groups_are_scheduled_as_one_unit(self):
+        nodeids = ["test_a.py::test_1", "test_scale.py::test_board[10_tasks]@scale", "test_a.py::test_2",
+                   "test_scale.py::test_board[100_tasks]@scale", "test_b.py::test_x[a@b]"]
+
+        units = group_units([_nodeid_group(nodeid) for nodeid in nodeids])
+
+        assert units == [[0], [1, 3], [2], [4]]
+
+    def test_shard_histories_are_merged_into_the_shared_one(self, tmp_path):
+        shared = DurationHistory(tmp_path / "durations.json")
+        shared.update({"a": 10.0, "b": 2.0, "c": 4.0})
+        shared.save()
+        (tmp_path / "shard0.json").write_text(json.dumps({"a": 12.0, "b": 2.0, "c": 4.0}))
+        (tmp_path / "shard1.json").write_text(json.dumps({"a": 10.0, "b": 3.0, "c": 4.0, "d": 1.0}))
+
+        merge_shard_histories([tmp_path / "shard0.json", tmp_path / "shard1.json"],
+                              DurationHistory(tmp_path / "durations.json"))
+
+        assert DurationHistory(tmp_path / "durations.json").durations == {"a": 12.0, "b": 3.0, "c": 4.0, "d": 1.0}
+
+    def test_installed_xdist_has_the_scheduler_state_lpt_relies_on(self, request, monkeypatch):
+        if scheduling.LoadScheduling is None:
+            pytest.skip("pytest-xdist is not installed")
+        # As under `-n 2`
+        monkeypatch.setattr(request.config.option, "tx", ["2*popen"])
+
+        assert missing_scheduler_state(scheduling.LptScheduling(request.config, history=DurationHistory())) == []
+        assert missing_scheduler_state(object()) == ["node2collection", "node2pending", "pending", "collection",
+                                                     "collection_is_completed", "_check_nodes_have_same_collection",
+                                                     "nodes"]
@@ -0,0 +1,126 @@
+import allure
+import pytest
+from utilities import screenshots
+from utilities.artifacts import ArtifactStore
+from utilities.screenshots import ALWAYS, NEVER, ON_FAILURE, RING_BUFFER, ScreenshotRecorder
+
+
+class _ScreenshotPage:
+    """
+    Stands in for a Playwright page: every screenshot is the bytes of the current view.
+    """
+
+    def __init__(self):
+        self.view = b"dashboard"
+        self.full_page = []
+
+    def screenshot(self, full_page: bool = False) -> bytes:
+        self.full_page.append(full_page)
+        return self.view
+
+
+@pytest.fixture
+def attached(monkeypatch) -> list[tuple[str, bytes]]:
+    attachments = []
+    monkeypatch.setattr(screenshots.allure, "attach",
+                        lambda body, name, attachment_type: attachments.append((name, body)))
+    return attachments
+
+
+def _record(recorder: ScreenshotRecorder, page: _ScreenshotPage, views: list[str]):
+    for view in views:
+        page.view = view.encode()
+        recorder.record(page, view)
+
+
+@allure.feature("Screenshots")
+class TestScreenshotRecorder:
+    def test_never_captures_nothing(self, attached):
+        page = _ScreenshotPage()
+        recorder = ScreenshotRecorder(NEVER)
+
+        _record(recorder, page, ["login", "board"])
+        recorder.record_failure(page, "Click Save failed")
+        recorder.finish(failed=True)
+
+        assert page.full_page == [] and attached == []
+
+    def test_on_failure_captures_only_the_failing_action(self, attached):
+        page = _ScreenshotPage()
+        recorder = ScreenshotRecorder(ON_FAILURE)
+
+        _record(recorder, page, ["login", "board"])
+        recorder.record_failure(page, "Click Save failed")
+
+        assert page.full_page == [True]
+        assert attached == [("Click Save failed", b"board")]
+
+    def test_always_attaches_every_action(self, attached):
+        page = _ScreenshotPage()
+        recorder = ScreenshotRecorder(ALWAYS)
+
+        _record(recorder, page, ["login", "board"])
+        recorder.finish(failed=False)
+
+        assert attached == [("login", b"login"), ("board", b"board")]
+
+    def test_ring_buffer_attaches_the_last_frames_before_the_failure(self, attached):
+        page = _ScreenshotPage()
+        recorder = ScreenshotRecorder(RING_BUFFER, buffer_size=2)
+
+        _record(recorder, page, ["login", "dashboard", "board"])
+        assert attached == []
+        recorder.record_failure(page, "Click Save failed")
+
+        # Buffered frames are viewport-only, the failure capture is full-page
+        assert page.full_page == [False, False, False, True]
+        assert attached == [("dashboard", b"dashboard"), ("board", b"board"), ("Click Save failed", b"board")]
+        assert not recorder.frames
+
+    def test_ring_buffer_of_a_passed_test_is_dropped(self, attached):
+        recorder = ScreenshotRecorder(RING_BUFFER, buffer_size=2)
+
+        _record(recorder, _ScreenshotPage(), ["login", "board"])
+        recorder.finish(failed=False)
+
+        assert attached == [] and not recorder.frames
+
+    def test_ring_buffer_of_a_failed_test_is_flushed_at_teardown(self, attached):
+        recorder = ScreenshotRecorder(RING_BUFFER, buffer_size=2)
+
+        _record(recorder, _ScreenshotPage(), ["login", "board"])
+        recorder.finish(failed=True)
+
+        assert attached == [("login", b"login"), ("board", b"board")]
+
+    def test_evicted_frames_are_discarded_from_the_store(self, tmp_path, attached):
+        store = ArtifactStore(root=tmp_path, image_format="png", max_width=0)
+        recorder = ScreenshotRecorder(RING_BUFFER, buffer_size=2, store=store)
+
+        page = _ScreenshotPage()
+        _record(recorder, page, ["login", "board"])
+        login, board = (frame for _, frame in recorder.frames)
+        _record(recorder, page, ["board", "task"])
+        store.close()
+
+        # "login" fell out of the buffer; the first "board" frame shares its artifact with the second one
+        assert [name for name, _ in recorder.frames] == ["board", "task"]
+        assert login.evicted and not login.path.exists()
+        assert not board.evicted and board.path.exists()
+        assert store.counters["deduplicated"] == 1
+
+    def test_flush_links_stored_frames_instead_of_embedding_them(self, tmp_path, attached):
+        store = ArtifactStore(root=tmp_path, image_format="png", max_width=0)
+        recorder = ScreenshotRecorder(RING_BUFFER, buffer_size=2, store=store)
+
+        _record(recorder, _ScreenshotPage(), ["login", "board"])
+        recorder.finish(failed=True)
+        store.close()
+
+        assert [name for name, _ in attached] == ["login", "board"]
+        assert all(body.startswith("file://") for _, body in attached)
+        assert all(artifact.linked and artifact.path.exists() for artifact in store._artifacts.values())
+
+    def test_unknown_mode_is_rejected(self):
+        with pytest.raises(ValueError, match="Unknown screenshot mode"):
+            ScreenshotRecorder("sometimes")
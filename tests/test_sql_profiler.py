@@ -0,0 +1,101 @@
+import json
+import allure
+import psycopg2
+import pytest
+from utilities import sql_profiler
+from utilities.sql_profiler import SqlProfiler, _diff
+
+
+def _snapshot(statements: dict, tup_inserted: int) -> dict:
+    counters = dict.fromkeys(("xact_commit", "xact_rollback", "blks_read", "blks_hit", "tup_returned",
+                              "tup_fetched", "tup_updated", "tup_deleted"), 0)
+    return {"statements": statements, "database": {**counters, "tup_inserted": tup_inserted}}
+
+
+class _StatsCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, query, params=()):
+        if self.connection.aborted:
+            raise psycopg2.errors.InFailedSqlTransaction("current transaction is aborted")
+
+    def fetchall(self):
+        # (queryid, query, calls, total time, rows): one more INSERT per snapshot
+        self.connection.snapshots += 1
+        inserts = self.connection.snapshots
+        return [(3, "INSERT INTO tasks (title) VALUES ($1)", inserts, 0.5 * inserts, inserts)]
+
+    def fetchone(self):
+        return (0,) * len(sql_profiler._DATABASE_COUNTERS)
+
+
+class _StatsConnection:
+    """
+    Stands in for the test's connection, with pg_stat_statements counting one INSERT between snapshots.
+    """
+
+    def __init__(self):
+        self.snapshots = 0
+        self.aborted = False
+
+    def cursor(self):
+        return _StatsCursor(self)
+
+
+class _StatsDb:
+    def __init__(self):
+        self.connection = _StatsConnection()
+
+
+@pytest.fixture
+def profiler(monkeypatch, tmp_path):
+    monkeypatch.setattr(sql_profiler, "_extension", {"available": True, "time_column": "total_exec_time"})
+    return SqlProfiler(_StatsDb(), "tests/test_x.py::test_y", report_path=tmp_path / "sql_profile.jsonl")
+
+
+@allure.feature("SQL Profiler")
+class TestSqlProfiler:
+    def test_only_statements_run_during_the_action_are_reported(self):
+        before = _snapshot({1: ("SELECT * FROM tasks WHERE id = $1", 5, 2.0, 5),
+                            2: ("SELECT 1", 3, 0.1, 3)}, tup_inserted=10)
+        after = _snapshot({1: ("SELECT * FROM tasks WHERE id = $1", 7, 3.5, 7),
+                           2: ("SELECT 1", 3, 0.1, 3),
+                           3: ("INSERT INTO tasks\n  (title) VALUES ($1)", 1, 0.5, 1),
+                           4: ("SELECT queryid, query FROM pg_stat_statements", 1, 0.2, 40)}, tup_inserted=11)
+
+        profile = _diff(before, after)
+
+        assert profile["statements"] == [
+            {"query": "SELECT * FROM tasks WHERE id = $1", "calls": 2, "total_ms": 1.5, "rows": 2},
+            {"query": "INSERT INTO tasks (title) VALUES ($1)", "calls": 1, "total_ms": 0.5, "rows": 1},
+        ]
+        assert profile["calls"] == 3 and profile["total_ms"] == 2.0
+        assert profile["database"]["tup_inserted"] == 1
+
+    def test_actions_are_measured_and_written_per_test(self, profiler):
+        with profiler.measure("Click Save"):
+            pass
+
+        assert profiler.summary() == [{"action": "Click Save", "calls": 1, "total_ms": 0.5}]
+        profiler.finish()
+        line = json.loads(profiler.report_path.read_text())
+        assert line["test"] == "tests/test_x.py::test_y" and line["actions"][0]["action"] == "Click Save"
+        assert profiler.actions == []
+
+    def test_aborted_transaction_does_not_hide_the_actions_error(self, profiler):
+        with pytest.raises(ZeroDivisionError):
+            with profiler.measure("Click Save"):
+                profiler.db.connection.aborted = True
+                1 / 0
+
+        assert profiler.actions == []
+        with profiler.measure("Click Cancel"):
+            pass
+        assert profiler.actions == []
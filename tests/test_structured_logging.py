@@ -0,0 +1,31 @@
+import json
+import logging
+
+import allure
+from utilities import structured_logging
+
+
+@allure.feature("Structured Logging")
+class TestStructuredLogging:
+    def test_records_carry_test_worker_and_allure_step(self, request):
+        record = logging.LogRecord("tests", logging.INFO, __file__, 1, "Clicked %s", ("Save",), None)
+
+        with allure.step("Create project"):
+            with allure.step("Fill name"):
+                structured_logging._ContextFilter().filter(record)
+
+        entry = json.loads(structured_logging.JsonFormatter().format(record))
+        assert entry["message"] == "Clicked Save"
+        assert entry["test"] == request.node.nodeid
+        assert entry["step"] == "Fill name"
+
+    def test_worker_logs_are_merged_in_time_order(self, tmp_path):
+        for worker, seconds in (("gw0", (1, 4)), ("gw1", (2, 3, 5))):
+            (tmp_path / f"test_execution.{worker}.jsonl").write_text(
+                "".join(json.dumps({"ts": f"2024-01-01T00:00:0{s}", "worker": worker}) + "\n" for s in seconds))
+
+        merged = structured_logging.merge_worker_logs(tmp_path)
+
+        entries = [json.loads(line) for line in merged.read_text().splitlines()]
+        assert [entry["worker"] for entry in entries] == ["gw0", "gw1", "gw1", "gw0", "gw1"]
+        assert [path.name for path in tmp_path.iterdir()] == ["test_execution.jsonl"]
@@ -7,7 +7,7 @@ from utilities.helpers import generate_project_name, generate_task_title, genera
 @allure.feature("Task Lifecycle")
 class TestTaskLifecycle:
     @pytest.mark.usefixtures("login")
-    def test_task_lifecycle(self, page, db_connection):
+    def test_task_lifecycle(self, page, db_connection, db_assertions, cleanup):
         project_name = generate_project_name()
         task_title = generate_task_title()
         task_description = generate_description()
@@ -23,6 +23,7 @@ class TestTaskLifecycle:
             project_page.create_project(project_name)
             project_id = project_page.get_project_id_from_url()
             assert project_id is not None, f"Failed to get project ID from URL for '{project_name}'"
+            cleanup.register_project(project_id)
 
             project_dashboard_page.navigate_to_board_view(project_id)
 
@@ -31,32 +32,15 @@ class TestTaskLifecycle:
 
         with allure.step("Verify initial task status"):
             query = "SELECT is_active FROM tasks WHERE title = %s AND project_id = %s"
-            result = db_connection.fetch_one(query, (task_title, project_id))
+            # The UI shows the task before the test can be sure the row is visible to this connection
+            result = db_connection.wait_for_db_state(query, (task_title, project_id))
             assert result[0] is True
 
         with allure.step("Move task to Done and verify status"):
+            board_before = task_page.snapshot_board()
             task_page.move_task_to_done(task_title)
+            board_before.diff(task_page.snapshot_board()).assert_moved(task_title, "Done")
             allure.attach(f"Verifying DB status for task '{task_title}' (project_id: {project_id})",
                           name="DB Verification", attachment_type=allure.attachment_type.TEXT)
-            query = "SELECT is_active FROM tasks WHERE title = %s AND project_id = %s"
-            result = db_connection.fetch_one(query, (task_title, project_id))
-
-            assert result is not None, f"Task '{task_title}' not found in database for project_id {project_id}"
-
             # If 'Done' means it's still 'active' but completed
-            assert result[0] is True, f"Expected is_active to be True for task '{task_title}', but got {result[0]}"
-            allure.attach(f"DB verification successful: is_active is {result[0]}", name="DB Verification Result",
-                          attachment_type=allure.attachment_type.TEXT)
-
-        with allure.step("Delete project and verify cleanup"):
-            project_page.delete_project(int(project_id))
-
-            # Verify project is deleted
-            query = "SELECT COUNT(*) FROM projects WHERE name = %s"
-            project_count = db_connection.fetch_one(query, (project_name,))[0]
-            assert project_count == 0
-
-            # Verify tasks are deleted
-            query = "SELECT COUNT(*) FROM tasks WHERE project_id = %s"
-            task_count = db_connection.fetch_one(query, (project_id,))[0]
-            assert task_count == 0
\ No newline at end of file
+            db_assertions.task_active(task_title, project_id, True).task_count(project_id, 1).verify()
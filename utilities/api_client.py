@@ -0,0 +1,204 @@
+import base64
+import http.client
+import itertools
+import json
+import logging
+import select
+from urllib.parse import urlsplit
+
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Read-only methods, which can be sent again when the connection drops before the response arrives
+_IDEMPOTENT_PREFIXES = ("get",)
+
+
+class KanboardApiError(Exception):
+    """
+    Raised when a JSON-RPC call returns an error object or Kanboard reports failure with `false`.
+    """
+
+    def __init__(self, method: str, error):
+        self.method = method
+        self.error = error
+        super().__init__(f"Kanboard API call '{method}' failed: {error}")
+
+
+class KanboardApiClient:
+    """
+    Client for Kanboard's JSON-RPC endpoint (jsonrpc.php), meant for test data setup.
+
+    A single keep-alive HTTP connection is reused for every call, and `batch` sends many
+    calls in one JSON-RPC batch request. The typed helpers return integer ids that can be
+    passed straight to the page objects (e.g. `ProjectDashboardPage.navigate_to_board_view`).
+    The client is not thread-safe: use one instance per thread.
+    """
+
+    def __init__(self, url: str = Config.API_URL, username: str = Config.API_USER,
+                 password: str = Config.API_PASSWORD, timeout: float = 30, batch_size: int = 100):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port
+        self.path = parts.path or "/"
+        self.connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self.timeout = timeout
+        self.batch_size = batch_size
+        credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
+        self.headers = {
+            "Authorization": f"Basic {credentials}",
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+        }
+        self._connection: http.client.HTTPConnection | None = None
+        self._ids = itertools.count(1)
+
+    def call(self, method: str, **params):
+        """
+        Calls a single API method and returns its result.
+        """
+        request_id = next(self._ids)
+        response = self._post({"jsonrpc": "2.0", "method": method, "id": request_id, "params": params})
+        return self._result(method, response)
+
+    def batch(self, calls: list[tuple[str, dict]]) -> list:
+        """
+        Calls several API methods, `batch_size` calls per HTTP request.
+        Results are returned in the order of `calls`.
+        """
+        results = []
+        for start in range(0, len(calls), self.batch_size):
+            chunk = calls[start:start + self.batch_size]
+            requests = [{"jsonrpc": "2.0", "method": method, "id": next(self._ids), "params": params}
+                        for method, params in chunk]
+            responses = {response["id"]: response for response in self._post(requests)}
+            results.extend(self._result(request["method"], responses.get(request["id"]))
+                           for request in requests)
+        return results
+
+    def create_project(self, name: str, **params) -> int:
+        return self._checked_id("createProject", self.call("createProject", name=name, **params))
+
+    def create_projects(self, names: list[str]) -> list[int]:
+        results = self.batch([("createProject", {"name": name}) for name in names])
+        return [self._checked_id("createProject", result) for result in results]
+
+    def create_task(self, project_id: int, title: str, description: str = "", **params) -> int:
+        task_id = self.call("createTask", project_id=int(project_id), title=title, description=description, **params)
+        return self._checked_id("createTask", task_id)
+
+    def create_tasks(self, project_id: int, titles: list[str], description: str = "", **params) -> list[int]:
+        results = self.batch([("createTask", {"project_id": int(project_id), "title": title,
+                                              "description": description, **params})
+                              for title in titles])
+        return [self._checked_id("createTask", result) for result in results]
+
+    def get_columns(self, project_id: int) -> dict[str, int]:
+        """
+        Returns the project's board columns as {title: column_id}.
+        """
+        columns = self.call("getColumns", project_id=int(project_id))
+        return {column["title"]: int(column["id"]) for column in columns}
+
+    def move_task(self, project_id: int, task_id: int, column_id: int, position: int = 1,
+                  swimlane_id: int | None = None) -> bool:
+        params = {"project_id": int(project_id), "task_id": int(task_id), "column_id": int(column_id),
+                  "position": position}
+        if swimlane_id is not None:
+            params["swimlane_id"] = int(swimlane_id)
+        return self._checked_bool("moveTaskPosition", self.call("moveTaskPosition", **params))
+
+    def remove_project(self, project_id: int) -> bool:
+        return self._checked_bool("removeProject", self.call("removeProject", project_id=int(project_id)))
+
+    def remove_projects(self, project_ids: list[int]) -> list[bool]:
+        """
+        Removes the projects in batches. Unlike `remove_project` a failure does not raise, so the
+        rest are still removed: it is logged and reported as `False` at the project's position.
+        """
+        results = self.batch([("removeProject", {"project_id": int(project_id)}) for project_id in project_ids])
+        return self._checked_bools("removeProject", project_ids, results)
+
+    def create_user(self, username: str, password: str, role: str = "app-user") -> int:
+        return self._checked_id("createUser", self.call("createUser", username=username, password=password,
+                                                        role=role))
+
+    def add_project_user(self, project_id: int, user_id: int, role: str = "project-member") -> bool:
+        return self._checked_bool("addProjectUser", self.call("addProjectUser", project_id=int(project_id),
+                                                              user_id=int(user_id), role=role))
+
+    def remove_user(self, user_id: int) -> bool:
+        return self._checked_bool("removeUser", self.call("removeUser", user_id=int(user_id)))
+
+    def get_all_projects(self) -> list[dict]:
+        return self.call("getAllProjects") or []
+
+    def remove_tasks(self, task_ids: list[int]) -> list[bool]:
+        """
+        `remove_projects` for tasks.
+        """
+        results = self.batch([("removeTask", {"task_id": int(task_id)}) for task_id in task_ids])
+        return self._checked_bools("removeTask", task_ids, results)
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _post(self, payload):
+        body = json.dumps(payload).encode()
+        methods = [payload["method"]] if isinstance(payload, dict) else [request["method"] for request in payload]
+        if self._connection is not None and self._connection_dropped():
+            # The server closed the kept-alive connection while it was idle
+            self.close()
+        # A connection can still drop while the request is in flight. Kanboard may then have executed
+        # it already, so only calls that can safely run twice are retried, once, on a fresh connection
+        attempts = 2 if all(method.startswith(_IDEMPOTENT_PREFIXES) for method in methods) else 1
+        for attempt in range(attempts):
+            if self._connection is None:
+                self._connection = self.connection_class(self.host, self.port, timeout=self.timeout)
+            try:
+                self._connection.request("POST", self.path, body=body, headers=self.headers)
+                response = self._connection.getresponse()
+                data = response.read()
+            except (http.client.RemoteDisconnected, ConnectionError):
+                self.close()
+                if attempt == attempts - 1:
+                    raise
+                continue
+            if response.status != 200:
+                raise KanboardApiError(methods[0] if isinstance(payload, dict) else "batch",
+                                       f"HTTP {response.status} {response.reason}")
+            return json.loads(data)
+
+    def _connection_dropped(self) -> bool:
+        # An idle keep-alive socket has nothing to read: if it is readable, the server has closed it
+        sock = self._connection.sock
+        return sock is not None and bool(select.select([sock], [], [], 0)[0])
+
+    @staticmethod
+    def _result(method: str, response: dict | None):
+        if response is None:
+            raise KanboardApiError(method, "no response in batch")
+        if "error" in response:
+            raise KanboardApiError(method, response["error"])
+        return response["result"]
+
+    @staticmethod
+    def _checked_id(method: str, result) -> int:
+        if not result:
+            raise KanboardApiError(method, "Kanboard returned false")
+        return int(result)
+
+    @staticmethod
+    def _checked_bool(method: str, result) -> bool:
+        if result is not True:
+            raise KanboardApiError(method, "Kanboard returned false")
+        return True
+
+    @staticmethod
+    def _checked_bools(method: str, ids: list[int], results: list) -> list[bool]:
+        failed = [int(item_id) for item_id, result in zip(ids, results) if result is not True]
+        if failed:
+            logger.warning(f"Kanboard API call '{method}' returned false for {len(failed)} of {len(ids)}: {failed}")
+        return [result is True for result in results]
@@ -0,0 +1,244 @@
+import hashlib
+import io
+import logging
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import allure
+
+from config.config import Config
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional: without it frames are stored as the original PNG
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+_EXTENSIONS = {"png": "png", "jpeg": "jpg", "webp": "webp"}
+
+
+@dataclass
+class Artifact:
+    key: str
+    path: Path
+    test_id: str | None
+    size: int  # The raw size until the background writer has stored the encoded file
+    pinned: bool = False  # Failure captures are never evicted
+    owned: bool = True  # False when the file was already on disk (written by another worker or run)
+    written: bool = False
+    linked: bool = False
+    evicted: bool = False
+
+
+class ArtifactStore:
+    """
+    Content-addressed on-disk store for screenshots, linked from Allure instead of embedded in it.
+
+    - Every capture is hashed (sha256), and identical frames are stored once: the file name is the hash.
+    - With Pillow installed, images wider than `max_width` are downsized, and with the `jpeg` or `webp`
+      format re-encoded at `quality`; other PNG frames are stored byte for byte. Encoding and writing
+      happen on a background thread, so the test does not wait for it.
+    - A per-test and a per-run (per worker) byte budget are enforced by evicting the oldest unpinned
+      artifacts first; their Allure links then point to a missing file. Failure captures are pinned.
+    """
+
+    def __init__(self, root: Path = Path(Config.ARTIFACT_DIR), image_format: str = Config.ARTIFACT_FORMAT,
+                 quality: int = Config.ARTIFACT_QUALITY, max_width: int = Config.ARTIFACT_MAX_WIDTH,
+                 test_budget: int = Config.ARTIFACT_TEST_BUDGET_MB * 1024 * 1024,
+                 run_budget: int = Config.ARTIFACT_RUN_BUDGET_MB * 1024 * 1024,
+                 base_url: str = Config.ARTIFACT_BASE_URL):
+        if image_format not in _EXTENSIONS:
+            raise ValueError(f"Unknown artifact format '{image_format}'. Expected one of: {', '.join(_EXTENSIONS)}")
+        if image_format != "png" and Image is None:
+            logger.info(f"Pillow is not installed, storing screenshots as PNG instead of {image_format}")
+            image_format = "png"
+        self.root = Path(root)
+        self.image_format = image_format
+        self.quality = quality
+        self.max_width = max_width
+        self.test_budget = test_budget
+        self.run_budget = run_budget
+        self.base_url = base_url.rstrip("/")
+        self.counters = {"stored": 0, "deduplicated": 0, "evicted": 0, "failed": 0}
+        self._artifacts: dict[str, Artifact] = {}  # Insertion order is age, oldest first
+        self._test_id: str | None = None
+        self._lock = threading.Lock()
+        self._queue: queue.Queue | None = None
+        self._thread: threading.Thread | None = None
+
+    def start_test(self, test_id: str):
+        self._test_id = test_id
+
+    def put(self, data: bytes, pinned: bool = False) -> Artifact:
+        """
+        Stores an image without linking it, e.g. a ring buffer frame that may be discarded.
+        """
+        key = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            artifact = self._artifacts.get(key)
+            if artifact is not None and not artifact.evicted:
+                self.counters["deduplicated"] += 1
+                artifact.pinned |= pinned
+                return artifact
+            path = self.root / key[:2] / f"{key}.{_EXTENSIONS[self.image_format]}"
+            artifact = Artifact(key, path, self._test_id, len(data), pinned)
+            self._artifacts.pop(key, None)
+            self._artifacts[key] = artifact
+            if path.exists():
+                self.counters["deduplicated"] += 1
+                artifact.owned = artifact.written = False
+                return artifact
+            self.counters["stored"] += 1
+            self._evict()
+        self._start_thread()
+        self._queue.put((artifact, data))
+        return artifact
+
+    def link(self, artifact: Artifact, name: str):
+        """
+        Attaches a link to the artifact to the current Allure step.
+        """
+        artifact.linked = True
+        allure.attach(self.uri(artifact), name=name, attachment_type=allure.attachment_type.URI_LIST)
+
+    def attach(self, name: str, data: bytes, pinned: bool = False) -> Artifact:
+        artifact = self.put(data, pinned)
+        self.link(artifact, name)
+        return artifact
+
+    def discard(self, artifacts):
+        """
+        Deletes stored artifacts that were never linked (e.g. the ring buffer of a passed test).
+        """
+        with self._lock:
+            for artifact in artifacts:
+                if artifact.owned and not artifact.linked and not artifact.pinned and not artifact.evicted:
+                    self._drop(artifact, evicted_by_budget=False)
+
+    def uri(self, artifact: Artifact) -> str:
+        if self.base_url:
+            return f"{self.base_url}/{artifact.path.relative_to(self.root).as_posix()}"
+        return artifact.path.resolve().as_uri()
+
+    def stored_bytes(self, test_id: str | None = None) -> int:
+        with self._lock:
+            return sum(artifact.size for artifact in self._live() if test_id is None or artifact.test_id == test_id)
+
+    def close(self):
+        """
+        Waits for the background writer to store every queued artifact.
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        if any(self.counters.values()):
+            logger.info(f"Artifact store: {self.counters}, {self.stored_bytes()} bytes in {self.root}")
+
+    def _start_thread(self):
+        if self._thread is None:
+            self._queue = queue.Queue()
+            self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            artifact, data = item
+            try:
+                size = self._write(artifact.path, data)
+            except Exception:
+                logger.exception(f"Failed to store artifact {artifact.path}")
+                with self._lock:
+                    self.counters["failed"] += 1
+                    artifact.evicted = True
+                continue
+            with self._lock:
+                artifact.size = size
+                artifact.written = True
+                if artifact.evicted:
+                    # Evicted (or discarded) while it was waiting in the queue
+                    artifact.path.unlink(missing_ok=True)
+                else:
+                    self._evict()
+
+    def _write(self, path: Path, data: bytes) -> int:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Atomic rename, so another worker never links a half-written file
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as file:
+            if not self._needs_encoding(data):
+                file.write(data)
+            else:
+                image = Image.open(io.BytesIO(data))
+                if self.max_width and image.width > self.max_width:
+                    image = image.resize((self.max_width, max(1, round(image.height * self.max_width / image.width))))
+                if self.image_format == "jpeg":
+                    image = image.convert("RGB")
+                image.save(file, format=self.image_format.upper(), quality=self.quality, optimize=True)
+        os.replace(tmp_path, path)
+        return path.stat().st_size
+
+    def _needs_encoding(self, data: bytes) -> bool:
+        """
+        Screenshots are PNGs: they are stored as they are unless they must be converted or downsized.
+        """
+        if Image is None:
+            return False
+        if self.image_format != "png":
+            return True
+        return bool(self.max_width) and _png_width(data) > self.max_width
+
+    def _live(self) -> list[Artifact]:
+        return [artifact for artifact in self._artifacts.values() if artifact.owned and not artifact.evicted]
+
+    def _evict(self):
+        # Called with the lock held. The test budget is enforced first, then the run budget
+        for budget, of_test in ((self.test_budget, True), (self.run_budget, False)):
+            if not budget:
+                continue
+            candidates = [artifact for artifact in self._live() if not of_test or artifact.test_id == self._test_id]
+            total = sum(artifact.size for artifact in candidates)
+            for artifact in candidates:
+                if total <= budget:
+                    break
+                if not artifact.pinned:
+                    total -= artifact.size
+                    self._drop(artifact)
+
+    def _drop(self, artifact: Artifact, evicted_by_budget: bool = True):
+        artifact.evicted = True
+        self.counters["evicted"] += evicted_by_budget
+        if artifact.written:
+            artifact.path.unlink(missing_ok=True)
+
+
+def _png_width(data: bytes) -> int:
+    # The IHDR chunk right after the 8-byte signature starts with the width
+    return int.from_bytes(data[16:20], "big")
+
+
+_store: ArtifactStore | None = None
+
+
+def get_store() -> ArtifactStore:
+    """
+    The store shared by this process (one per xdist worker).
+    """
+    global _store
+    if _store is None:
+        _store = ArtifactStore()
+    return _store
+
+
+def close_store():
+    global _store
+    if _store is not None:
+        _store.close()
+        _store = None
@@ -0,0 +1,208 @@
+import json
+import math
+import os
+import platform
+import statistics
+import time
+import warnings
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import wraps
+from pathlib import Path
+
+import allure
+
+from config.config import Config, DB_CONFIG
+from utilities.database import get_query_recorder
+
+
+class MissingBaselineWarning(UserWarning):
+    pass
+
+
+@dataclass
+class BenchmarkStats:
+    """
+    Summary of one benchmark run. All times are in seconds.
+    """
+    name: str
+    samples: int
+    rejected: int
+    min: float
+    median: float
+    mean: float
+    p95: float
+    p99: float
+    max: float
+    stddev: float
+
+    @classmethod
+    def from_samples(cls, name: str, samples_ns: list[int], reject_outliers: bool = True) -> "BenchmarkStats":
+        values = sorted(sample / 1e9 for sample in samples_ns)
+        kept = _without_outliers(values) if reject_outliers else values
+        return cls(
+            name=name,
+            samples=len(kept),
+            rejected=len(values) - len(kept),
+            min=kept[0],
+            median=statistics.median(kept),
+            mean=statistics.fmean(kept),
+            p95=_percentile(kept, 95),
+            p99=_percentile(kept, 99),
+            max=kept[-1],
+            stddev=statistics.stdev(kept) if len(kept) > 1 else 0.0,
+        )
+
+    def __str__(self):
+        return (f"{self.name}: median {self.median:.4f}s, min {self.min:.4f}s, p95 {self.p95:.4f}s, "
+                f"p99 {self.p99:.4f}s, max {self.max:.4f}s, stddev {self.stddev:.4f}s "
+                f"({self.samples} samples, {self.rejected} outliers rejected)")
+
+
+def _percentile(sorted_values: list[float], percent: float) -> float:
+    """
+    Percentile with linear interpolation between the closest ranks.
+    """
+    rank = (len(sorted_values) - 1) * percent / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def _without_outliers(sorted_values: list[float]) -> list[float]:
+    """
+    Drops samples outside Tukey's fences (1.5 IQR beyond the quartiles).
+    """
+    if len(sorted_values) < 4:
+        return sorted_values
+    q1, q3 = _percentile(sorted_values, 25), _percentile(sorted_values, 75)
+    fence = 1.5 * (q3 - q1)
+    return [value for value in sorted_values if q1 - fence <= value <= q3 + fence]
+
+
+def environment_key() -> str:
+    """
+    Identifies the environment a baseline was recorded in. Timings are only compared
+    against baselines from the same environment.
+    """
+    return Config.BENCHMARK_ENVIRONMENT or (
+        f"{platform.system()}-{platform.machine()}-py{platform.python_version()}-db@{DB_CONFIG['host']}"
+    )
+
+
+class BaselineStore:
+    """
+    JSON file of benchmark baselines, keyed by environment and then by benchmark id.
+    """
+
+    def __init__(self, path: Path = Path(Config.BENCHMARK_BASELINE_FILE)):
+        self.path = Path(path)
+
+    def get(self, environment: str, benchmark_id: str) -> dict | None:
+        return self._load().get(environment, {}).get(benchmark_id)
+
+    def put(self, environment: str, benchmark_id: str, stats: BenchmarkStats):
+        # Re-read right before writing so baselines written by other xdist workers are kept
+        data = self._load()
+        data.setdefault(environment, {})[benchmark_id] = {
+            "median": stats.median,
+            "p95": stats.p95,
+            "samples": stats.samples,
+            "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data, indent=2, sort_keys=True))
+        os.replace(tmp_path, self.path)
+
+    def _load(self) -> dict:
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+
+def _current_test_id() -> str:
+    # e.g. "tests/test_performance.py::TestPerformance::test_task_retrieval_performance (call)"
+    return os.environ.get("PYTEST_CURRENT_TEST", "").rsplit(" ", 1)[0]
+
+
+def benchmark(step_name: str = "Benchmark", time_expected: float | None = None,
+              warmup: int = Config.BENCHMARK_WARMUP, repetitions: int = Config.BENCHMARK_REPETITIONS,
+              tolerance: float = Config.BENCHMARK_TOLERANCE, reject_outliers: bool = True,
+              baselines: BaselineStore | None = None):
+    """
+    A decorator that benchmarks a function instead of timing a single call.
+
+    The function is called `warmup` times untimed and then `repetitions` times timed with
+    perf_counter_ns. The statistics are attached to Allure, and the result of the last call is returned.
+    No EXPLAIN plans of slow queries are captured while the function runs.
+
+    Args:
+        step_name (str): The name for the Allure step and the benchmark id within the test.
+        time_expected (float): Optional budget in seconds for the median.
+        warmup (int): Untimed calls before measuring.
+        repetitions (int): Timed calls.
+        tolerance (float): Allowed slowdown of the median against the stored baseline, e.g. 0.2 for 20%.
+        reject_outliers (bool): Drop samples outside Tukey's fences before computing statistics.
+        baselines (BaselineStore): Where baselines are read from and written to.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            # A slow query would otherwise be re-run under EXPLAIN ANALYZE within the measured time
+            with allure.step(step_name), get_query_recorder().explain_disabled():
+                for _ in range(warmup):
+                    func(*args, **kwargs)
+                samples = []
+                result = None
+                for _ in range(max(repetitions, 1)):
+                    start = time.perf_counter_ns()
+                    result = func(*args, **kwargs)
+                    samples.append(time.perf_counter_ns() - start)
+
+                stats = BenchmarkStats.from_samples(step_name, samples, reject_outliers)
+                allure.attach(str(stats), name="Performance Metric", attachment_type=allure.attachment_type.TEXT)
+                allure.attach(json.dumps({**stats.__dict__, "samples_ns": samples}, indent=2),
+                              name="Benchmark Samples", attachment_type=allure.attachment_type.JSON)
+
+                if time_expected:
+                    assert stats.median < time_expected, (f"Expected median execution time below {time_expected}"
+                                                          f" seconds, but got {stats.median:.4f} seconds")
+                check_regression(f"{_current_test_id()}::{step_name}", stats, tolerance, baselines)
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+def check_regression(benchmark_id: str, stats: BenchmarkStats, tolerance: float = Config.BENCHMARK_TOLERANCE,
+                     baselines: BaselineStore | None = None):
+    """
+    Compares the median against the stored baseline for this environment and fails on a regression.
+
+    Without a baseline nothing can be compared: this run's result is recorded as the baseline and
+    a MissingBaselineWarning is raised, so a missing baseline never passes unnoticed as "no regression"
+    but the test's own assertions still run. BENCHMARK_UPDATE_BASELINE=true re-records the baseline.
+    """
+    baselines = baselines or BaselineStore()
+    environment = environment_key()
+    baseline = baselines.get(environment, benchmark_id)
+    if Config.BENCHMARK_UPDATE_BASELINE:
+        baselines.put(environment, benchmark_id, stats)
+        return
+    if baseline is None:
+        baselines.put(environment, benchmark_id, stats)
+        message = (f"No baseline for '{benchmark_id}' in environment '{environment}' ({baselines.path}); "
+                   f"recorded this run's median {stats.median:.4f}s as the baseline, nothing was compared")
+        allure.attach(message, name="Baseline Comparison", attachment_type=allure.attachment_type.TEXT)
+        warnings.warn(message, MissingBaselineWarning)
+        return
+
+    limit = baseline["median"] * (1 + tolerance)
+    allure.attach(f"Baseline median: {baseline['median']:.4f}s (recorded {baseline['recorded_at']})\n"
+                  f"Current median: {stats.median:.4f}s\nAllowed: {limit:.4f}s (+{tolerance:.0%})",
+                  name="Baseline Comparison", attachment_type=allure.attachment_type.TEXT)
+    assert stats.median <= limit, (f"Performance regression in '{benchmark_id}': median {stats.median:.4f}s"
+                                   f" exceeds baseline {baseline['median']:.4f}s by more than {tolerance:.0%}")
@@ -0,0 +1,172 @@
+import json
+import logging
+import statistics
+import time
+from pathlib import Path
+
+import allure
+from playwright.sync_api import Page
+
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Installed before any page script runs, so the observers see the whole page load
+_OBSERVERS_SCRIPT = """
+(() => {
+    if (window.__qaPerf) return;
+    const perf = window.__qaPerf = {lcp: null, cls: 0, longTasks: []};
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(callback)).observe({type, buffered: true});
+        } catch (e) {
+            // Entry type not supported by this browser
+        }
+    };
+    observe('largest-contentful-paint', entry => {
+        perf.lcp = {startTime: entry.startTime, size: entry.size, element: entry.element ? entry.element.tagName : null};
+    });
+    observe('layout-shift', entry => {
+        if (!entry.hadRecentInput) perf.cls += entry.value;
+    });
+    observe('longtask', entry => perf.longTasks.push({startTime: entry.startTime, duration: entry.duration}));
+})();
+"""
+
+_COLLECT_SCRIPT = """
+() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const resources = {};
+    for (const entry of performance.getEntriesByType('resource')) {
+        const type = resources[entry.initiatorType] = resources[entry.initiatorType]
+            || {count: 0, transferSize: 0, totalDuration: 0, maxDuration: 0};
+        type.count += 1;
+        type.transferSize += entry.transferSize;
+        type.totalDuration += entry.duration;
+        type.maxDuration = Math.max(type.maxDuration, entry.duration);
+    }
+    const perf = window.__qaPerf || {lcp: null, cls: null, longTasks: []};
+    return {
+        url: location.href,
+        navigation: nav ? {
+            type: nav.type,
+            ttfb: nav.responseStart - nav.requestStart,
+            responseEnd: nav.responseEnd,
+            domInteractive: nav.domInteractive,
+            domContentLoaded: nav.domContentLoadedEventEnd,
+            load: nav.loadEventEnd,
+            transferSize: nav.transferSize,
+        } : null,
+        resources,
+        lcp: perf.lcp,
+        cls: perf.cls,
+        longTasks: {
+            count: perf.longTasks.length,
+            totalDuration: perf.longTasks.reduce((sum, task) => sum + task.duration, 0),
+        },
+        domNodes: document.getElementsByTagName('*').length,
+        taskCards: document.querySelectorAll('.task-board').length,
+    };
+}
+"""
+
+# Subset of CDP Performance.getMetrics worth tracking
+_CDP_METRICS = ("JSHeapUsedSize", "JSHeapTotalSize", "Nodes", "LayoutCount", "RecalcStyleCount",
+                "LayoutDuration", "RecalcStyleDuration", "ScriptDuration", "TaskDuration")
+
+
+class BrowserMetricsCollector:
+    """
+    Collects browser-side performance metrics after each navigation or URL wait in BasePage:
+    Navigation and Resource Timing, LCP, CLS, long tasks and CDP Performance.getMetrics.
+
+    Samples are grouped by page type (the page object class that navigated). At the end of the
+    test they are attached to Allure and appended to a JSONL time series, one line per sample.
+    """
+
+    def __init__(self, test_id: str = "", enabled: bool = Config.BROWSER_METRICS,
+                 series_path: Path = Path(Config.REPORTS_DIR) / "browser_metrics.jsonl"):
+        self.test_id = test_id
+        self.enabled = enabled
+        self.series_path = Path(series_path)
+        self.samples: list[dict] = []
+        self._cdp_sessions = {}
+
+    def install(self, page: Page):
+        """
+        Registers the observers on `page`. Must run before the first navigation to see it.
+        """
+        if self.enabled:
+            page.add_init_script(_OBSERVERS_SCRIPT)
+
+    def collect(self, page: Page, page_type: str, label: str):
+        if not self.enabled:
+            return
+        try:
+            sample = page.evaluate(_COLLECT_SCRIPT)
+            sample["cdp"] = self._cdp_metrics(page)
+        except Exception as e:
+            # Metrics are diagnostics only and must never fail the test
+            logger.warning(f"Could not collect browser metrics for '{label}': {e}")
+            return
+        sample.update(timestamp=time.time(), test=self.test_id, page_type=page_type, label=label)
+        self.samples.append(sample)
+
+    def summary(self) -> dict:
+        """
+        Median of the headline metrics per page type.
+        """
+        by_type: dict[str, list[dict]] = {}
+        for sample in self.samples:
+            by_type.setdefault(sample["page_type"], []).append(sample)
+        return {page_type: {
+            "samples": len(samples),
+            "load_ms": _median(s["navigation"] and s["navigation"]["load"] for s in samples),
+            "lcp_ms": _median(s["lcp"] and s["lcp"]["startTime"] for s in samples),
+            "cls": _median(s["cls"] for s in samples),
+            "long_task_ms": _median(s["longTasks"]["totalDuration"] for s in samples),
+            "script_duration_s": _median(s["cdp"].get("ScriptDuration") for s in samples),
+            "js_heap_used_bytes": _median(s["cdp"].get("JSHeapUsedSize") for s in samples),
+            "task_cards": max(s["taskCards"] for s in samples),
+        } for page_type, samples in by_type.items()}
+
+    def finish(self):
+        if not self.samples:
+            return
+        allure.attach(json.dumps({"summary": self.summary(), "samples": self.samples}, indent=2),
+                      name="Browser Metrics", attachment_type=allure.attachment_type.JSON)
+        self.series_path.parent.mkdir(parents=True, exist_ok=True)
+        # Single appends of whole lines, so concurrent xdist workers do not interleave records
+        with open(self.series_path, "a") as series:
+            series.write("".join(json.dumps(sample) + "\n" for sample in self.samples))
+        self.samples.clear()
+        self._cdp_sessions.clear()
+
+    def _cdp_metrics(self, page: Page) -> dict:
+        session = self._cdp_sessions.get(page)
+        if session is None:
+            session = self._cdp_sessions[page] = page.context.new_cdp_session(page)
+            session.send("Performance.enable")
+        metrics = session.send("Performance.getMetrics")["metrics"]
+        return {metric["name"]: metric["value"] for metric in metrics if metric["name"] in _CDP_METRICS}
+
+
+def _median(values) -> float | None:
+    values = [value for value in values if value is not None]
+    return statistics.median(values) if values else None
+
+
+_active_collector: BrowserMetricsCollector | None = None
+
+
+def start_test(test_id: str) -> BrowserMetricsCollector:
+    global _active_collector
+    _active_collector = BrowserMetricsCollector(test_id)
+    return _active_collector
+
+
+def get_collector() -> BrowserMetricsCollector:
+    global _active_collector
+    if _active_collector is None:
+        _active_collector = BrowserMetricsCollector()
+    return _active_collector
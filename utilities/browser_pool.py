@@ -0,0 +1,91 @@
+import logging
+from collections import deque
+
+from playwright.sync_api import Browser, BrowserContext, Playwright
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """
+    Keeps one Chrome process alive for the whole session (one per xdist worker)
+    and hands out pre-warmed BrowserContexts to tests.
+
+    A context is never shared between two tests: on release it is closed and a
+    fresh one is created to refill the pool, so cookies, storage and open pages
+    cannot leak from one test into the next. The browser itself is restarted
+    after it has served `max_tests_per_browser` tests to keep memory in check.
+    """
+
+    def __init__(self, playwright: Playwright, launch_options: dict, context_options: dict,
+                 pool_size: int = 2, max_tests_per_browser: int = 50):
+        self.playwright = playwright
+        self.launch_options = launch_options
+        self.context_options = context_options
+        self.pool_size = max(pool_size, 1)
+        self.max_tests_per_browser = max_tests_per_browser
+        self.browser: Browser | None = None
+        self.tests_served = 0
+        self._idle: deque[BrowserContext] = deque()
+
+    def launch_browser(self) -> Browser:
+        """
+        Launches a standalone browser with the pool's launch options.
+        Used by the pool itself and by the strict-isolation mode of the `page` fixture.
+        """
+        return self.playwright.chromium.launch(**self.launch_options)
+
+    def acquire(self) -> BrowserContext:
+        """
+        Returns a clean BrowserContext with one blank page already open,
+        (re)starting the browser if needed.
+        """
+        if self.browser is None or not self.browser.is_connected():
+            self._start_browser()
+        elif self.max_tests_per_browser and self.tests_served >= self.max_tests_per_browser:
+            logger.info(f"Browser served {self.tests_served} tests, restarting it")
+            self._restart_browser()
+
+        self.tests_served += 1
+        context = self._idle.popleft() if self._idle else self._new_context()
+        # Warm the replacement now so the next test does not pay for it
+        self._fill()
+        return context
+
+    def release(self, context: BrowserContext):
+        """
+        Recycles a context handed out by `acquire`. The context is discarded rather than
+        reused, and the pool is topped up with a fresh one.
+        """
+        try:
+            context.close()
+        except Exception as e:
+            logger.warning(f"Failed to close browser context: {e}")
+        if self.browser is not None and self.browser.is_connected():
+            self._fill()
+
+    def close(self):
+        while self._idle:
+            self._idle.popleft().close()
+        if self.browser is not None:
+            self.browser.close()
+            self.browser = None
+
+    def _new_context(self) -> BrowserContext:
+        context = self.browser.new_context(**self.context_options)
+        # Opening the first page spawns the renderer, which is the expensive part of a context
+        context.new_page()
+        return context
+
+    def _fill(self):
+        while len(self._idle) < self.pool_size:
+            self._idle.append(self._new_context())
+
+    def _start_browser(self):
+        self.browser = self.launch_browser()
+        self.tests_served = 0
+        self._idle.clear()
+
+    def _restart_browser(self):
+        self.close()
+        self._start_browser()
@@ -0,0 +1,187 @@
+import logging
+import queue
+import threading
+import time
+
+from config.config import Config
+from utilities.data_factory import RUN_PREFIX, get_factory
+
+logger = logging.getLogger(__name__)
+
+API = "api"
+DB = "db"
+
+
+class ApiCleanupBackend:
+    def __init__(self, client=None):
+        from utilities.api_client import KanboardApiClient
+        self.client = client or KanboardApiClient()
+
+    def list_projects(self) -> list[tuple[int, str, int]]:
+        return [(int(project["id"]), project["name"], int(project.get("last_modified") or 0))
+                for project in self.client.get_all_projects()]
+
+    def remove_projects(self, project_ids: list[int]) -> int:
+        # removeProject returns false for a project that is already gone; only confirmed removals count
+        return sum(self.client.remove_projects(project_ids))
+
+    def remove_tasks(self, task_ids: list[int]) -> int:
+        return sum(self.client.remove_tasks(task_ids))
+
+    def close(self):
+        self.client.close()
+
+
+class DbCleanupBackend:
+    def __init__(self):
+        from utilities.database import Database
+        self.db = Database()
+
+    def list_projects(self) -> list[tuple[int, str, int]]:
+        rows = self.db.fetch_all("SELECT id, name, last_modified FROM projects WHERE name LIKE %s",
+                                 (f"{RUN_PREFIX}%",))
+        self.db.connection.rollback()
+        return [(project_id, name, last_modified or 0) for project_id, name, last_modified in rows]
+
+    def remove_projects(self, project_ids: list[int]) -> int:
+        # Kanboard's foreign keys cascade to the projects' columns, swimlanes, tasks, ...
+        with self.db.connection:
+            return self.db.execute_query("DELETE FROM projects WHERE id = ANY(%s)", (project_ids,)).rowcount
+
+    def remove_tasks(self, task_ids: list[int]) -> int:
+        with self.db.connection:
+            return self.db.execute_query("DELETE FROM tasks WHERE id = ANY(%s)", (task_ids,)).rowcount
+
+    def close(self):
+        self.db.close()
+
+
+_BACKENDS = {API: ApiCleanupBackend, DB: DbCleanupBackend}
+
+
+class CleanupRegistry:
+    """
+    Collects the projects and tasks a test creates and deletes them in batches,
+    through the JSON-RPC API or straight from the database.
+
+    Tests register what they create instead of deleting it through the UI:
+
+        project_id = project_page.get_project_id_from_url()
+        cleanup.register_project(project_id)
+
+    `flush` deletes everything registered so far. In background mode the deletion is
+    handed to a worker thread (with its own API client or DB connection), so the next
+    test starts right away; `close` waits for it to finish.
+    """
+
+    def __init__(self, method: str = Config.CLEANUP_METHOD, background: bool = Config.CLEANUP_BACKGROUND,
+                 backend_factory=None):
+        if method not in _BACKENDS:
+            raise ValueError(f"Unknown cleanup method '{method}', expected one of {sorted(_BACKENDS)}")
+        self.method = method
+        # Called once per deleting thread, since neither backend may be shared between threads
+        self.backend_factory = backend_factory or _BACKENDS[method]
+        self.background = background
+        self.deleted = {"projects": 0, "tasks": 0}
+        self.errors = 0
+        self._projects: set[int] = set()
+        self._tasks: set[int] = set()
+        self._lock = threading.Lock()
+        self._backend = None
+        self._queue: queue.Queue | None = None
+        self._thread: threading.Thread | None = None
+
+    def register_project(self, project_id: int):
+        with self._lock:
+            self._projects.add(int(project_id))
+
+    def register_task(self, task_id: int, project_id: int | None = None):
+        """
+        Registers a task created in a project that outlives the test. Tasks of a
+        registered project are deleted together with it and need no registration.
+        """
+        with self._lock:
+            if project_id is None or int(project_id) not in self._projects:
+                self._tasks.add(int(task_id))
+
+    def flush(self):
+        with self._lock:
+            projects, tasks = sorted(self._projects), sorted(self._tasks)
+            self._projects.clear()
+            self._tasks.clear()
+        if not projects and not tasks:
+            return
+        if self.background:
+            self._start_thread()
+            self._queue.put((projects, tasks))
+        else:
+            self._delete(projects, tasks)
+
+    def wait(self):
+        """
+        Blocks until every flushed batch has been deleted.
+        """
+        if self._queue is not None:
+            self._queue.join()
+
+    def close(self):
+        self.flush()
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        if self._backend is not None:
+            self._backend.close()
+            self._backend = None
+        logger.info(f"Cleanup deleted {self.deleted['projects']} projects and {self.deleted['tasks']} tasks "
+                    f"({self.errors} failed batches)")
+
+    def sweep_orphans(self, min_age: float = Config.CLEANUP_ORPHAN_MIN_AGE, run_id: str | None = None) -> int:
+        """
+        Deletes projects left behind by crashed runs: every project named with the
+        framework's prefix that does not belong to this run and has not been modified
+        for `min_age` seconds (so that concurrent runs are left alone).
+        Returns the number of projects deleted.
+        """
+        own_prefix = f"{RUN_PREFIX}{run_id or get_factory().run_id}-"
+        cutoff = time.time() - min_age
+        backend = self.backend_factory()
+        try:
+            orphans = [project_id for project_id, name, last_modified in backend.list_projects()
+                       if name.startswith(RUN_PREFIX) and not name.startswith(own_prefix) and last_modified < cutoff]
+            if not orphans:
+                return 0
+            swept = backend.remove_projects(orphans)
+            logger.info(f"Swept {swept} of {len(orphans)} orphaned test projects")
+            return swept
+        finally:
+            backend.close()
+
+    def _start_thread(self):
+        if self._thread is None:
+            self._queue = queue.Queue()
+            self._thread = threading.Thread(target=self._run, name="cleanup", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = self._queue.get()
+            try:
+                if batch is None:
+                    return
+                self._delete(*batch)
+            finally:
+                self._queue.task_done()
+
+    def _delete(self, projects: list[int], tasks: list[int]):
+        try:
+            if self._backend is None:
+                self._backend = self.backend_factory()
+            if tasks:
+                self.deleted["tasks"] += self._backend.remove_tasks(tasks)
+            if projects:
+                self.deleted["projects"] += self._backend.remove_projects(projects)
+        except Exception:
+            # Cleanup must never fail a test; leftovers are caught by the next orphan sweep
+            self.errors += 1
+            logger.exception(f"Cleanup of projects {projects} and tasks {tasks} failed")
@@ -2,4 +2,15 @@ SMALL_TIMEOUT = 10000 # Small timeout in milliseconds (10 second)
 DEFAULT_TIMEOUT = 30000 # Default timeout in milliseconds (30 seconds)
 BASE_URL = r"http://localhost:8080/"
 BOARD = r"board/"
-NUM_TASKS_FOR_PERFORMANCE = 50
\ No newline at end of file
+NUM_TASKS_FOR_PERFORMANCE = 50
+BOARD_COLUMNS = ("Backlog", "Ready", "Work in progress", "Done") # Default columns of a new Kanboard project
+DEFAULT_SWIMLANE = "Default swimlane"
+# Kanboard endpoints the page objects wait on (regular expressions on the request URL)
+TASK_SAVE_ENDPOINT = r"controller=TaskCreationController&action=save"
+BOARD_MOVE_ENDPOINT = r"controller=BoardAjaxController&action=save"
+PROJECT_URL_PATTERN = r"/project/\d+"
+# Scale-curve suite (tests/test_scale.py); the sizes can also be given with --scale-sizes
+SCALE_TASK_COUNTS = (10, 100, 1000, 10000)
+SCALE_SWIMLANES = (DEFAULT_SWIMLANE, "Expedite", "Maintenance")
+SCALE_REPETITIONS = 3 # Timed repetitions of the repeatable measurements (board load, DB count)
+SCALE_MAX_EXPONENT = 1.2 # A fitted growth exponent above this is flagged as super-linear
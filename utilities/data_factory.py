@@ -0,0 +1,91 @@
+import itertools
+import os
+import random
+import uuid
+import zlib
+
+from config.config import Config
+
+# Every name generated by the framework starts with this, which lets cleanup find leftovers of crashed runs
+RUN_PREFIX = "QA-"
+
+_ADJECTIVES = ("Agile", "Bold", "Brisk", "Calm", "Clever", "Crimson", "Eager", "Golden", "Lively", "Lunar",
+               "Nimble", "Quiet", "Rapid", "Silver", "Solid", "Steady", "Sunny", "Swift", "Vivid", "Wise")
+_NOUNS = ("Atlas", "Beacon", "Comet", "Delta", "Falcon", "Harbor", "Horizon", "Meadow", "Nebula", "Orbit",
+          "Pioneer", "Quartz", "Ridge", "Summit", "Tundra", "Vertex", "Voyager", "Willow", "Zenith", "Zephyr")
+_VERBS = ("Review", "Update", "Fix", "Design", "Test", "Deploy", "Document", "Refactor", "Plan", "Verify")
+_OBJECTS = ("login form", "release notes", "search page", "billing report", "user profile", "API docs",
+            "backup job", "dashboard", "onboarding flow", "audit log", "export task", "settings page")
+
+
+def _default_run_id() -> str:
+    # pytest-xdist gives every worker of one run the same test run uid
+    return Config.RUN_ID or os.getenv("PYTEST_XDIST_TESTRUNUID", uuid.uuid4().hex)[:8]
+
+
+class DataFactory:
+    """
+    Generates test data names that are unique per xdist worker and per run.
+
+    Every name starts with "QA-<run id>-<worker id>-<counter>", so two workers (or two runs)
+    can never produce the same project name or task title. The remaining words come from small
+    built-in vocabularies through a seeded RNG, which makes a run reproducible with the same
+    DATA_SEED. Faker is only imported when rich text is explicitly requested.
+    """
+
+    def __init__(self, run_id: str | None = None, worker_id: str | None = None, seed: int | None = None):
+        self.run_id = run_id or _default_run_id()
+        self.worker_id = worker_id or os.getenv("PYTEST_XDIST_WORKER", "main")
+        self.prefix = f"{RUN_PREFIX}{self.run_id}-{self.worker_id}"
+        if seed is None:
+            seed = Config.DATA_SEED if Config.DATA_SEED is not None else zlib.crc32(self.prefix.encode())
+        self.seed = seed
+        self._rng = random.Random(seed)
+        self._counter = itertools.count(1)
+        self._faker = None
+
+    def unique_prefix(self) -> str:
+        return f"{self.prefix}-{next(self._counter):05d}"
+
+    def project_name(self) -> str:
+        return f"{self.unique_prefix()} Project {self._rng.choice(_ADJECTIVES)} {self._rng.choice(_NOUNS)}"
+
+    def task_title(self) -> str:
+        return f"{self.unique_prefix()} {self._rng.choice(_VERBS)} {self._rng.choice(_OBJECTS)}"
+
+    def description(self, rich: bool = False) -> str:
+        """
+        A short description from the built-in vocabulary, or Faker text when `rich` is true.
+        """
+        if rich:
+            return f"Description: {self.faker.text(max_nb_chars=200)}"
+        return (f"Description: {self._rng.choice(_VERBS)} the {self._rng.choice(_OBJECTS)} "
+                f"for {self._rng.choice(_ADJECTIVES)} {self._rng.choice(_NOUNS)}")
+
+    def project_names(self, count: int) -> list[str]:
+        return [self.project_name() for _ in range(count)]
+
+    def task_titles(self, count: int) -> list[str]:
+        return [self.task_title() for _ in range(count)]
+
+    @property
+    def faker(self):
+        if self._faker is None:
+            # Faker loads every provider on import, so it is only paid for when rich text is needed
+            from faker import Faker
+            self._faker = Faker()
+            self._faker.seed_instance(self.seed)
+        return self._faker
+
+
+_factory: DataFactory | None = None
+
+
+def get_factory() -> DataFactory:
+    """
+    The factory shared by this process (one per xdist worker).
+    """
+    global _factory
+    if _factory is None:
+        _factory = DataFactory()
+    return _factory
@@ -1,14 +1,113 @@
+import csv
+import hashlib
+import io
+import itertools
+import json
+import logging
+import re
+import select
+import time
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable
+
+import allure
 import psycopg2
-from config.config import DB_CONFIG
+from psycopg2 import sql
+from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
+
+from config.config import Config, DB_CONFIG
+from utilities.constants import BOARD_COLUMNS, DEFAULT_SWIMLANE, SMALL_TIMEOUT
+from utilities.data_factory import RUN_PREFIX
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "qa_changes"
+# One statement, serialized with an advisory lock so concurrent xdist workers can run it safely.
+# Statement-level triggers keep the overhead on Kanboard's writes to a single NOTIFY per statement.
+_INSTALL_NOTIFY_TRIGGERS = f"""
+DO $$
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('{NOTIFY_CHANNEL}'));
+    CREATE OR REPLACE FUNCTION qa_notify_change() RETURNS trigger AS $fn$
+    BEGIN
+        PERFORM pg_notify('{NOTIFY_CHANNEL}', TG_TABLE_NAME);
+        RETURN NULL;
+    END;
+    $fn$ LANGUAGE plpgsql;
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'qa_notify_tasks') THEN
+        CREATE TRIGGER qa_notify_tasks AFTER INSERT OR UPDATE OR DELETE ON tasks
+            FOR EACH STATEMENT EXECUTE FUNCTION qa_notify_change();
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'qa_notify_projects') THEN
+        CREATE TRIGGER qa_notify_projects AFTER INSERT OR UPDATE OR DELETE ON projects
+            FOR EACH STATEMENT EXECUTE FUNCTION qa_notify_change();
+    END IF;
+END
+$$;
+"""
+
+# The triggers only live for the test run: the xdist controller (or the single process) drops them
+# at the end of the session, and snapshots are captured without them (see remove_notify_triggers)
+_REMOVE_NOTIFY_TRIGGERS = f"""
+DO $$
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('{NOTIFY_CHANNEL}'));
+    DROP TRIGGER IF EXISTS qa_notify_tasks ON tasks;
+    DROP TRIGGER IF EXISTS qa_notify_projects ON projects;
+    DROP FUNCTION IF EXISTS qa_notify_change();
+END
+$$;
+"""
+
+# Hot verification queries, run as server-side prepared statements (see Database.fetch_one_prepared)
+PROJECT_COUNT_BY_NAME = "SELECT COUNT(*) FROM projects WHERE name = %s"
+TASK_COUNT_BY_PROJECT = "SELECT COUNT(*) FROM tasks WHERE project_id = %s"
+TASK_IS_ACTIVE = "SELECT is_active FROM tasks WHERE title = %s AND project_id = %s"
+
+# Slow queries are re-run under EXPLAIN ANALYZE only when that is harmless: plain reads that write
+# nothing, lock nothing and advance no sequence (see _is_plain_read)
+_READ_QUERY = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+_SIDE_EFFECTS = re.compile(r"\b(INSERT|UPDATE|DELETE|MERGE|INTO|FOR\s+(KEY\s+)?SHARE|nextval|setval|"
+                           r"pg_\w*advisory\w*|pg_notify|pg_terminate_backend|pg_cancel_backend|set_config)\b",
+                           re.IGNORECASE)
+# Names of the prepared statements whose query is a plain read
+_plain_read_statements: set[str] = set()
+# Names of the statements prepared on each connection; PREPARE lasts as long as the session
+_prepared_statements: "weakref.WeakKeyDictionary[object, set[str]]" = weakref.WeakKeyDictionary()
+
+# Dedicated LISTEN connection, shared by every Database in this process.
+# False means the triggers could not be installed and waits fall back to polling.
+_listener = None
+# Whether this process installed the notify triggers, so they are removed at the end of the run
+_triggers_installed = False
 
 
 class Database:
-    def __init__(self):
-        self.connection = psycopg2.connect(**DB_CONFIG)
+    def __init__(self, connection=None, pool: "DatabasePool | None" = None):
+        """
+        Wraps a psycopg2 connection. Without arguments a dedicated connection is opened;
+        a connection borrowed from a DatabasePool is handed back to the pool on `close`.
+        """
+        self.pool = pool
+        self.connection = connection if connection is not None else psycopg2.connect(**DB_CONFIG)
         self.cursor = self.connection.cursor()
 
     def execute_query(self, query: str, params=None):
-        self.cursor.execute(query, params or ())
+        start = time.perf_counter()
+        try:
+            self.cursor.execute(query, params or ())
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            # Only a dead pooled connection is retried; SQL errors on a live one are real failures
+            if self.pool is None or not self.connection.closed:
+                raise
+            self.connection = self.pool.replace(self.connection)
+            self.cursor = self.connection.cursor()
+            self.cursor.execute(query, params or ())
+        get_query_recorder().record(self, query, params, time.perf_counter() - start)
         return self.cursor
 
     def fetch_one(self, query: str, params=None):
@@ -19,6 +118,798 @@ class Database:
         self.execute_query(query, params)
         return self.cursor.fetchall()
 
+    def fetch_one_prepared(self, name: str, query: str, params=()):
+        """
+        Like `fetch_one`, but runs `query` (a SELECT with %s placeholders) as the server-side
+        prepared statement `name`, so Postgres parses and plans it once per connection.
+
+        Usage:
+            db_connection.fetch_one_prepared("task_count_by_project", TASK_COUNT_BY_PROJECT, (project_id,))
+        """
+        self._execute_prepared(name, query, params)
+        return self.cursor.fetchone()
+
+    def fetch_all_prepared(self, name: str, query: str, params=()):
+        self._execute_prepared(name, query, params)
+        return self.cursor.fetchall()
+
+    def explain(self, query: str, params=None) -> str:
+        """
+        Returns the `EXPLAIN (ANALYZE, BUFFERS)` plan of a read-only query. The query runs again,
+        inside a savepoint that is always rolled back, so an EXPLAIN that fails does not abort
+        the transaction of the test.
+        """
+        savepoint = not self.connection.autocommit
+        with self.connection.cursor() as cursor:
+            if savepoint:
+                cursor.execute("SAVEPOINT qa_explain")
+            try:
+                cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {query}", params or ())
+                return "\n".join(row[0] for row in cursor.fetchall())
+            finally:
+                if savepoint:
+                    cursor.execute("ROLLBACK TO SAVEPOINT qa_explain")
+                    cursor.execute("RELEASE SAVEPOINT qa_explain")
+
+    def _execute_prepared(self, name: str, query: str, params, retry: bool = True):
+        if not re.match(r"^\s*(SELECT|WITH)\b", query, re.IGNORECASE):
+            raise ValueError(f"Only read-only queries can be prepared, got: {query}")
+        prepared = _prepared_statements.setdefault(self.connection, set())
+        if name not in prepared:
+            placeholders = itertools.count(1)
+            server_query = re.sub(r"%s", lambda _: f"${next(placeholders)}", query)
+            self.execute_query(f"PREPARE {name} AS {server_query}")
+            prepared.add(name)
+            if _is_plain_read(query):
+                _plain_read_statements.add(name)
+        arguments = f"({', '.join(['%s'] * len(params))})" if params else ""
+        try:
+            return self.execute_query(f"EXECUTE {name}{arguments}", params)
+        except psycopg2.errors.InvalidSqlStatementName:
+            # The session no longer has the statement (DEALLOCATE or DISCARD ALL ran on it). The failed
+            # EXECUTE aborted the transaction, which has to be rolled back before preparing again
+            self.connection.rollback()
+            _prepared_statements.setdefault(self.connection, set()).discard(name)
+            if not retry:
+                raise
+            return self._execute_prepared(name, query, params, retry=False)
+
+    def wait_for_db_state(self, query: str, params=None, predicate=None,
+                          timeout: float = SMALL_TIMEOUT / 1000, use_notify: bool = True):
+        """
+        Re-runs `query` until `predicate(row)` is true for its first row, and returns that row.
+        By default it waits until the query returns any row at all.
+
+        Between attempts it blocks on NOTIFYs sent by triggers on `tasks` and `projects`, so the
+        check re-runs as soon as Kanboard commits a change. If the triggers cannot be installed
+        (or `use_notify=False`), it polls with exponential backoff instead. A wait for a NOTIFY
+        is capped by the same backoff, so triggers removed by another run only make it poll.
+        Raises TimeoutError if the predicate is still false after `timeout` seconds.
+
+        Usage:
+            db_connection.wait_for_db_state(
+                "SELECT is_active FROM tasks WHERE id = %s", (task_id,),
+                predicate=lambda row: row is not None and row[0] is False)
+        """
+        predicate = predicate or (lambda row: row is not None)
+        listener = _get_listener() if use_notify else None
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        while True:
+            if listener:
+                # Anything committed before this point is visible to the query below
+                _drain_notifications(listener)
+            row = self.fetch_one(query, params)
+            if predicate(row):
+                return row
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Database did not reach the expected state within {timeout} seconds."
+                                   f" Query: {query} Params: {params} Last row: {row}")
+            if listener:
+                _wait_for_notification(listener, min(delay, remaining))
+            else:
+                time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 1.0)
+
+    @contextmanager
+    def snapshot(self):
+        """
+        Runs the enclosed queries in one short read-only REPEATABLE READ transaction,
+        so a multi-query verification sees a single consistent snapshot of the database.
+
+        Usage:
+            with db_connection.snapshot():
+                project_count = db_connection.fetch_one(...)[0]
+                task_count = db_connection.fetch_one(...)[0]
+        """
+        self.connection.rollback()
+        self.execute_query("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY")
+        try:
+            yield self
+        finally:
+            self.connection.rollback()
+
     def close(self):
-        self.cursor.close()
-        self.connection.close()
\ No newline at end of file
+        if not self.cursor.closed:
+            self.cursor.close()
+        if self.pool is not None:
+            self.pool.release(self.connection)
+        else:
+            self.connection.close()
+
+
+def _get_listener():
+    global _listener, _triggers_installed
+    if _listener is None or (_listener and _listener.closed):
+        try:
+            connection = psycopg2.connect(**DB_CONFIG)
+            connection.autocommit = True
+            with connection.cursor() as cursor:
+                cursor.execute(_INSTALL_NOTIFY_TRIGGERS)
+                _triggers_installed = True
+                cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+            _listener = connection
+        except psycopg2.Error as e:
+            logger.warning(f"Could not set up change notifications, falling back to polling: {e}")
+            _listener = False
+    return _listener
+
+
+def _reset_listener():
+    """
+    Drops the LISTEN connection, e.g. after the database it listened on was replaced.
+    """
+    global _listener
+    if _listener:
+        _listener.close()
+    _listener = None
+
+
+def notify_triggers_installed() -> bool:
+    return _triggers_installed
+
+
+def mark_notify_triggers_installed():
+    """
+    Records that another process (an xdist worker) installed the notify triggers.
+    """
+    global _triggers_installed
+    _triggers_installed = True
+
+
+def remove_notify_triggers(db_config: dict = DB_CONFIG):
+    """
+    Drops the notify triggers from Kanboard's tables, so the application is not left instrumented
+    after the run. Call it once every process of the run is done waiting.
+    """
+    global _triggers_installed
+    _reset_listener()
+    connection = psycopg2.connect(**db_config)
+    try:
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            cursor.execute(_REMOVE_NOTIFY_TRIGGERS)
+        _triggers_installed = False
+    finally:
+        connection.close()
+
+
+def _drain_notifications(listener):
+    listener.poll()
+    listener.notifies.clear()
+
+
+def _wait_for_notification(listener, timeout: float):
+    if select.select([listener], [], [], timeout) != ([], [], []):
+        _drain_notifications(listener)
+
+
+class DbAssertions:
+    """
+    Bundles a test's database checks into a single CTE query, so they cost one round trip and
+    are evaluated against one consistent snapshot. The bundled query is prepared on the server,
+    so a combination of checks that every test repeats is parsed and planned only once.
+
+    Usage:
+        db_assertions.project_count(project_name, 0).task_count(project_id, 0).verify()
+
+    `verify` reports every failed check at once.
+    """
+
+    def __init__(self, db: Database):
+        self.db = db
+        self.checks: list[tuple[str, str, tuple, object]] = []
+
+    def check(self, description: str, query: str, params: tuple, expected) -> "DbAssertions":
+        """
+        Adds a check: `query` must return a single value (or no row, read as None) equal to `expected`.
+        """
+        self.checks.append((description, query, tuple(params), expected))
+        return self
+
+    def project_count(self, name: str, expected: int) -> "DbAssertions":
+        return self.check(f"Number of projects named '{name}'", PROJECT_COUNT_BY_NAME, (name,), expected)
+
+    def task_count(self, project_id: int, expected: int) -> "DbAssertions":
+        return self.check(f"Number of tasks in project {project_id}", TASK_COUNT_BY_PROJECT, (int(project_id),),
+                          expected)
+
+    def task_active(self, title: str, project_id: int, expected: bool = True) -> "DbAssertions":
+        return self.check(f"is_active of task '{title}'", TASK_IS_ACTIVE, (title, int(project_id)), expected)
+
+    def build_query(self) -> tuple[str, tuple]:
+        ctes = ", ".join(f"c{i}(value) AS ({query})" for i, (_, query, _, _) in enumerate(self.checks))
+        # Scalar subqueries turn a check without rows into NULL instead of an empty result
+        values = ", ".join(f"(SELECT value FROM c{i})" for i in range(len(self.checks)))
+        params = tuple(param for _, _, check_params, _ in self.checks for param in check_params)
+        return f"WITH {ctes} SELECT {values}", params
+
+    def fetch(self) -> list:
+        query, params = self.build_query()
+        name = f"qa_assert_{hashlib.sha1(query.encode()).hexdigest()[:16]}"
+        return list(self.db.fetch_one_prepared(name, query, params))
+
+    def verify(self):
+        """
+        Runs every added check in one query, then clears them.
+        """
+        if not self.checks:
+            return
+        with allure.step(f"Verifying {len(self.checks)} database checks in one query"):
+            checks = self.checks
+            try:
+                values = self.fetch()
+            finally:
+                self.checks = []
+            failures = [f"{description}: expected {expected!r}, got {value!r}"
+                        for (description, _, _, expected), value in zip(checks, values) if value != expected]
+            assert not failures, "Database checks failed:\n" + "\n".join(failures)
+
+
+class QueryRecorder:
+    """
+    Records the latency of every query of the running test. When a read-only query takes longer
+    than `slow_ms`, its `EXPLAIN (ANALYZE, BUFFERS)` plan is captured and attached to Allure.
+    """
+
+    def __init__(self, slow_ms: float = Config.SLOW_QUERY_MS, explain: bool = Config.EXPLAIN_SLOW_QUERIES):
+        self.slow_ms = slow_ms
+        self.explain = explain
+        self.queries: list[dict] = []
+
+    def record(self, db: Database, query: str, params, elapsed: float):
+        elapsed_ms = elapsed * 1000
+        entry = {"query": " ".join(query.split()), "ms": round(elapsed_ms, 3)}
+        if self.explain and elapsed_ms > self.slow_ms and _is_plain_read(query):
+            try:
+                entry["plan"] = db.explain(query, params)
+            except psycopg2.Error as e:
+                logger.warning(f"Could not explain slow query: {e}")
+            else:
+                logger.warning(f"Slow query ({elapsed_ms:.0f} ms): {entry['query']}")
+                allure.attach(entry["plan"], name=f"EXPLAIN ({elapsed_ms:.0f} ms): {entry['query'][:80]}",
+                              attachment_type=allure.attachment_type.TEXT)
+        self.queries.append(entry)
+
+    @contextmanager
+    def explain_disabled(self):
+        """
+        Captures no plans inside the block, for queries whose latency is being measured:
+        the EXPLAIN ANALYZE re-run would otherwise be timed with them.
+        """
+        explain, self.explain = self.explain, False
+        try:
+            yield self
+        finally:
+            self.explain = explain
+
+    def summary(self) -> list[dict]:
+        """
+        Per-query count, total and maximum latency, slowest total first.
+        """
+        totals: dict[str, dict] = {}
+        for entry in self.queries:
+            query = totals.setdefault(entry["query"], {"query": entry["query"], "count": 0, "total_ms": 0.0,
+                                                       "max_ms": 0.0})
+            query["count"] += 1
+            query["total_ms"] += entry["ms"]
+            query["max_ms"] = max(query["max_ms"], entry["ms"])
+        return sorted(totals.values(), key=lambda query: query["total_ms"], reverse=True)
+
+    def finish(self):
+        if self.queries:
+            allure.attach(json.dumps(self.summary(), indent=2), name="DB Queries",
+                          attachment_type=allure.attachment_type.JSON)
+        self.queries.clear()
+
+
+def _is_plain_read(query: str) -> bool:
+    """
+    Whether `query` can run a second time without side effects: a SELECT (or WITH ... SELECT) without
+    data-modifying CTEs, SELECT INTO, row locks, sequence, advisory lock or notify calls. EXECUTE
+    qualifies when its statement was prepared from such a query. Anything unsure counts as not plain.
+    """
+    execute = re.match(r"^\s*EXECUTE\s+(\w+)", query, re.IGNORECASE)
+    if execute:
+        return execute.group(1) in _plain_read_statements
+    return bool(_READ_QUERY.match(query)) and not _SIDE_EFFECTS.search(query)
+
+
+_active_recorder: QueryRecorder | None = None
+
+
+def start_test() -> QueryRecorder:
+    global _active_recorder
+    _active_recorder = QueryRecorder()
+    return _active_recorder
+
+
+def get_query_recorder() -> QueryRecorder:
+    global _active_recorder
+    if _active_recorder is None:
+        _active_recorder = QueryRecorder()
+    return _active_recorder
+
+
+class DatabasePool:
+    """
+    Session-level pool of Postgres connections (one pool per xdist worker).
+
+    Connections are health-checked when they are handed out and replaced transparently
+    if the server dropped them, so a restarted Postgres does not fail the rest of the run.
+    """
+
+    def __init__(self, minconn: int = Config.DB_POOL_MIN, maxconn: int = Config.DB_POOL_MAX,
+                 db_config: dict = DB_CONFIG):
+        self._pool = ThreadedConnectionPool(minconn, maxconn, **db_config)
+
+    def acquire(self) -> Database:
+        return Database(connection=self.getconn(), pool=self)
+
+    def getconn(self):
+        connection = self._pool.getconn()
+        if self._is_healthy(connection):
+            return connection
+        logger.warning("Discarding broken pooled database connection")
+        return self.replace(connection)
+
+    def replace(self, connection):
+        """
+        Drops a broken connection from the pool and returns a fresh one in its place.
+        """
+        self._pool.putconn(connection, close=True)
+        return self._pool.getconn()
+
+    def release(self, connection):
+        if not connection.closed:
+            try:
+                # Never hand the next test a connection that is still inside our transaction
+                connection.rollback()
+            except psycopg2.Error:
+                pass
+        self._pool.putconn(connection, close=bool(connection.closed))
+
+    def close(self):
+        self._pool.closeall()
+
+    @staticmethod
+    def _is_healthy(connection) -> bool:
+        if connection.closed:
+            return False
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            connection.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+
+@dataclass
+class SeedReport:
+    project_id: int
+    column_ids: dict[str, int]
+    swimlane_ids: dict[str, int]
+    task_ids: list[int]
+    rows: dict[str, int] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def total_rows(self) -> int:
+        return sum(self.rows.values())
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.total_rows / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        per_table = ", ".join(f"{table}: {count}" for table, count in self.rows.items())
+        return (f"Seeded project {self.project_id}: {self.total_rows} rows ({per_table}) "
+                f"in {self.elapsed:.3f} s, {self.rows_per_second:,.0f} rows/s")
+
+
+class _CsvStream(io.RawIOBase):
+    """
+    File-like object that renders rows to CSV lazily, so COPY can stream
+    any number of rows without building them all in memory.
+    """
+
+    def __init__(self, rows):
+        self._rows = iter(rows)
+        self._buffer = io.StringIO()
+        # Strings are quoted and None is left an unquoted empty field, which is how CSV COPY tells
+        # an empty string from NULL (QUOTE_NONNUMERIC would quote None into an empty string)
+        self._writer = csv.writer(self._buffer, lineterminator="\n", quoting=csv.QUOTE_STRINGS)
+        self._pending = b""
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        while size < 0 or len(self._pending) < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._writer.writerow(row)
+            self._pending += self._buffer.getvalue().encode()
+            self._buffer.seek(0)
+            self._buffer.truncate()
+        if size < 0:
+            size = len(self._pending)
+        chunk, self._pending = self._pending[:size], self._pending[size:]
+        return chunk
+
+
+class _Counter:
+    """
+    Pass-through iterator that counts the rows consumed by COPY / execute_values.
+    """
+
+    def __init__(self, rows):
+        self._rows = iter(rows)
+        self.count = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        row = next(self._rows)
+        self.count += 1
+        return row
+
+
+class DatabaseSeeder:
+    """
+    Bulk-loads realistic Kanboard data straight into Postgres, bypassing the UI and the API.
+
+    A whole project (project -> columns -> swimlanes -> tasks -> comments/subtasks) is written in
+    one transaction. Ids are reserved from each table's own sequence up front, so foreign keys
+    can be filled in while streaming and the sequences stay consistent with the data for Kanboard.
+
+    Rows are streamed with `COPY ... FROM STDIN` by default, or with multi-row INSERTs
+    (`execute_values`) when `method="values"`.
+    """
+
+    def __init__(self, db: Database, method: str = "copy", page_size: int = 1000):
+        if method not in ("copy", "values"):
+            raise ValueError(f"Unknown seeding method '{method}'. Expected 'copy' or 'values'")
+        self.db = db
+        self.method = method
+        self.page_size = page_size
+
+    def seed_project(self, name: str, num_tasks: int, columns: tuple[str, ...] = BOARD_COLUMNS,
+                     swimlanes: tuple[str, ...] = (DEFAULT_SWIMLANE,), comments_per_task: int = 0,
+                     subtasks_per_task: int = 0, title_prefix: str = "Task",
+                     description: str = "") -> SeedReport:
+        """
+        Creates a project with the given columns and swimlanes and spreads `num_tasks` tasks
+        round-robin over every column/swimlane cell.
+        """
+        with allure.step(f"Seeding project '{name}' with {num_tasks} tasks"):
+            start = time.perf_counter()
+            now = int(time.time())
+            with self.db.connection, self.db.connection.cursor() as cursor:
+                project_id = self._reserve_ids(cursor, "projects", 1)[0]
+                column_ids = dict(zip(columns, self._reserve_ids(cursor, "columns", len(columns))))
+                swimlane_ids = dict(zip(swimlanes, self._reserve_ids(cursor, "swimlanes", len(swimlanes))))
+                task_ids = self._reserve_ids(cursor, "tasks", num_tasks)
+                report = SeedReport(project_id, column_ids, swimlane_ids, task_ids)
+
+                report.rows["projects"] = self._write(
+                    cursor, "projects", ("id", "name", "is_active", "token", "last_modified", "is_public"),
+                    [(project_id, name, True, "", now, False)])
+                report.rows["columns"] = self._write(
+                    cursor, "columns", ("id", "title", "position", "project_id"),
+                    [(column_id, title, position, project_id)
+                     for position, (title, column_id) in enumerate(column_ids.items(), start=1)])
+                report.rows["swimlanes"] = self._write(
+                    cursor, "swimlanes", ("id", "name", "position", "is_active", "project_id"),
+                    [(swimlane_id, title, position, True, project_id)
+                     for position, (title, swimlane_id) in enumerate(swimlane_ids.items(), start=1)])
+                report.rows["tasks"] = self._write(
+                    cursor, "tasks",
+                    ("id", "title", "description", "date_creation", "date_modification", "date_moved",
+                     "color_id", "project_id", "column_id", "swimlane_id", "position", "is_active"),
+                    self._task_rows(task_ids, project_id, list(column_ids.values()), list(swimlane_ids.values()),
+                                    title_prefix, description, now))
+                if comments_per_task:
+                    report.rows["comments"] = self._write(
+                        cursor, "comments", ("task_id", "date_creation", "date_modification", "comment"),
+                        ((task_id, now, now, f"Comment {n} on task {task_id}")
+                         for task_id in task_ids for n in range(1, comments_per_task + 1)))
+                if subtasks_per_task:
+                    report.rows["subtasks"] = self._write(
+                        cursor, "subtasks", ("title", "status", "task_id", "position"),
+                        ((f"Subtask {n}", 0, task_id, n)
+                         for task_id in task_ids for n in range(1, subtasks_per_task + 1)))
+
+            report.elapsed = time.perf_counter() - start
+            allure.attach(str(report), name="Seeding Report", attachment_type=allure.attachment_type.TEXT)
+            return report
+
+    @staticmethod
+    def _task_rows(task_ids, project_id, column_ids, swimlane_ids, title_prefix, description, now):
+        positions: dict[tuple[int, int], int] = {}
+        for index, task_id in enumerate(task_ids):
+            column_id = column_ids[index % len(column_ids)]
+            swimlane_id = swimlane_ids[(index // len(column_ids)) % len(swimlane_ids)]
+            position = positions[(column_id, swimlane_id)] = positions.get((column_id, swimlane_id), 0) + 1
+            yield (task_id, f"{title_prefix} {index + 1}", description, now, now, now,
+                   "yellow", project_id, column_id, swimlane_id, position, True)
+
+    @staticmethod
+    def _reserve_ids(cursor, table: str, count: int) -> list[int]:
+        cursor.execute("SELECT nextval(pg_get_serial_sequence(%s, 'id')) FROM generate_series(1, %s)",
+                       (table, count))
+        return [row[0] for row in cursor.fetchall()]
+
+    def _write(self, cursor, table: str, columns: tuple[str, ...], rows) -> int:
+        """
+        Writes rows into `table` and returns how many were written.
+        """
+        counted = _Counter(rows)
+        column_list = ", ".join(columns)
+        if self.method == "copy":
+            cursor.copy_expert(f"COPY {table} ({column_list}) FROM STDIN WITH (FORMAT csv)", _CsvStream(counted))
+        else:
+            execute_values(cursor, f"INSERT INTO {table} ({column_list}) VALUES %s", counted,
+                           page_size=self.page_size)
+        return counted.count
+
+
+# Template databases holding named snapshots are called qa_snapshot_<name>
+SNAPSHOT_PREFIX = "qa_snapshot_"
+# The known-good database every other snapshot is built from
+BASE_SNAPSHOT = "base"
+
+
+def _remove_test_data(db: Database):
+    # Every project named by the data factory, of any run; Kanboard's foreign keys cascade to
+    # the projects' columns, swimlanes, tasks, ...
+    db.execute_query("DELETE FROM projects WHERE name LIKE %s", (f"{RUN_PREFIX}%",))
+    # A running test session's notify triggers must not be restored with the snapshot
+    db.execute_query(_REMOVE_NOTIFY_TRIGGERS)
+
+
+def _seed_large_board(db: Database) -> dict:
+    report = DatabaseSeeder(db).seed_project("Snapshot 10k-task board", 10000,
+                                             swimlanes=(DEFAULT_SWIMLANE, "Expedite", "Maintenance"))
+    return {"project_id": report.project_id}
+
+
+# Named snapshots built on top of the base snapshot. A builder fills the database and returns
+# JSON data (e.g. ids) that restoring the snapshot hands back to the test.
+SNAPSHOT_BUILDERS: dict[str, Callable[[Database], dict | None]] = {
+    "10k-task board": _seed_large_board,
+}
+
+
+class DatabaseSnapshots:
+    """
+    Named snapshots of the Kanboard database, kept as Postgres template databases.
+
+    `restore(name)` copies the snapshot with `CREATE DATABASE ... TEMPLATE`, a file-level copy that
+    takes milliseconds instead of deleting data row by row, under a staging name, then swaps it in:
+    the Kanboard database is renamed away, the copy renamed to it and the old one dropped. If the copy
+    fails, the Kanboard database is left as it was. Every session on the Kanboard database is
+    terminated for the swap: Kanboard opens a new connection per request, and pooled connections are
+    health-checked and replaced when they are handed out again.
+
+    The base snapshot is a copy of the live database (Kanboard with its admin setup) from which all
+    test data is removed: every project named with the data factory's prefix, of this run or of
+    any crashed one, is deleted from the copy, so leftovers are never restored. The live database is
+    not touched. Other snapshots restore the base, run their builder and are captured in turn.
+    A snapshot is rebuilt when Kanboard's schema version changed since it was taken, or after
+    `drop(name)`.
+
+    The Kanboard database is shared by every xdist worker, so restoring only makes sense in a
+    serial run. The Postgres user needs CREATEDB (the docker-compose user is a superuser).
+    """
+
+    def __init__(self, db_config: dict = DB_CONFIG, maintenance_db: str = Config.DB_MAINTENANCE_DB,
+                 builders: dict[str, Callable[[Database], dict | None]] | None = None, retries: int = 5):
+        self.db_config = dict(db_config)
+        self.database = db_config["database"]
+        self.maintenance_db = maintenance_db
+        self.builders = {**SNAPSHOT_BUILDERS, **(builders or {})}
+        self.retries = retries
+        self._admin = None
+
+    def register(self, name: str, builder: Callable[[Database], dict | None]):
+        self.builders[name] = builder
+
+    def snapshots(self) -> dict[str, dict]:
+        """
+        Every stored snapshot by name, with its metadata (schema version, capture time and builder data).
+        """
+        rows = self._admin_query("SELECT shobj_description(oid, 'pg_database') FROM pg_database "
+                                 "WHERE datname LIKE %s", (f"{SNAPSHOT_PREFIX}%",))
+        snapshots = {}
+        for (comment,) in rows:
+            metadata = json.loads(comment) if comment else {}
+            if "name" in metadata:
+                snapshots[metadata["name"]] = metadata
+        return snapshots
+
+    def ensure(self, name: str = BASE_SNAPSHOT) -> dict | None:
+        """
+        Builds the snapshot unless an up-to-date one exists, and returns its builder data.
+        The Kanboard database is left in an unspecified state.
+        """
+        with self._lock():
+            return self._ensure(name)
+
+    def capture(self, name: str, data: dict | None = None, prepare: Callable[[Database], None] | None = None):
+        """
+        Stores the current Kanboard database as snapshot `name`, replacing an older one.
+        `prepare` runs on the copy before it is stored, e.g. to remove data that must not be restored.
+        """
+        with allure.step(f"Capturing database snapshot '{name}'"):
+            metadata = {"name": name, "schema": self._schema_version(), "data": data,
+                        "captured_at": datetime.now(timezone.utc).isoformat(timespec="seconds")}
+            template = _snapshot_database(name)
+            self._admin_execute(sql.SQL("DROP DATABASE IF EXISTS {}").format(sql.Identifier(template)))
+            self._copy(self.database, template)
+            if prepare is not None:
+                db = Database(psycopg2.connect(**{**self.db_config, "database": template}))
+                try:
+                    prepare(db)
+                    db.connection.commit()
+                finally:
+                    db.close()
+            self._admin_execute(sql.SQL("COMMENT ON DATABASE {} IS %s").format(sql.Identifier(template)),
+                                (json.dumps(metadata),))
+
+    def restore(self, name: str = BASE_SNAPSHOT) -> dict | None:
+        """
+        Replaces the Kanboard database with snapshot `name` (built first if needed)
+        and returns the snapshot's builder data.
+        """
+        with self._lock():
+            data = self._ensure(name)
+            with allure.step(f"Restoring database snapshot '{name}'"):
+                start = time.perf_counter()
+                self._replace_database(_snapshot_database(name))
+                logger.info(f"Restored database snapshot '{name}' in {(time.perf_counter() - start) * 1000:.0f} ms")
+        return data
+
+    def drop(self, name: str):
+        self._admin_execute(sql.SQL("DROP DATABASE IF EXISTS {}").format(sql.Identifier(_snapshot_database(name))))
+
+    def close(self):
+        if self._admin is not None:
+            self._admin.close()
+            self._admin = None
+
+    def _ensure(self, name: str) -> dict | None:
+        metadata = self.snapshots().get(name)
+        if metadata is not None and metadata.get("schema") == self._schema_version():
+            return metadata.get("data")
+        if name == BASE_SNAPSHOT:
+            self.capture(BASE_SNAPSHOT, prepare=_remove_test_data)
+            return None
+        if name not in self.builders:
+            raise KeyError(f"Unknown database snapshot '{name}'. Known: {', '.join(sorted(self.builders))}")
+        with allure.step(f"Building database snapshot '{name}'"):
+            self._ensure(BASE_SNAPSHOT)
+            self._replace_database(_snapshot_database(BASE_SNAPSHOT))
+            db = Database(psycopg2.connect(**self.db_config))
+            try:
+                data = self.builders[name](db)
+                db.connection.commit()
+            finally:
+                db.close()
+            self.capture(name, data)
+        return data
+
+    def _replace_database(self, template: str):
+        # A swap: the copy is made under a staging name while Kanboard's database stays in place, and
+        # only a complete copy is renamed over it. A failed copy leaves the live database untouched.
+        staging, retired = f"qa_restore_{self.database}"[:63], f"qa_retired_{self.database}"[:63]
+        for leftover in (staging, retired):
+            self._admin_execute(sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE)").format(sql.Identifier(leftover)))
+        self._copy(template, staging)
+        live = bool(self._admin_query("SELECT 1 FROM pg_database WHERE datname = %s", (self.database,)))
+        if live:
+            # Renaming needs the database free of sessions, like a template
+            self._without_sessions(self.database, sql.SQL("ALTER DATABASE {} RENAME TO {}").format(
+                sql.Identifier(self.database), sql.Identifier(retired)))
+        try:
+            self._admin_execute(sql.SQL("ALTER DATABASE {} RENAME TO {}").format(
+                sql.Identifier(staging), sql.Identifier(self.database)))
+        except psycopg2.Error:
+            if live:
+                self._admin_execute(sql.SQL("ALTER DATABASE {} RENAME TO {}").format(
+                    sql.Identifier(retired), sql.Identifier(self.database)))
+            raise
+        if live:
+            self._admin_execute(sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE)").format(sql.Identifier(retired)))
+        # The LISTEN connection and the prepared statements belonged to the replaced database
+        _reset_listener()
+
+    def _copy(self, source: str, target: str):
+        # The source of CREATE DATABASE ... TEMPLATE must have no other sessions
+        self._without_sessions(source, sql.SQL("CREATE DATABASE {} TEMPLATE {}").format(
+            sql.Identifier(target), sql.Identifier(source)))
+
+    def _without_sessions(self, database: str, statement):
+        # Kanboard may open a new session at any moment, so the sessions are terminated right before each attempt
+        for attempt in range(self.retries):
+            self._admin_query("SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+                              "WHERE datname = %s AND pid <> pg_backend_pid()", (database,))
+            try:
+                self._admin_execute(statement)
+                return
+            except psycopg2.errors.ObjectInUse:
+                if attempt == self.retries - 1:
+                    raise
+                time.sleep(0.05 * (attempt + 1))
+
+    def _schema_version(self):
+        try:
+            connection = psycopg2.connect(**self.db_config)
+        except psycopg2.OperationalError:
+            return None  # The Kanboard database does not exist (a restore failed half way)
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT version FROM schema_version")
+                row = cursor.fetchone()
+                return row[0] if row else None
+        except psycopg2.Error:
+            return None
+        finally:
+            connection.close()
+
+    @contextmanager
+    def _lock(self):
+        # Serializes building and restoring across workers and runs sharing the server
+        self._admin_query("SELECT pg_advisory_lock(hashtext(%s))", (SNAPSHOT_PREFIX,))
+        try:
+            yield
+        finally:
+            self._admin_query("SELECT pg_advisory_unlock(hashtext(%s))", (SNAPSHOT_PREFIX,))
+
+    def _admin_connection(self):
+        # CREATE/DROP DATABASE cannot run inside a transaction, nor while connected to the database itself
+        if self._admin is None or self._admin.closed:
+            self._admin = psycopg2.connect(**{**self.db_config, "database": self.maintenance_db})
+            self._admin.autocommit = True
+        return self._admin
+
+    def _admin_execute(self, statement, params=None):
+        with self._admin_connection().cursor() as cursor:
+            cursor.execute(statement, params)
+
+    def _admin_query(self, query: str, params=None) -> list[tuple]:
+        with self._admin_connection().cursor() as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+
+
+def _snapshot_database(name: str) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+    # Postgres truncates identifiers to 63 bytes; a hash keeps long names distinct
+    if len(SNAPSHOT_PREFIX) + len(slug) > 63:
+        slug = f"{slug[:40]}_{hashlib.sha1(name.encode()).hexdigest()[:10]}"
+    return f"{SNAPSHOT_PREFIX}{slug}"
@@ -0,0 +1,227 @@
+"""
+Fixture profiler plugin, registered through `pytest_plugins` in conftest.py and enabled with `--profile-fixtures`.
+
+- Times the setup and the teardown of every fixture. Setup time is the fixture's own time:
+  the setup of the fixtures it requests is counted for those.
+- Times collection and sums the setup/call/teardown phases of the tests, to show how much of
+  a test is fixture overhead.
+- Measures the import time of conftest.py and the heavy packages it pulls in, with
+  `python -X importtime` in a fresh interpreter (in this process they are imported already).
+- Reports setup steps that are not fixtures, such as conftest.py's logging configuration,
+  timed where they run with `timed(step)`.
+- Aggregates per fixture and per xdist worker, prints a ranked report in the terminal summary
+  and writes it to `reports/fixture_profile.json`.
+"""
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from config.config import Config
+
+# Imported by conftest.py or lazily by the tests; faker is only imported for rich descriptions
+IMPORT_PROFILE_MODULES = ("conftest", "faker")
+# Fixtures and imports shown in the terminal report; the JSON report has all of them
+REPORT_TOP = 15
+_IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+\d+ \|\s*(\S+)")
+
+
+# Seconds spent per setup step of this process that is not a fixture (see `timed`)
+_steps: dict[str, float] = {}
+
+
+@contextmanager
+def timed(step: str):
+    """
+    Times a setup step outside the fixtures, e.g. in pytest_configure. Always on: the
+    profiler may not be registered yet when the step runs, and it only costs two clock reads.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _steps[step] = _steps.get(step, 0.0) + time.perf_counter() - start
+
+
+def measure_imports(modules=IMPORT_PROFILE_MODULES, cwd: str | None = None) -> dict[str, float]:
+    """
+    Import time in seconds of every top-level package imported by `modules` (directly or not),
+    slowest first, measured in a fresh interpreter.
+    """
+    code = "\n".join(f"try:\n    import {module}\nexcept ImportError:\n    pass" for module in modules)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=cwd,
+                            capture_output=True, text=True, timeout=120)
+    return parse_importtime(result.stderr)
+
+
+def parse_importtime(output: str) -> dict[str, float]:
+    imports = {}
+    for line in output.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if match:
+            # Summing each module's self time per package counts nested imports exactly once
+            package = match.group(2).split(".")[0]
+            imports[package] = imports.get(package, 0.0) + int(match.group(1)) / 1e6
+    return dict(sorted(imports.items(), key=lambda item: item[1], reverse=True))
+
+
+def merge_fixtures(per_worker: dict[str, dict]) -> list[dict]:
+    """
+    Per-fixture totals over all workers, the most expensive (setup + teardown) first.
+    """
+    merged: dict[str, dict] = {}
+    for worker_id, profile in per_worker.items():
+        for name, stats in profile["fixtures"].items():
+            total = merged.setdefault(name, {"fixture": name, "scope": stats["scope"], "count": 0, "setup": 0.0,
+                                             "teardown": 0.0, "max": 0.0, "workers": []})
+            total["count"] += stats["count"]
+            total["setup"] += stats["setup"]
+            total["teardown"] += stats["teardown"]
+            total["max"] = max(total["max"], stats["max"])
+            total["workers"].append(worker_id)
+    return sorted(merged.values(), key=lambda stats: stats["setup"] + stats["teardown"], reverse=True)
+
+
+def merge_steps(per_worker: dict[str, dict]) -> dict[str, float]:
+    """
+    Per-step totals over all workers (each worker runs its own setup steps).
+    """
+    merged: dict[str, float] = {}
+    for profile in per_worker.values():
+        for step, seconds in profile.get("steps", {}).items():
+            merged[step] = merged.get(step, 0.0) + seconds
+    return merged
+
+
+class FixtureProfiler:
+    """
+    Collects the timings of one process. Under xdist every worker sends its profile to the
+    controller through `workeroutput`, and the controller writes the report.
+    """
+
+    def __init__(self, config, report_path: Path = Path(Config.REPORTS_DIR) / "fixture_profile.json"):
+        self.config = config
+        self.report_path = Path(report_path)
+        self.is_worker = hasattr(config, "workerinput")
+        self.worker_id = config.workerinput["workerid"] if self.is_worker else "main"
+        self.fixtures: dict[str, dict] = {}
+        self.phases = {"setup": 0.0, "call": 0.0, "teardown": 0.0}
+        self.collection = 0.0
+        self.workers: dict[str, dict] = {}
+        self.report: dict | None = None
+        self._children: list[float] = []  # Setup time of the requested fixtures, per open setup
+        self._teardown_started: dict[int, float] = {}
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_collection(self, session):
+        start = time.perf_counter()
+        yield
+        self.collection += time.perf_counter() - start
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        self._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            own = elapsed - self._children.pop()
+            if self._children:
+                self._children[-1] += elapsed
+            stats = self._stats(fixturedef)
+            stats["setup"] += own
+            stats["count"] += 1
+            stats["last_setup"] = own
+            # Finalizers run last-in first-out, so this one runs right before the fixture's own teardown
+            fixturedef.addfinalizer(lambda: self._teardown_started.__setitem__(id(fixturedef), time.perf_counter()))
+
+    def pytest_fixture_post_finalizer(self, fixturedef, request):
+        start = self._teardown_started.pop(id(fixturedef), None)
+        if start is None:
+            return
+        stats = self._stats(fixturedef)
+        elapsed = time.perf_counter() - start
+        stats["teardown"] += elapsed
+        stats["max"] = max(stats["max"], stats.pop("last_setup", 0.0) + elapsed)
+
+    def pytest_runtest_logreport(self, report):
+        if not self.is_worker and getattr(report, "node", None) is not None:
+            return  # Reported by an xdist worker, which counts it itself
+        self.phases[report.when] += report.duration
+
+    def pytest_sessionfinish(self, session):
+        profile = self._profile()
+        if self.is_worker:
+            session.config.workeroutput["fixture_profile"] = json.dumps(profile)
+            return
+        if profile["fixtures"] or not self.workers:
+            self.workers[self.worker_id] = profile
+        self.report = {
+            # Workers collect in parallel, the controller does not collect at all
+            "collection": max(worker["collection"] for worker in self.workers.values()),
+            "tests": {phase: sum(worker["tests"][phase] for worker in self.workers.values())
+                      for phase in self.phases},
+            "imports": measure_imports(cwd=str(session.config.rootpath)),
+            "steps": merge_steps(self.workers),
+            "fixtures": merge_fixtures(self.workers),
+            "workers": self.workers,
+        }
+        self.report_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.report_path.with_name(f"{self.report_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self.report, indent=2))
+        os.replace(tmp_path, self.report_path)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        output = getattr(node, "workeroutput", {}).get("fixture_profile")
+        if output:
+            self.workers[node.gateway.id] = json.loads(output)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.report is None:
+            return
+        write = terminalreporter.write_line
+        terminalreporter.write_sep("-", "fixture profile")
+        tests = self.report["tests"]
+        total = sum(tests.values())
+        overhead = tests["setup"] + tests["teardown"]
+        write(f"collection {self.report['collection']:.2f}s; tests {total:.2f}s, of which setup "
+              f"{tests['setup']:.2f}s, call {tests['call']:.2f}s, teardown {tests['teardown']:.2f}s "
+              f"({overhead / total if total else 0:.0%} fixture overhead)")
+        write("imports: " + ", ".join(f"{package} {seconds:.2f}s"
+                                      for package, seconds in list(self.report["imports"].items())[:8]))
+        if self.report["steps"]:
+            write("setup steps: " + ", ".join(f"{step} {seconds:.3f}s"
+                                              for step, seconds in self.report["steps"].items()))
+        write(f"{'fixture':<28} {'scope':<9} {'count':>6} {'setup':>9} {'teardown':>9} {'max':>8}  workers")
+        for stats in self.report["fixtures"][:REPORT_TOP]:
+            write(f"{stats['fixture']:<28} {stats['scope']:<9} {stats['count']:>6} {stats['setup']:>8.3f}s "
+                  f"{stats['teardown']:>8.3f}s {stats['max']:>7.3f}s  {len(stats['workers'])}")
+        write(f"full report: {self.report_path}")
+
+    def _stats(self, fixturedef) -> dict:
+        return self.fixtures.setdefault(fixturedef.argname, {"scope": fixturedef.scope, "count": 0, "setup": 0.0,
+                                                             "teardown": 0.0, "max": 0.0})
+
+    def _profile(self) -> dict:
+        fixtures = {name: {key: value for key, value in stats.items() if key != "last_setup"}
+                    for name, stats in self.fixtures.items()}
+        return {"collection": self.collection, "tests": dict(self.phases), "steps": dict(_steps), "fixtures": fixtures}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("fixture-profiler", "fixture profiler")
+    group.addoption("--profile-fixtures", action="store_true", default=False,
+                    help="Time fixture setup/teardown, collection and imports, and report them at the end")
+
+
+def pytest_configure(config):
+    if config.getoption("profile_fixtures"):
+        config.pluginmanager.register(FixtureProfiler(config), "fixture-profiler")
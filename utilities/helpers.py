@@ -1,51 +1,22 @@
-from faker import Faker
-import time
-import allure
-from functools import wraps  # Important for preserving function metadata
-
-fake = Faker()
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from utilities.data_factory import get_factory
 
 def generate_project_name():
-    return f"Project {fake.name()} {fake.random_number(digits=3)}"
+    return get_factory().project_name()
 
 def generate_task_title():
-    return f"Task {fake.text(max_nb_chars=5)} {fake.random_number(digits=2)}"
+    return get_factory().task_title()
 
 def generate_description():
-    return f"Description: {fake.text(max_nb_chars=30)}"
-
+    return get_factory().description()
 
-def measure_execution_time(step_name: str = "Function Execution Time", time_expected: float | None = None):
+def run_async(coroutine):
     """
-    A decorator to measure the execution time of a function
-    and report it as an Allure step.
-
-    Args:
-        step_name (str): The name for the Allure step.
-        :param step_name:
-        :param time_expected:
+    Runs a coroutine to completion on a fresh event loop in a thread of its own and returns its result.
+    A worker's sync Playwright session keeps its loop marked as running in the main thread,
+    where asyncio.run() refuses to start.
     """
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="asyncio") as executor:
+        return executor.submit(asyncio.run, coroutine).result()
 
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            with allure.step(step_name):
-                start_time = time.time()
-                result = func(*args, **kwargs)
-                end_time = time.time()
-                elapsed_time = end_time - start_time
-
-                # Attach the elapsed time to the Allure report
-                allure.attach(
-                    f"Execution Time: {elapsed_time:.4f} seconds",
-                    name="Performance Metric",
-                    attachment_type=allure.attachment_type.TEXT
-                )
-                if time_expected:
-                    assert elapsed_time < time_expected, (f"Expected execution time - {time_expected} seconds,"
-                                                          f" but got {elapsed_time:.4f} seconds")
-                return result
-
-        return wrapper
-
-    return decorator
\ No newline at end of file
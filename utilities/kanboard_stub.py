@@ -0,0 +1,165 @@
+import base64
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from utilities.constants import BOARD_COLUMNS
+
+
+class KanboardStubServer:
+    """
+    In-memory stand-in for Kanboard's jsonrpc.php, for exercising KanboardApiClient
+    (and anything built on it) without the Kanboard container.
+
+    Only the API methods used by the test framework are implemented. The server also
+    counts HTTP requests and TCP connections so tests can assert on batching and keep-alive,
+    and can drop connections like a restarting server: `drop_responses` requests are executed
+    but never answered, and with `close_idle` every connection is closed after its response.
+
+    Usage:
+        with KanboardStubServer() as server:
+            client = KanboardApiClient(server.url, "admin", "admin")
+    """
+
+    def __init__(self, username: str = "admin", password: str = "admin"):
+        self.credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
+        self.projects: dict[int, dict] = {}
+        self.columns: dict[int, dict] = {}
+        self.tasks: dict[int, dict] = {}
+        self.http_requests = 0
+        self.connections = 0
+        self.drop_responses = 0
+        self.close_idle = False
+        self._ids = {"project": itertools.count(1), "column": itertools.count(1), "task": itertools.count(1)}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/jsonrpc.php"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def dispatch(self, request: dict) -> dict:
+        method = getattr(self, f"_api_{request.get('method')}", None)
+        if method is None:
+            return {"jsonrpc": "2.0", "id": request.get("id"),
+                    "error": {"code": -32601, "message": "Method not found"}}
+        try:
+            with self._lock:
+                result = method(**request.get("params", {}))
+        except TypeError as e:
+            return {"jsonrpc": "2.0", "id": request.get("id"),
+                    "error": {"code": -32602, "message": f"Invalid params: {e}"}}
+        return {"jsonrpc": "2.0", "id": request.get("id"), "result": result}
+
+    def _api_createProject(self, name, **_):
+        project_id = next(self._ids["project"])
+        self.projects[project_id] = {"id": str(project_id), "name": name, "is_active": "1",
+                                     "last_modified": str(int(time.time()))}
+        for position, title in enumerate(BOARD_COLUMNS, start=1):
+            column_id = next(self._ids["column"])
+            self.columns[column_id] = {"id": str(column_id), "title": title, "position": str(position),
+                                       "project_id": str(project_id)}
+        return project_id
+
+    def _api_removeProject(self, project_id):
+        if self.projects.pop(int(project_id), None) is None:
+            return False
+        self.columns = {k: c for k, c in self.columns.items() if c["project_id"] != str(project_id)}
+        self.tasks = {k: t for k, t in self.tasks.items() if t["project_id"] != str(project_id)}
+        return True
+
+    def _api_getAllProjects(self):
+        return list(self.projects.values())
+
+    def _api_getColumns(self, project_id):
+        return sorted((c for c in self.columns.values() if c["project_id"] == str(project_id)),
+                      key=lambda c: int(c["position"]))
+
+    def _api_createTask(self, title, project_id, description="", column_id=None, swimlane_id=1, **_):
+        if int(project_id) not in self.projects or not title:
+            return False
+        columns = self._api_getColumns(project_id)
+        task_id = next(self._ids["task"])
+        self.tasks[task_id] = {
+            "id": str(task_id), "title": title, "description": description, "project_id": str(project_id),
+            "column_id": str(column_id or columns[0]["id"]), "swimlane_id": str(swimlane_id), "is_active": "1",
+            "position": str(sum(1 for t in self.tasks.values() if t["project_id"] == str(project_id)) + 1),
+        }
+        return task_id
+
+    def _api_getTask(self, task_id):
+        return self.tasks.get(int(task_id))
+
+    def _api_removeTask(self, task_id):
+        return self.tasks.pop(int(task_id), None) is not None
+
+    def _api_getAllTasks(self, project_id, status_id=1):
+        return [t for t in self.tasks.values() if t["project_id"] == str(project_id)]
+
+    def _api_moveTaskPosition(self, project_id, task_id, column_id, position, swimlane_id=1):
+        task = self.tasks.get(int(task_id))
+        if task is None or task["project_id"] != str(project_id) or int(column_id) not in self.columns:
+            return False
+        task.update(column_id=str(column_id), position=str(position), swimlane_id=str(swimlane_id))
+        return True
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, like Kanboard behind Apache/nginx
+
+            def setup(self):
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+
+            def do_POST(self):
+                with stub._lock:
+                    stub.http_requests += 1
+                if self.headers.get("Authorization") != f"Basic {stub.credentials}":
+                    self._send(401, b"")
+                    return
+                payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                if isinstance(payload, list):
+                    result = [stub.dispatch(request) for request in payload]
+                else:
+                    result = stub.dispatch(payload)
+                with stub._lock:
+                    dropped, stub.drop_responses = stub.drop_responses > 0, max(stub.drop_responses - 1, 0)
+                if dropped:
+                    self.close_connection = True
+                    return
+                self._send(200, json.dumps(result).encode())
+                self.close_connection = stub.close_idle
+
+            def _send(self, status: int, body: bytes):
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,373 @@
+import asyncio
+import json
+import logging
+import math
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+import allure
+from playwright.async_api import async_playwright
+
+from config.config import Config
+from pages.async_pages import AsyncLoginPage, AsyncProjectDashboardPage, AsyncProjectPage, AsyncTaskPage
+from utilities.api_client import KanboardApiClient
+from utilities.constants import BOARD_COLUMNS
+from utilities.helpers import run_async
+
+logger = logging.getLogger(__name__)
+
+# The scenario vocabulary shared by every kind of virtual user, mirroring the page objects
+CREATE_PROJECT = "create_project"
+CREATE_TASK = "create_task"
+MOVE_TASK = "move_task"
+DEFAULT_ACTION_MIX = {CREATE_PROJECT: 1, CREATE_TASK: 6, MOVE_TASK: 3}
+
+
+class LatencyHistogram:
+    """
+    HDR-style latency histogram: values are counted in logarithmic buckets, so any
+    percentile is reported with a bounded relative error (1% by default) in constant memory,
+    however many samples are recorded.
+    """
+
+    def __init__(self, relative_error: float = 0.01):
+        self.relative_error = relative_error
+        self._log_base = math.log1p(2 * relative_error)
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        value = max(seconds, 1e-9)
+        index = math.floor(math.log(value) / self._log_base)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram"):
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent: float) -> float:
+        if not self.count:
+            return 0.0
+        target = max(math.ceil(self.count * percent / 100), 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= target:
+                # Midpoint of the bucket, clamped to the exact extremes
+                value = math.exp((index + 0.5) * self._log_base)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "min": self.min if self.count else 0.0,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+@dataclass
+class LoadProfile:
+    """
+    Shape of a load run: `users` virtual users start evenly over `ramp_up` seconds and then
+    repeat weighted random actions from `action_mix` until `duration` seconds have passed.
+    """
+    users: int = Config.LOAD_USERS
+    ramp_up: float = Config.LOAD_RAMP_UP
+    duration: float = Config.LOAD_DURATION
+    action_mix: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_ACTION_MIX))
+    think_time: float = Config.LOAD_THINK_TIME
+    seed: int = 0
+
+
+class ApiVirtualUser:
+    """
+    Lightweight virtual user that drives Kanboard through its own JSON-RPC session.
+    The blocking client calls run in the default executor so many users share one event loop.
+    """
+
+    def __init__(self, user_id: int, name_prefix: str, api_url: str = Config.API_URL):
+        self.user_id = user_id
+        self.name_prefix = name_prefix
+        self.api_url = api_url
+        self.client: KanboardApiClient | None = None
+        self.project_ids: list[int] = []
+        self.task_ids: list[tuple[int, int]] = []
+        self.columns: dict[int, list[int]] = {}
+        self._counter = 0
+
+    async def setup(self):
+        self.client = KanboardApiClient(self.api_url)
+        await self.create_project()
+
+    async def teardown(self):
+        if self.project_ids:
+            await asyncio.to_thread(self.client.remove_projects, self.project_ids)
+        await asyncio.to_thread(self.client.close)
+
+    async def create_project(self):
+        project_id = await asyncio.to_thread(self.client.create_project, self._next_name("Project"))
+        self.project_ids.append(project_id)
+        columns = await asyncio.to_thread(self.client.get_columns, project_id)
+        self.columns[project_id] = [columns[title] for title in BOARD_COLUMNS if title in columns]
+
+    async def create_task(self):
+        project_id = self.project_ids[-1]
+        task_id = await asyncio.to_thread(self.client.create_task, project_id, self._next_name("Task"))
+        self.task_ids.append((project_id, task_id))
+
+    async def move_task(self, rng: random.Random):
+        if not self.task_ids:
+            await self.create_task()
+        project_id, task_id = rng.choice(self.task_ids)
+        column_id = rng.choice(self.columns[project_id])
+        await asyncio.to_thread(self.client.move_task, project_id, task_id, column_id)
+
+    def _next_name(self, kind: str) -> str:
+        self._counter += 1
+        return f"{self.name_prefix} {kind} u{self.user_id}-{self._counter}"
+
+
+class BrowserSession:
+    """
+    One browser shared by all browser virtual users of a load run, each user getting its own context.
+    Started and closed by LoadRunner on the run's event loop.
+    """
+
+    def __init__(self, launch_options: dict | None = None):
+        self.launch_options = launch_options or dict(headless=Config.HEADLESS, channel="chrome")
+        self.browser = None
+        self._playwright = None
+
+    async def start(self):
+        self._playwright = await async_playwright().start()
+        self.browser = await self._playwright.chromium.launch(**self.launch_options)
+
+    async def close(self):
+        if self.browser is not None:
+            await self.browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+
+
+class BrowserVirtualUser:
+    """
+    Virtual user driving the Kanboard UI with the async page objects, so an action costs what it
+    costs a real user, page rendering included. Hundreds of them share one process and one browser.
+    Its projects are removed through the API at teardown.
+    """
+
+    _next_name = ApiVirtualUser._next_name
+
+    def __init__(self, user_id: int, name_prefix: str, session: BrowserSession, app_url: str = Config.APP_URL):
+        self.user_id = user_id
+        self.name_prefix = name_prefix
+        self.session = session
+        self.app_url = app_url
+        self.context = None
+        self.project_ids: list[int] = []
+        self.tasks: dict[str, str] = {}  # Title -> column of the tasks on the current board
+        self._counter = 0
+
+    async def setup(self):
+        self.context = await self.session.browser.new_context()
+        page = await self.context.new_page()
+        label = f"u{self.user_id}"
+        self.project_page = AsyncProjectPage(page, label)
+        self.dashboard_page = AsyncProjectDashboardPage(page, label)
+        self.task_page = AsyncTaskPage(page, label)
+        login_page = AsyncLoginPage(page, label)
+        await login_page.navigate(self.app_url)
+        await login_page.login(Config.ADMIN_USER, Config.ADMIN_PASSWORD)
+        await self.create_project()
+
+    async def teardown(self):
+        try:
+            if self.project_ids:
+                client = KanboardApiClient()
+                try:
+                    await asyncio.to_thread(client.remove_projects, self.project_ids)
+                finally:
+                    await asyncio.to_thread(client.close)
+        finally:
+            if self.context is not None:
+                await self.context.close()
+
+    async def create_project(self):
+        await self.project_page.navigate(self.app_url)
+        await self.project_page.create_project(self._next_name("Project"))
+        project_id = await self.project_page.get_project_id_from_url()
+        self.project_ids.append(int(project_id))
+        self.tasks = {}
+        await self.dashboard_page.open_board(project_id)
+
+    async def create_task(self):
+        title = self._next_name("Task")
+        await self.task_page.create_task(title)
+        self.tasks[title] = BOARD_COLUMNS[0]
+
+    async def move_task(self, rng: random.Random):
+        if not self.tasks:
+            await self.create_task()
+        title = rng.choice(sorted(self.tasks))
+        column = rng.choice([column for column in BOARD_COLUMNS if column != self.tasks[title]])
+        await self.task_page.move_task(title, column)
+        self.tasks[title] = column
+
+
+@dataclass
+class LoadReport:
+    profile: LoadProfile
+    elapsed: float = 0.0
+    latencies: dict[str, LatencyHistogram] = field(default_factory=dict)
+    errors: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def operations(self) -> int:
+        return sum(histogram.count for histogram in self.latencies.values()) + self.error_count
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+    @property
+    def throughput(self) -> float:
+        return self.operations / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.error_count / self.operations if self.operations else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "profile": self.profile.__dict__,
+            "elapsed": self.elapsed,
+            "operations": self.operations,
+            "throughput": self.throughput,
+            "error_rate": self.error_rate,
+            "errors": self.errors,
+            "actions": {action: histogram.to_dict() for action, histogram in self.latencies.items()},
+        }
+
+    def __str__(self):
+        lines = [f"{self.profile.users} users, {self.elapsed:.1f}s: {self.operations} operations, "
+                 f"{self.throughput:.1f} ops/s, error rate {self.error_rate:.2%}"]
+        for action, histogram in sorted(self.latencies.items()):
+            stats = histogram.to_dict()
+            lines.append(f"  {action}: {stats['count']} ok, {self.errors.get(action, 0)} failed, "
+                         f"p50 {stats['p50'] * 1000:.1f}ms, p95 {stats['p95'] * 1000:.1f}ms, "
+                         f"p99 {stats['p99'] * 1000:.1f}ms, max {stats['max'] * 1000:.1f}ms")
+        return "\n".join(lines)
+
+    def attach(self, name: str = "Load Test"):
+        allure.attach(str(self), name=f"{name} Summary", attachment_type=allure.attachment_type.TEXT)
+        allure.attach(json.dumps(self.to_dict(), indent=2), name=f"{name} Report",
+                      attachment_type=allure.attachment_type.JSON)
+
+    def write(self, directory: Path = Path(Config.REPORTS_DIR) / "load", name: str = "load") -> Path:
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{name}-{datetime.now():%Y%m%d-%H%M%S}.json"
+        path.write_text(json.dumps(self.to_dict(), indent=2))
+        return path
+
+
+class LoadRunner:
+    """
+    Drives `profile.users` virtual users concurrently on one asyncio loop and records
+    the latency of every action in a per-action histogram.
+
+    Usage:
+        report = LoadRunner(LoadProfile(users=50), lambda i: ApiVirtualUser(i, "Load")).run()
+
+        session = BrowserSession()
+        report = LoadRunner(LoadProfile(users=10), lambda i: BrowserVirtualUser(i, "Load", session),
+                            shared=[session]).run()
+
+    `shared` objects are started before the first user and closed after the last one.
+    """
+
+    def __init__(self, profile: LoadProfile, user_factory, shared=()):
+        unknown = set(profile.action_mix) - {CREATE_PROJECT, CREATE_TASK, MOVE_TASK}
+        if unknown:
+            raise ValueError(f"Unknown load actions: {', '.join(sorted(unknown))}")
+        self.profile = profile
+        self.user_factory = user_factory
+        self.shared = list(shared)
+        self.report = LoadReport(profile, latencies={action: LatencyHistogram() for action in profile.action_mix})
+
+    def run(self) -> LoadReport:
+        with allure.step(f"Running load: {self.profile.users} users for {self.profile.duration}s"):
+            start = time.perf_counter()
+            run_async(self._run_all())
+            self.report.elapsed = time.perf_counter() - start
+            return self.report
+
+    async def _run_all(self):
+        # Blocking API calls run in the default executor: size it so no user waits for a thread
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=max(self.profile.users, 1)))
+        try:
+            for resource in self.shared:
+                await resource.start()
+            stop_at = time.monotonic() + self.profile.ramp_up + self.profile.duration
+            step = self.profile.ramp_up / self.profile.users if self.profile.users else 0
+            await asyncio.gather(*(self._run_user(user_id, user_id * step, stop_at)
+                                   for user_id in range(self.profile.users)))
+        finally:
+            for resource in reversed(self.shared):
+                await resource.close()
+
+    async def _run_user(self, user_id: int, start_delay: float, stop_at: float):
+        await asyncio.sleep(start_delay)
+        rng = random.Random(f"{self.profile.seed}-{user_id}")
+        actions, weights = zip(*self.profile.action_mix.items())
+        user = self.user_factory(user_id)
+        try:
+            await user.setup()
+        except Exception as e:
+            logger.warning(f"Virtual user {user_id} failed to start: {e}")
+            self.report.errors["setup"] = self.report.errors.get("setup", 0) + 1
+            return
+        try:
+            while time.monotonic() < stop_at:
+                action = rng.choices(actions, weights)[0]
+                started = time.perf_counter()
+                try:
+                    if action == MOVE_TASK:
+                        await user.move_task(rng)
+                    else:
+                        await getattr(user, action)()
+                    self.report.latencies[action].record(time.perf_counter() - started)
+                except Exception as e:
+                    logger.debug(f"Virtual user {user_id} failed '{action}': {e}")
+                    self.report.errors[action] = self.report.errors.get(action, 0) + 1
+                if self.profile.think_time:
+                    await asyncio.sleep(rng.expovariate(1 / self.profile.think_time))
+        finally:
+            try:
+                await user.teardown()
+            except Exception as e:
+                logger.warning(f"Virtual user {user_id} failed to clean up: {e}")
@@ -0,0 +1,66 @@
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+from playwright.sync_api import Page
+
+from pages.login_page import LoginPage
+
+logger = logging.getLogger(__name__)
+
+
+class LoginCache:
+    """
+    Logs in through the UI once and reuses the resulting Playwright storage state.
+
+    The state is persisted to disk, so every xdist worker (and every later run while
+    the Kanboard session is still valid) can start authenticated without repeating
+    the login form. An expired or invalidated session is detected on the first
+    navigation and replaced by a fresh UI login.
+    """
+
+    def __init__(self, state_dir: Path, app_url: str, username: str, password: str, max_age: int = 3600):
+        self.state_path = Path(state_dir) / f"storage_state_{username}.json"
+        self.app_url = app_url
+        self.username = username
+        self.password = password
+        self.max_age = max_age
+
+    def authenticate(self, page: Page):
+        """
+        Leaves `page` logged in on the Kanboard dashboard.
+        """
+        login_page = LoginPage(page)
+        state = self._load_state()
+        if state is not None:
+            page.context.add_cookies(state["cookies"])
+            login_page.navigate(self.app_url)
+            if not login_page.username_input.is_visible():
+                return
+            logger.info(f"Cached session for '{self.username}' has expired, logging in again")
+            page.context.clear_cookies()
+        else:
+            login_page.navigate(self.app_url)
+
+        login_page.login(self.username, self.password)
+        self._save_state(page.context.storage_state())
+
+    def invalidate(self):
+        self.state_path.unlink(missing_ok=True)
+
+    def _load_state(self) -> dict | None:
+        try:
+            if time.time() - self.state_path.stat().st_mtime > self.max_age:
+                return None
+            return json.loads(self.state_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _save_state(self, state: dict):
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a per-process temp file and rename, so concurrent workers never read a partial file
+        tmp_path = self.state_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(state))
+        os.replace(tmp_path, self.state_path)
@@ -0,0 +1,161 @@
+import hashlib
+import json
+import logging
+import os
+import re
+from pathlib import Path
+
+import allure
+from playwright.sync_api import BrowserContext, Request, Route
+
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Headers that describe the original transfer, not the (already decoded) body we store
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "date"}
+
+
+class NetworkRouter:
+    """
+    `page.route`-based network layer installed on every test's browser context.
+
+    - Requests of blocked resource types (images, fonts, ...) or matching blocked URL patterns
+      (gravatar, ...) are aborted before they leave the browser.
+    - Kanboard's static assets are served from an on-disk content cache shared by all tests and
+      xdist workers. Their URLs carry a version, so a cached copy never goes stale.
+    - Every finished request is recorded with its timing, to show where page-load time still goes.
+
+    Nothing is blocked by default. With `measure_page_load` (on with BROWSER_METRICS) the router
+    neither blocks nor serves cached assets, and only routes requests once a test calls `block`:
+    the page then loads as a user's would, so the paint and resource metrics and the screenshots
+    are not skewed. Only request timings are recorded.
+    """
+
+    def __init__(self, blocked_types: tuple[str, ...] = Config.BLOCK_RESOURCE_TYPES,
+                 blocked_patterns: tuple[str, ...] = Config.BLOCK_URL_PATTERNS,
+                 static_pattern: str = Config.STATIC_ASSET_PATTERN,
+                 cache_dir: Path = Path(Config.STATIC_CACHE_DIR),
+                 measure_page_load: bool = Config.BROWSER_METRICS):
+        if measure_page_load:
+            blocked_types, blocked_patterns, static_pattern = (), (), ""
+        self.blocked_types = set(blocked_types)
+        self.blocked_patterns = [re.compile(pattern) for pattern in blocked_patterns]
+        self.static_pattern = re.compile(static_pattern) if static_pattern else None
+        self.cache_dir = Path(cache_dir)
+        self.requests: list[dict] = []
+        self.counters = {"blocked": 0, "cache_hits": 0, "cache_misses": 0, "failed": 0}
+        self._context: BrowserContext | None = None
+        self._routed = False
+
+    def install(self, context: BrowserContext):
+        self._context = context
+        context.on("requestfinished", self._record)
+        context.on("requestfailed", self._record_failure)
+        # Every routed request goes through Python, so requests are only routed when something is intercepted
+        if self.blocked_types or self.blocked_patterns or self.static_pattern:
+            self._route()
+
+    def block(self, pattern: str):
+        """
+        Blocks an additional URL pattern (a regular expression) for the rest of the test.
+        """
+        self.blocked_patterns.append(re.compile(pattern))
+        if self._context is not None and not self._routed:
+            self._route()
+
+    def _route(self):
+        self._context.route("**/*", self._handle)
+        self._routed = True
+
+    def summary(self) -> dict:
+        by_type: dict[str, dict] = {}
+        for request in self.requests:
+            totals = by_type.setdefault(request["resource_type"], {"count": 0, "total_ms": 0.0})
+            totals["count"] += 1
+            totals["total_ms"] += request["duration_ms"]
+        slowest = sorted(self.requests, key=lambda request: request["duration_ms"], reverse=True)[:10]
+        return {**self.counters, "requests": len(self.requests), "by_type": by_type, "slowest": slowest}
+
+    def finish(self):
+        if self.requests or any(self.counters.values()):
+            allure.attach(json.dumps({"summary": self.summary(), "requests": self.requests}, indent=2),
+                          name="Network Timings", attachment_type=allure.attachment_type.JSON)
+        self.requests.clear()
+
+    def _handle(self, route: Route):
+        request = route.request
+        if request.resource_type in self.blocked_types or any(p.search(request.url) for p in self.blocked_patterns):
+            self.counters["blocked"] += 1
+            route.abort("blockedbyclient")
+        elif request.method == "GET" and self.static_pattern and self.static_pattern.search(request.url):
+            self._serve_static(route)
+        else:
+            route.continue_()
+
+    def _serve_static(self, route: Route):
+        key = hashlib.sha256(route.request.url.encode()).hexdigest()
+        body_path = self.cache_dir / key
+        meta_path = body_path.with_suffix(".json")
+        if body_path.exists() and meta_path.exists():
+            meta = json.loads(meta_path.read_text())
+            self.counters["cache_hits"] += 1
+            route.fulfill(status=meta["status"], headers=meta["headers"], body=body_path.read_bytes())
+            return
+
+        self.counters["cache_misses"] += 1
+        response = route.fetch()
+        body = response.body()
+        headers = {name: value for name, value in response.headers.items() if name.lower() not in _DROPPED_HEADERS}
+        if response.ok:
+            self._store(body_path, body)
+            self._store(meta_path, json.dumps({"url": route.request.url, "status": response.status,
+                                               "headers": headers}).encode())
+        route.fulfill(status=response.status, headers=headers, body=body)
+
+    def _store(self, path: Path, data: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Atomic rename, so another worker never serves a half-written file
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def _record(self, request: Request):
+        timing = request.timing
+        self.requests.append({
+            "url": request.url,
+            "method": request.method,
+            "resource_type": request.resource_type,
+            # Timings are in milliseconds relative to startTime; -1 means the phase did not happen
+            "dns_ms": _phase(timing, "domainLookupStart", "domainLookupEnd"),
+            "connect_ms": _phase(timing, "connectStart", "connectEnd"),
+            "wait_ms": _phase(timing, "requestStart", "responseStart"),
+            "download_ms": _phase(timing, "responseStart", "responseEnd"),
+            "duration_ms": max(timing["responseEnd"], 0.0),
+        })
+
+    def _record_failure(self, request: Request):
+        if request.failure != "net::ERR_BLOCKED_BY_CLIENT":
+            self.counters["failed"] += 1
+
+
+def _phase(timing: dict, start: str, end: str) -> float | None:
+    if timing[start] < 0 or timing[end] < 0:
+        return None
+    return timing[end] - timing[start]
+
+
+_active_router: NetworkRouter | None = None
+
+
+def start_test() -> NetworkRouter:
+    global _active_router
+    _active_router = NetworkRouter()
+    return _active_router
+
+
+def get_router() -> NetworkRouter | None:
+    """
+    The router of the running test, or None when network routing is disabled.
+    """
+    return _active_router
@@ -0,0 +1,266 @@
+"""
+Scale-curve support, registered through `pytest_plugins` in conftest.py.
+
+- Tests taking a `scale_tasks` argument are parametrized over SCALE_TASK_COUNTS,
+  or over `--scale-sizes 10,100,1000` from the command line.
+- `ScaleCurve` records one timing per metric and size. Mark the suite `xdist_group` so that every
+  size runs on one worker, one at a time.
+- At the end of the run, on the xdist controller, `ScaleReporter` merges the timings of every worker,
+  fits a power law `t = a * n^b` per metric once and flags metrics growing faster than linearly
+  (`b` above SCALE_MAX_EXPONENT) with a warning.
+- The curves are plotted on log-log axes into an SVG under reports/scale/, also attached to Allure.
+"""
+import json
+import math
+import os
+import statistics
+import time
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import allure
+import pytest
+
+from config.config import Config
+from utilities.constants import SCALE_MAX_EXPONENT, SCALE_TASK_COUNTS
+from utilities.database import get_query_recorder
+
+_COLORS = ("#1f77b4", "#d62728", "#2ca02c", "#ff7f0e", "#9467bd", "#8c564b")
+
+
+class SuperLinearScalingWarning(UserWarning):
+    pass
+
+
+@dataclass
+class PowerLawFit:
+    """
+    Least-squares fit of log(seconds) = log(coefficient) + exponent * log(size).
+    """
+    metric: str
+    coefficient: float
+    exponent: float
+    r_squared: float
+    points: int
+    max_exponent: float = SCALE_MAX_EXPONENT
+
+    @property
+    def super_linear(self) -> bool:
+        return self.exponent > self.max_exponent
+
+    def __str__(self):
+        flag = " SUPER-LINEAR" if self.super_linear else ""
+        return (f"{self.metric}: t = {self.coefficient:.3g} * n^{self.exponent:.2f} "
+                f"(R² {self.r_squared:.3f}, {self.points} sizes){flag}")
+
+
+def fit_power_law(metric: str, timings: dict[int, float], max_exponent: float = SCALE_MAX_EXPONENT) -> PowerLawFit | None:
+    """
+    Fits `timings` ({size: seconds}); None with fewer than two usable sizes.
+    """
+    points = [(math.log(size), math.log(seconds)) for size, seconds in sorted(timings.items())
+              if size > 0 and seconds > 0]
+    if len({x for x, _ in points}) < 2:
+        return None
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    syy = sum((y - mean_y) ** 2 for _, y in points)
+    exponent = sxy / sxx
+    r_squared = sxy ** 2 / (sxx * syy) if syy else 1.0
+    return PowerLawFit(metric, math.exp(mean_y - exponent * mean_x), exponent, r_squared, len(points), max_exponent)
+
+
+def measure(action: Callable[[], object], repetitions: int = 1) -> float:
+    """
+    Median wall-clock seconds of `repetitions` calls of `action`, without EXPLAIN plans of slow
+    queries, whose re-run would otherwise be timed with them.
+    """
+    samples = []
+    with get_query_recorder().explain_disabled():
+        for _ in range(max(repetitions, 1)):
+            start = time.perf_counter()
+            action()
+            samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+class ScaleCurve:
+    """
+    Timings of one scale suite recorded by this process, {metric: {size: seconds}}.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.timings: dict[str, dict[int, float]] = {}
+
+    def record(self, size: int, timings: dict[str, float]):
+        for metric, seconds in timings.items():
+            self.timings.setdefault(metric, {})[size] = seconds
+        allure.attach(json.dumps(timings, indent=2), name=f"Scale Timings ({size} tasks)",
+                      attachment_type=allure.attachment_type.JSON)
+
+
+_curves: dict[str, ScaleCurve] = {}
+
+
+def get_curve(name: str) -> ScaleCurve:
+    """
+    The curve `name` of this process; the ScaleReporter collects it at the end of the run.
+    """
+    return _curves.setdefault(name, ScaleCurve(name))
+
+
+class ScaleReporter:
+    """
+    Fits and plots every scale curve once per run. Under xdist every worker sends its timings
+    to the controller through `workeroutput`, and the controller writes the report.
+    """
+
+    def __init__(self, is_worker: bool = False, directory: Path = Path(Config.REPORTS_DIR) / "scale"):
+        self.is_worker = is_worker
+        self.directory = Path(directory)
+        self.timings: dict[str, dict[str, dict[int, float]]] = {}
+        self.fits: dict[str, list[PowerLawFit]] = {}
+
+    def merge(self, curves: dict[str, dict[str, dict]]):
+        for name, metrics in curves.items():
+            for metric, values in metrics.items():
+                self.timings.setdefault(name, {}).setdefault(metric, {}).update(
+                    {int(size): seconds for size, seconds in values.items()})
+
+    def report(self, max_exponent: float = SCALE_MAX_EXPONENT) -> dict[str, list[PowerLawFit]]:
+        """
+        Fits every metric of every curve, writes the plot and the fits under `directory`,
+        attaches them to the Allure run and warns about super-linear metrics.
+        """
+        for name, timings in sorted(self.timings.items()):
+            fits = [fit for metric in sorted(timings) if (fit := fit_power_law(metric, timings[metric], max_exponent))]
+            if not fits:
+                continue
+            self.fits[name] = fits
+            svg = render_svg(timings, fits, title=f"{name}: seconds by number of tasks")
+            report = json.dumps({"fits": [{**fit.__dict__, "super_linear": fit.super_linear} for fit in fits],
+                                 "timings": {metric: {str(size): seconds for size, seconds in sorted(values.items())}
+                                             for metric, values in timings.items()}}, indent=2)
+            self._write(f"{name}.svg", svg)
+            self._write(f"{name}.json", report)
+            # Run-level attachments, there is no running test here (allure-pytest 2.15+)
+            if hasattr(allure, "global_attach"):
+                allure.global_attach(report, name=f"Scale Curve Fits: {name}",
+                                     attachment_type=allure.attachment_type.JSON)
+                allure.global_attach(svg, name=f"Scale Curve: {name}", attachment_type=allure.attachment_type.SVG)
+            for fit in fits:
+                if fit.super_linear:
+                    warnings.warn(f"{name}: {fit.metric} grows super-linearly: exponent {fit.exponent:.2f} "
+                                  f"> {fit.max_exponent}", SuperLinearScalingWarning)
+        return self.fits
+
+    def pytest_sessionfinish(self, session):
+        local = {name: curve.timings for name, curve in _curves.items() if curve.timings}
+        if self.is_worker:
+            session.config.workeroutput["scale_curves"] = json.dumps(local)
+            return
+        self.merge(local)
+        self.report()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        output = getattr(node, "workeroutput", {}).get("scale_curves")
+        if output:
+            self.merge(json.loads(output))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.fits:
+            return
+        terminalreporter.write_sep("-", "scale curves")
+        for name, fits in self.fits.items():
+            for fit in fits:
+                terminalreporter.write_line(f"{name}: {fit}", red=fit.super_linear)
+        terminalreporter.write_line(f"plots: {self.directory}")
+
+    def _write(self, file_name: str, content: str):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / file_name
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(content)
+        os.replace(tmp_path, path)
+
+
+def render_svg(timings: dict[str, dict[int, float]], fits: list[PowerLawFit], title: str = "",
+               width: int = 720, height: int = 440) -> str:
+    """
+    Log-log plot of the measured points and the fitted line of every metric.
+    """
+    left, right, top, bottom = 70, 220, 40, 50
+    sizes = [size for values in timings.values() for size, seconds in values.items() if size > 0 and seconds > 0]
+    seconds = [value for values in timings.values() for size, value in values.items() if size > 0 and value > 0]
+    x_min, x_max = math.floor(math.log10(min(sizes))), math.ceil(math.log10(max(sizes)))
+    y_min, y_max = math.floor(math.log10(min(seconds))), math.ceil(math.log10(max(seconds)))
+    x_max, y_max = max(x_max, x_min + 1), max(y_max, y_min + 1)
+
+    def x(size: float) -> float:
+        return left + (math.log10(size) - x_min) / (x_max - x_min) * (width - left - right)
+
+    def y(value: float) -> float:
+        return height - bottom - (math.log10(value) - y_min) / (y_max - y_min) * (height - top - bottom)
+
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+             f'font-family="sans-serif" font-size="12">',
+             f'<rect width="{width}" height="{height}" fill="white"/>',
+             f'<text x="{left}" y="{top - 15}" font-size="14">{_escape(title)}</text>']
+    for exponent in range(x_min, x_max + 1):
+        parts.append(f'<line x1="{x(10 ** exponent):.1f}" y1="{top}" x2="{x(10 ** exponent):.1f}" '
+                     f'y2="{height - bottom}" stroke="#ddd"/>')
+        parts.append(f'<text x="{x(10 ** exponent):.1f}" y="{height - bottom + 18}" '
+                     f'text-anchor="middle">{10 ** exponent:g}</text>')
+    for exponent in range(y_min, y_max + 1):
+        parts.append(f'<line x1="{left}" y1="{y(10 ** exponent):.1f}" x2="{width - right}" '
+                     f'y2="{y(10 ** exponent):.1f}" stroke="#ddd"/>')
+        parts.append(f'<text x="{left - 8}" y="{y(10 ** exponent) + 4:.1f}" '
+                     f'text-anchor="end">{10 ** exponent:g}s</text>')
+    parts.append(f'<text x="{(left + width - right) / 2}" y="{height - 12}" text-anchor="middle">tasks</text>')
+
+    for index, fit in enumerate(fits):
+        color = _COLORS[index % len(_COLORS)]
+        low, high = 10 ** x_min, 10 ** x_max
+        parts.append(f'<line x1="{x(low):.1f}" y1="{y(fit.coefficient * low ** fit.exponent):.1f}" '
+                     f'x2="{x(high):.1f}" y2="{y(fit.coefficient * high ** fit.exponent):.1f}" '
+                     f'stroke="{color}" stroke-dasharray="4 3" clip-path="url(#plot)"/>')
+        for size, value in sorted(timings[fit.metric].items()):
+            if size > 0 and value > 0:
+                parts.append(f'<circle cx="{x(size):.1f}" cy="{y(value):.1f}" r="4" fill="{color}"/>')
+        label = f"{fit.metric} n^{fit.exponent:.2f}{' !' if fit.super_linear else ''}"
+        legend_y = top + 10 + index * 20
+        parts.append(f'<rect x="{width - right + 15}" y="{legend_y - 9}" width="10" height="10" fill="{color}"/>')
+        parts.append(f'<text x="{width - right + 30}" y="{legend_y}">{_escape(label)}</text>')
+    parts.insert(1, f'<defs><clipPath id="plot"><rect x="{left}" y="{top}" width="{width - left - right}" '
+                    f'height="{height - top - bottom}"/></clipPath></defs>')
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+def _escape(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("scale", "scale-curve suite")
+    group.addoption("--scale-sizes", default=None,
+                    help="Comma-separated task counts for tests taking `scale_tasks` "
+                         f"(default: {','.join(map(str, SCALE_TASK_COUNTS))})")
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(ScaleReporter(is_worker=hasattr(config, "workerinput")), "scale-reporter")
+
+
+def pytest_generate_tests(metafunc):
+    if "scale_tasks" not in metafunc.fixturenames:
+        return
+    option = metafunc.config.getoption("scale_sizes")
+    sizes = [int(size) for size in option.split(",") if size.strip()] if option else list(SCALE_TASK_COUNTS)
+    metafunc.parametrize("scale_tasks", sizes, ids=[f"{size}_tasks" for size in sizes])
@@ -0,0 +1,307 @@
+"""
+Duration-aware scheduling plugin, registered through `pytest_plugins` in conftest.py.
+
+- Records every test's duration (setup + call + teardown) to a local history file.
+- Under xdist (`-n N`, default `--dist load`), hands tests to workers longest-first (LPT),
+  each worker getting the next longest test as soon as it frees up. Tests marked
+  `@pytest.mark.xdist_group(name)` go to one worker together, as with `--dist loadgroup`.
+- `--shard-count N --shard-index I` keeps only shard I of N duration-balanced shards, for CI matrix jobs.
+  Every shard must read the same history, or the shards would not partition the suite alike;
+  `merge_shard_histories` combines what the shards recorded afterwards.
+- Prints the predicted and the actual makespan in the terminal summary.
+"""
+import heapq
+import json
+import os
+import statistics
+import time
+import warnings
+from pathlib import Path
+
+import pytest
+
+from config.config import Config
+
+try:
+    from xdist.scheduler import LoadScheduling
+except ImportError:  # pytest-xdist is a dev dependency; without it only history, sharding and the report apply
+    LoadScheduling = None
+
+# Predicted duration of a test without history when there is no history at all
+DEFAULT_DURATION = 1.0
+# Weight of the latest run in the moving average kept in the history file
+HISTORY_WEIGHT = 0.5
+
+
+class DurationHistory:
+    """
+    Per-test durations in seconds, smoothed with an exponential moving average across runs.
+    """
+
+    def __init__(self, path: Path = Path(Config.DURATION_HISTORY_FILE)):
+        self.path = Path(path)
+        self.durations: dict[str, float] = json.loads(self.path.read_text()) if self.path.exists() else {}
+        self._default = statistics.median(self.durations.values()) if self.durations else DEFAULT_DURATION
+
+    def predict(self, nodeid: str) -> float:
+        """
+        The expected duration of a test; a test without history gets the median of the known ones.
+        """
+        return self.durations.get(_strip_group(nodeid), self._default)
+
+    def update(self, observed: dict[str, float]):
+        for nodeid, duration in observed.items():
+            nodeid = _strip_group(nodeid)
+            previous = self.durations.get(nodeid)
+            self.durations[nodeid] = duration if previous is None else \
+                HISTORY_WEIGHT * duration + (1 - HISTORY_WEIGHT) * previous
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self.durations, indent=2, sort_keys=True))
+        os.replace(tmp_path, self.path)
+
+
+def merge_shard_histories(paths: list[Path], history: DurationHistory | None = None) -> DurationHistory:
+    """
+    Merges the history files saved by the shards of one CI run into `history`, the history every
+    shard started from: a test takes the duration of the shard that ran it. Saves and returns it.
+    """
+    history = history or DurationHistory()
+    shared = dict(history.durations)
+    for path in paths:
+        for nodeid, duration in json.loads(Path(path).read_text()).items():
+            if shared.get(nodeid) != duration:
+                history.durations[nodeid] = duration
+    history.save()
+    return history
+
+
+def lpt_partition(durations: list[float], bins: int) -> list[list[int]]:
+    """
+    Longest-processing-time-first: assigns each index of `durations`, longest first,
+    to the currently least loaded bin. Deterministic, so every xdist worker gets the same shards.
+    """
+    partition = [[] for _ in range(bins)]
+    loads = [(0.0, index) for index in range(bins)]
+    for position in sorted(range(len(durations)), key=lambda i: (-durations[i], i)):
+        load, index = heapq.heappop(loads)
+        partition[index].append(position)
+        heapq.heappush(loads, (load + durations[position], index))
+    return partition
+
+
+def group_units(groups: list[str | None]) -> list[list[int]]:
+    """
+    Indices of the tests grouped into scheduling units: the tests of one xdist group form a
+    single unit, in collection order, and every other test is a unit of its own.
+    """
+    units: list[list[int]] = []
+    by_group: dict[str, list[int]] = {}
+    for index, group in enumerate(groups):
+        if group is None:
+            units.append([index])
+        elif group in by_group:
+            by_group[group].append(index)
+        else:
+            by_group[group] = [index]
+            units.append(by_group[group])
+    return units
+
+
+def _item_group(item) -> str | None:
+    names = {str(mark.args[0] if mark.args else mark.kwargs.get("name", "default"))
+             for mark in item.iter_markers("xdist_group")}
+    return "_".join(sorted(names)) or None
+
+
+def _nodeid_group(nodeid: str) -> str | None:
+    # xdist's loadgroup convention: workers report grouped tests as "<nodeid>@<group>"
+    return nodeid.rsplit("@", 1)[1] if nodeid.rfind("@") > nodeid.rfind("]") else None
+
+
+def _strip_group(nodeid: str) -> str:
+    return nodeid.rsplit("@", 1)[0] if _nodeid_group(nodeid) else nodeid
+
+
+def predict_makespan(durations: list[float], workers: int) -> float:
+    partition = lpt_partition(durations, max(workers, 1))
+    return max((sum(durations[i] for i in part) for part in partition), default=0.0)
+
+
+# The LoadScheduling internals LptScheduling works on. They are not part of xdist's API, hence the
+# pinned version range in pyproject.toml and the fallback to xdist's own scheduling if they change.
+_LOAD_SCHEDULING_STATE = ("node2collection", "node2pending", "pending", "collection", "collection_is_completed",
+                          "_check_nodes_have_same_collection", "nodes")
+
+
+class SchedulingFallbackWarning(UserWarning):
+    pass
+
+
+def missing_scheduler_state(scheduler) -> list[str]:
+    return [name for name in _LOAD_SCHEDULING_STATE if not hasattr(scheduler, name)]
+
+
+if LoadScheduling is not None:
+    class LptScheduling(LoadScheduling):
+        """
+        xdist `load` scheduling with the pending tests sorted longest-first. Every worker holds two
+        tests (a worker needs its next test before it can finish the current one) and is topped up
+        with the longest remaining test whenever it completes one. An xdist group is scheduled as
+        one unit, by its total duration, and sent to a single worker in collection order.
+        """
+
+        def __init__(self, config, log=None, history: DurationHistory | None = None):
+            super().__init__(config, log)
+            self.history = history or DurationHistory()
+            self._unit_of: dict[int, list[int]] = {}
+
+        def schedule(self):
+            assert self.collection_is_completed
+            if self.collection is not None:
+                for node in self.nodes:
+                    self.check_schedule(node)
+                return
+            if not self._check_nodes_have_same_collection():
+                self.log("**Different tests collected, aborting run**")
+                return
+
+            self.collection = next(iter(self.node2collection.values()))
+            units = group_units([_nodeid_group(nodeid) for nodeid in self.collection])
+            units.sort(key=lambda unit: -sum(self.history.predict(self.collection[index]) for index in unit))
+            self._unit_of = {index: unit for unit in units for index in unit}
+            self.pending[:] = [index for unit in units for index in unit]
+            for node in self.nodes:
+                self._send_tests(node, 2)
+            if not self.pending:
+                for node in self.nodes:
+                    node.shutdown()
+
+        def check_schedule(self, node, duration: float = 0):
+            if node.shutting_down:
+                return
+            if self.pending:
+                if len(self.node2pending[node]) < 2:
+                    self._send_tests(node, 1)
+            else:
+                node.shutdown()
+
+        def _send_tests(self, node, num: int):
+            # Whole units only, so the tests of an xdist group never end up on different workers
+            tests = []
+            while self.pending and len(tests) < num:
+                unit = set(self._unit_of.get(self.pending[0], [self.pending[0]]))
+                tests += [index for index in self.pending if index in unit]
+                self.pending[:] = [index for index in self.pending if index not in unit]
+            if tests:
+                self.node2pending[node].extend(tests)
+                node.send_runtest_some(tests)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("scheduling", "duration-aware scheduling")
+    group.addoption("--shard-count", type=int, default=1,
+                    help="Split the suite into this many duration-balanced shards")
+    group.addoption("--shard-index", type=int, default=0,
+                    help="Run only this shard (0-based) of --shard-count")
+    group.addoption("--no-duration-scheduling", action="store_true", default=False,
+                    help="Use xdist's default load scheduling instead of longest-first")
+
+
+def pytest_configure(config):
+    shard_count, shard_index = config.getoption("shard_count"), config.getoption("shard_index")
+    if shard_count < 1 or not 0 <= shard_index < shard_count:
+        raise pytest.UsageError(f"--shard-index must be in [0, {shard_count}) and --shard-count at least 1")
+    config.pluginmanager.register(DurationReporter(config), "duration-reporter")
+
+
+def _uses_duration_scheduling(config) -> bool:
+    return (LoadScheduling is not None and not config.getoption("no_duration_scheduling")
+            and config.getoption("dist") == "load")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if not _uses_duration_scheduling(config):
+        return None
+    scheduler = LptScheduling(config, log, DurationHistory())
+    missing = missing_scheduler_state(scheduler)
+    if missing:
+        warnings.warn(f"This pytest-xdist version has no LoadScheduling.{', '.join(missing)}; "
+                      f"using its default scheduling instead of longest-first", SchedulingFallbackWarning)
+        return None
+    return scheduler
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput["duration_scheduling"] = _uses_duration_scheduling(node.config)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    if getattr(config, "workerinput", {}).get("duration_scheduling"):
+        # Tells LptScheduling the group of every test, like xdist does under --dist loadgroup
+        for item in items:
+            group = _item_group(item)
+            if group:
+                item._nodeid = f"{item.nodeid}@{group}"
+    shard_count, shard_index = config.getoption("shard_count"), config.getoption("shard_index")
+    if shard_count == 1:
+        return
+    history = DurationHistory()
+    # An xdist group stays within one shard
+    units = group_units([_item_group(item) for item in items])
+    partition = lpt_partition([sum(history.predict(items[index].nodeid) for index in unit) for unit in units],
+                              shard_count)
+    selected = {index for position in partition[shard_index] for index in units[position]}
+    config.hook.pytest_deselected(items=[item for i, item in enumerate(items) if i not in selected])
+    # The shard keeps collection order, which keeps module and class fixtures together
+    items[:] = [item for i, item in enumerate(items) if i in selected]
+
+
+class DurationReporter:
+    """
+    Collects test durations (on the controller under xdist) to update the history,
+    and compares the makespan predicted from the history with the actual one.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.is_worker = hasattr(config, "workerinput")
+        self.history = DurationHistory()
+        self.observed: dict[str, float] = {}
+        self.worker_busy: dict[str, float] = {}
+        self.summary: str | None = None
+        self.started = time.perf_counter()
+
+    def pytest_runtest_logreport(self, report):
+        if self.is_worker:
+            return
+        self.observed[report.nodeid] = self.observed.get(report.nodeid, 0.0) + report.duration
+        node = getattr(report, "node", None)
+        worker_id = node.gateway.id if node is not None else "main"
+        self.worker_busy[worker_id] = self.worker_busy.get(worker_id, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        if self.is_worker or not self.observed:
+            return
+        # Predicted from the history as it was before this run updates it
+        workers = len(self.worker_busy)
+        predicted = predict_makespan([self.history.predict(nodeid) for nodeid in self.observed], workers)
+        self.summary = (f"{len(self.observed)} tests on {workers} worker(s): predicted makespan {predicted:.1f}s, "
+                        f"actual {time.perf_counter() - self.started:.1f}s wall clock, "
+                        f"busiest worker {max(self.worker_busy.values()):.1f}s")
+        self.history.update(self.observed)
+        self.history.save()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.summary is None:
+            return
+        terminalreporter.write_sep("-", "duration scheduling")
+        terminalreporter.write_line(self.summary)
+        shard_count = self.config.getoption("shard_count")
+        if shard_count > 1:
+            terminalreporter.write_line(f"shard {self.config.getoption('shard_index')} of {shard_count}")
@@ -0,0 +1,115 @@
+from collections import deque
+
+import allure
+from playwright.sync_api import Page
+
+from config.config import Config
+from utilities.artifacts import Artifact, ArtifactStore, get_store
+
+NEVER = "never"  # No screenshots at all, not even on failure
+ON_FAILURE = "on-failure"  # Only the failing action is captured
+RING_BUFFER = "ring-buffer"  # Keep the last N frames, attach them only if the test fails
+ALWAYS = "always"  # Every action is captured and attached immediately
+SCREENSHOT_MODES = (NEVER, ON_FAILURE, RING_BUFFER, ALWAYS)
+
+
+class ScreenshotRecorder:
+    """
+    Decides whether BasePage actions capture a screenshot and where it goes.
+
+    One recorder is active per test. The mode comes from SCREENSHOT_MODE for the whole run,
+    or from `@pytest.mark.screenshots("<mode>", buffer_size=N)` on a single test.
+
+    With an ArtifactStore, captures go to disk right away and Allure only gets links to them;
+    without one they are embedded in the Allure results as PNG.
+    """
+
+    def __init__(self, mode: str = Config.SCREENSHOT_MODE, buffer_size: int = Config.SCREENSHOT_BUFFER_SIZE,
+                 store: ArtifactStore | None = None):
+        if mode not in SCREENSHOT_MODES:
+            raise ValueError(f"Unknown screenshot mode '{mode}'. Expected one of: {', '.join(SCREENSHOT_MODES)}")
+        self.mode = mode
+        self.store = store
+        self.frames: deque[tuple[str, bytes | Artifact]] = deque(maxlen=max(buffer_size, 1))
+
+    def record(self, page: Page, name: str, full_page: bool = False):
+        """
+        Called after a successful action.
+        """
+        if self.mode == ALWAYS:
+            self._attach(name, page.screenshot(full_page=full_page))
+        elif self.mode == RING_BUFFER:
+            # Buffered frames are viewport-only: they are cheaper and most of them are thrown away
+            frame = page.screenshot(full_page=False)
+            if len(self.frames) == self.frames.maxlen:
+                # The oldest frame is about to fall out; identical frames share one stored artifact
+                oldest = self.frames[0][1]
+                if not any(frame is oldest for _, frame in list(self.frames)[1:]):
+                    self._discard([oldest])
+            self.frames.append((name, self.store.put(frame) if self.store else frame))
+
+    def record_failure(self, page: Page, name: str):
+        """
+        Called when an action fails. Attaches the buffered history followed by a full-page capture.
+        """
+        if self.mode == NEVER:
+            return
+        self.attach_failure(name, page.screenshot(full_page=True))
+
+    def attach_failure(self, name: str, screenshot: bytes):
+        """
+        `record_failure` with an already captured screenshot, e.g. from an async page.
+        """
+        if self.mode == NEVER:
+            return
+        self.flush()
+        self._attach(name, screenshot, pinned=True)
+
+    def flush(self):
+        while self.frames:
+            name, frame = self.frames.popleft()
+            if isinstance(frame, Artifact):
+                self.store.link(frame, name)
+            else:
+                self._attach(name, frame)
+
+    def finish(self, failed: bool):
+        """
+        Called at test teardown. Buffered frames are only kept if the test failed.
+        """
+        if failed:
+            self.flush()
+        self._discard([frame for _, frame in self.frames])
+        self.frames.clear()
+
+    def _attach(self, name: str, body: bytes, pinned: bool = False):
+        if self.store:
+            self.store.attach(name, body, pinned=pinned)
+        else:
+            allure.attach(body, name=name, attachment_type=allure.attachment_type.PNG)
+
+    def _discard(self, frames: list):
+        if self.store:
+            self.store.discard(frame for frame in frames if isinstance(frame, Artifact))
+
+
+_active_recorder: ScreenshotRecorder | None = None
+
+
+def start_test(mode: str = Config.SCREENSHOT_MODE, buffer_size: int = Config.SCREENSHOT_BUFFER_SIZE) -> ScreenshotRecorder:
+    """
+    Installs a fresh recorder for the test that is about to run.
+    """
+    global _active_recorder
+    _active_recorder = ScreenshotRecorder(mode, buffer_size, get_store() if Config.ARTIFACT_STORE else None)
+    return _active_recorder
+
+
+def get_recorder() -> ScreenshotRecorder:
+    """
+    Returns the recorder of the running test, or a run-level default outside of pytest.
+    """
+    global _active_recorder
+    if _active_recorder is None:
+        _active_recorder = ScreenshotRecorder()
+    return _active_recorder
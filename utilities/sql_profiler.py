@@ -0,0 +1,169 @@
+import json
+import logging
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+import allure
+import psycopg2
+
+from config.config import Config, DB_CONFIG
+
+logger = logging.getLogger(__name__)
+
+_DATABASE_COUNTERS = ("xact_commit", "xact_rollback", "blks_read", "blks_hit", "tup_returned", "tup_fetched",
+                      "tup_inserted", "tup_updated", "tup_deleted")
+# Statements of the profiler itself, left out of the report
+_OWN_STATEMENTS = ("pg_stat_statements", "pg_stat_database", "pg_stat_clear_snapshot")
+
+# Per process: whether pg_stat_statements is usable, and its total time column
+# (total_exec_time since Postgres 13, total_time before)
+_extension: dict | None = None
+
+
+class SqlProfiler:
+    """
+    Attributes Kanboard's server-side SQL to single UI actions.
+
+    Around each profiled BasePage action, `pg_stat_statements` and the `pg_stat_database` counters
+    of the test database are read before and after, and the difference is kept per action: which
+    statements Kanboard ran, how often, for how long and for how many rows. Everything that ran in
+    the database during the action is counted, including other workers' statements.
+
+    Needs the pg_stat_statements extension (preloaded by docker-compose.yml); without it the
+    profiler disables itself.
+    """
+
+    def __init__(self, db, test_id: str | None = None, report_path: Path = Path(Config.REPORTS_DIR) / "sql_profile.jsonl"):
+        self.db = db
+        self.test_id = test_id
+        self.report_path = Path(report_path)
+        self.actions: list[dict] = []
+        self.enabled = _check_extension()
+
+    @contextmanager
+    def measure(self, action: str):
+        if not self.enabled:
+            yield
+            return
+        try:
+            before = self._snapshot()
+        except psycopg2.Error as e:
+            logger.warning(f"SQL profile of '{action}' skipped: {e}")
+            yield
+            return
+        try:
+            yield
+        finally:
+            # In a transaction the action aborted this fails too; the action's own error must win
+            try:
+                after = self._snapshot()
+            except psycopg2.Error as e:
+                logger.warning(f"SQL profile of '{action}' skipped: {e}")
+            else:
+                self.actions.append({"action": action, **_diff(before, after)})
+
+    def summary(self) -> list[dict]:
+        return sorted(({"action": entry["action"], "calls": entry["calls"], "total_ms": entry["total_ms"]}
+                       for entry in self.actions), key=lambda entry: entry["total_ms"], reverse=True)
+
+    def finish(self):
+        if not self.actions:
+            return
+        allure.attach(json.dumps({"summary": self.summary(), "actions": self.actions}, indent=2),
+                      name="SQL per UI Action", attachment_type=allure.attachment_type.JSON)
+        self.report_path.parent.mkdir(parents=True, exist_ok=True)
+        # One line per test, appended with O_APPEND so xdist workers can share the file
+        line = json.dumps({"test": self.test_id, "worker": os.getenv("PYTEST_XDIST_WORKER", "main"),
+                           "actions": self.actions}) + "\n"
+        with open(self.report_path, "a", encoding="utf-8") as report:
+            report.write(line)
+        self.actions.clear()
+
+    def _snapshot(self) -> dict:
+        connection = self.db.connection
+        # A cursor of its own, so neither the test's cursor nor the query timings are touched
+        with connection.cursor() as cursor:
+            cursor.execute(f"""
+                SELECT queryid, query, calls, {_extension['time_column']}, rows
+                FROM pg_stat_statements
+                WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+            """)
+            statements = {row[0]: row[1:] for row in cursor.fetchall()}
+            # Statistics views are frozen for the rest of a transaction once read
+            cursor.execute("SELECT pg_stat_clear_snapshot()")
+            cursor.execute(f"SELECT {', '.join(_DATABASE_COUNTERS)} FROM pg_stat_database "
+                           f"WHERE datname = current_database()")
+            counters = dict(zip(_DATABASE_COUNTERS, cursor.fetchone()))
+        return {"statements": statements, "database": counters}
+
+
+def _diff(before: dict, after: dict) -> dict:
+    statements = []
+    for queryid, (query, calls, total_ms, rows) in after["statements"].items():
+        _, calls_before, total_ms_before, rows_before = before["statements"].get(queryid, (query, 0, 0.0, 0))
+        if calls > calls_before and not any(own in query for own in _OWN_STATEMENTS):
+            statements.append({"query": " ".join(query.split()), "calls": calls - calls_before,
+                               "total_ms": round(total_ms - total_ms_before, 3), "rows": rows - rows_before})
+    statements.sort(key=lambda statement: statement["total_ms"], reverse=True)
+    return {
+        "calls": sum(statement["calls"] for statement in statements),
+        "total_ms": round(sum(statement["total_ms"] for statement in statements), 3),
+        "statements": statements,
+        # pg_stat_database is updated by the statistics collector about every 500 ms, so these lag a little
+        "database": {name: after["database"][name] - before["database"][name] for name in _DATABASE_COUNTERS},
+    }
+
+
+def _check_extension(db_config: dict = DB_CONFIG) -> bool:
+    """
+    Creates the extension if needed and probes it, once per process. This runs on a short-lived
+    connection of its own, so the transaction of the test's connection is neither committed nor
+    rolled back.
+    """
+    global _extension
+    if _extension is None:
+        connection = None
+        try:
+            connection = psycopg2.connect(**db_config)
+            connection.autocommit = True
+            with connection.cursor() as cursor:
+                cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_stat_statements")
+                cursor.execute("""
+                    SELECT column_name FROM information_schema.columns
+                    WHERE table_name = 'pg_stat_statements' AND column_name IN ('total_exec_time', 'total_time')
+                """)
+                columns = {row[0] for row in cursor.fetchall()}
+                cursor.execute("SELECT 1 FROM pg_stat_statements LIMIT 1")
+            _extension = {"available": True,
+                          "time_column": "total_exec_time" if "total_exec_time" in columns else "total_time"}
+        except psycopg2.Error as e:
+            logger.warning(f"SQL profiling disabled, pg_stat_statements is not available: {e}")
+            _extension = {"available": False}
+        finally:
+            if connection is not None:
+                connection.close()
+    return _extension["available"]
+
+
+_active_profiler: SqlProfiler | None = None
+
+
+def start_test(db, test_id: str) -> SqlProfiler:
+    global _active_profiler
+    _active_profiler = SqlProfiler(db, test_id)
+    return _active_profiler
+
+
+def stop_test():
+    global _active_profiler
+    if _active_profiler is not None:
+        _active_profiler.finish()
+        _active_profiler = None
+
+
+def get_profiler() -> SqlProfiler | None:
+    """
+    The profiler of the running test, or None when SQL_PROFILER is off or the test has no database.
+    """
+    return _active_profiler
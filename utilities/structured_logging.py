@@ -0,0 +1,152 @@
+import heapq
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+import allure_commons
+
+# Per-worker files are named test_execution.<worker>.jsonl and merged into test_execution.jsonl
+LOG_NAME = "test_execution"
+_CONSOLE_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_context = {"test_id": None, "worker_id": "main"}
+_steps = threading.local()
+_listener: logging.handlers.QueueListener | None = None
+
+
+class _AllureStepTracker:
+    """
+    allure-commons plugin keeping the stack of open Allure steps of each thread.
+    """
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        _step_stack().append((uuid, title))
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        stack = _step_stack()
+        while stack and stack.pop()[0] != uuid:
+            pass
+
+
+def _step_stack() -> list:
+    if not hasattr(_steps, "stack"):
+        _steps.stack = []
+    return _steps.stack
+
+
+_step_tracker = _AllureStepTracker()
+
+
+class _ContextFilter(logging.Filter):
+    """
+    Stamps every record with the test, worker and Allure step, in the thread that logs it.
+    """
+
+    def filter(self, record):
+        stack = _step_stack()
+        record.test_id = _context["test_id"]
+        record.worker_id = _context["worker_id"]
+        record.step = stack[-1][1] if stack else None
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "worker": getattr(record, "worker_id", None),
+            "test": getattr(record, "test_id", None),
+            "step": getattr(record, "step", None),
+            "thread": record.threadName,
+        }
+        return json.dumps(entry, default=str)
+
+
+def configure(log_dir: Path, worker_id: str, level: str = "INFO"):
+    """
+    Configures logging once for this process (one per xdist worker).
+
+    Records are stamped with their context and put on a queue by the logging thread;
+    a QueueListener thread does the formatting and the file and console I/O.
+    """
+    global _listener
+    if _listener is not None:
+        return
+    log_dir.mkdir(parents=True, exist_ok=True)
+    _context["worker_id"] = worker_id
+
+    file_handler = logging.FileHandler(log_dir / f"{LOG_NAME}.{worker_id}.jsonl", mode="w", encoding="utf-8")
+    file_handler.setFormatter(JsonFormatter())
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(_CONSOLE_FORMAT))
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(_ContextFilter())
+    root = logging.getLogger()
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
+    allure_commons.plugin_manager.register(_step_tracker)
+
+
+def set_test(test_id: str | None):
+    _context["test_id"] = test_id
+
+
+def shutdown():
+    """
+    Writes out every queued record and stops the listener thread.
+    """
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    root = logging.getLogger()
+    for handler in [h for h in root.handlers if isinstance(h, logging.handlers.QueueHandler)]:
+        root.removeHandler(handler)
+    allure_commons.plugin_manager.unregister(_step_tracker)
+    _listener = None
+
+
+def remove_worker_logs(log_dir: Path):
+    """
+    Removes per-worker files left behind by a run that crashed before merging them.
+    """
+    for path in log_dir.glob(f"{LOG_NAME}.*.jsonl"):
+        path.unlink()
+
+
+def merge_worker_logs(log_dir: Path) -> Path:
+    """
+    Merges the per-worker files into one file ordered by timestamp and removes them.
+    """
+    worker_files = sorted(log_dir.glob(f"{LOG_NAME}.*.jsonl"))
+    merged_path = log_dir / f"{LOG_NAME}.jsonl"
+    tmp_path = merged_path.with_name(f"{merged_path.name}.{os.getpid()}.tmp")
+    files = [open(path, encoding="utf-8") for path in worker_files]
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as merged:
+            # Each file is already in time order, so a streaming k-way merge is enough
+            merged.writelines(heapq.merge(*files, key=lambda line: json.loads(line)["ts"]))
+    finally:
+        for file in files:
+            file.close()
+    os.replace(tmp_path, merged_path)
+    for path in worker_files:
+        path.unlink()
+    return merged_path
@@ -0,0 +1,56 @@
+import json
+import time
+from contextlib import contextmanager
+
+import allure
+
+
+class WaitRecorder:
+    """
+    Accumulates how long each page object action spent waiting (for a response, a navigation,
+    a locator, ...), to find the slow waits of a test. Attached to Allure at the end of the test.
+    """
+
+    def __init__(self):
+        self.waits: dict[str, dict] = {}
+
+    @contextmanager
+    def measure(self, action: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            totals = self.waits.setdefault(action, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            totals["count"] += 1
+            totals["total_ms"] += elapsed_ms
+            totals["max_ms"] = max(totals["max_ms"], elapsed_ms)
+
+    def summary(self) -> list[dict]:
+        """
+        Actions sorted by total wait time, slowest first.
+        """
+        return sorted(({"action": action, **totals} for action, totals in self.waits.items()),
+                      key=lambda entry: entry["total_ms"], reverse=True)
+
+    def finish(self):
+        if self.waits:
+            allure.attach(json.dumps(self.summary(), indent=2), name="Wait Times",
+                          attachment_type=allure.attachment_type.JSON)
+        self.waits.clear()
+
+
+_active_recorder: WaitRecorder | None = None
+
+
+def start_test() -> WaitRecorder:
+    global _active_recorder
+    _active_recorder = WaitRecorder()
+    return _active_recorder
+
+
+def get_recorder() -> WaitRecorder:
+    global _active_recorder
+    if _active_recorder is None:
+        _active_recorder = WaitRecorder()
+    return _active_recorder